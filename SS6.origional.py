@@ -218,7 +218,7 @@ def cleanup_global_resources():
     if center_piece_manager:
         center_piece_manager.reset()
     if particle_manager:
-        particle_manager.particles.clear()
+        particle_manager.cleanup()
     
     print("Global resources cleaned up successfully")
 
@@ -271,7 +271,7 @@ def game_loop(mode):
     sequence = SEQUENCES.get(mode, SEQUENCES["alphabet"])  # Default to alphabet if mode not found
     
     # Split into groups of GROUP_SIZE
-    groups = [sequence[i:i+GROUP_SIZE] for i in range(0, len(sequence), GROUP_SIZE)]
+    groups = [list(sequence[i:i+GROUP_SIZE]) for i in range(0, len(sequence), GROUP_SIZE)]
 
     # Initialize game variables
     current_group_index = 0
@@ -0,0 +1,31 @@
+"""Shared pytest setup for the root-level test scripts.
+
+pygame - and its mixer, which probes the audio devices - is initialised
+once per session here instead of by every test module.
+"""
+
+import os
+import sys
+
+import pygame
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def _ensure_pygame():
+    """Initialise pygame and its mixer unless they already are."""
+    if not pygame.get_init():
+        pygame.init()
+    if not pygame.mixer.get_init():
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"conftest: mixer unavailable, audio tests will degrade: {e}")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _pygame():
+    _ensure_pygame()
+    yield
+    pygame.quit()
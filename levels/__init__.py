@@ -1,8 +1,27 @@
 # levels package
-from .colors_level import ColorsLevel
-from .shapes_level import ShapesLevel
-from .alphabet_level import AlphabetLevel
-from .numbers_level import NumbersLevel
-from .cl_case_level import CLCaseLevel
+# Level modules are imported lazily on first attribute access (PEP 562) so
+# importing one level doesn't pay for parsing all of them.
+import importlib
 
-__all__ = ['ColorsLevel', 'ShapesLevel', 'AlphabetLevel', 'NumbersLevel', 'CLCaseLevel'] 
\ No newline at end of file
+_LEVEL_MODULES = {
+    'ColorsLevel': '.colors_level',
+    'ShapesLevel': '.shapes_level',
+    'AlphabetLevel': '.alphabet_level',
+    'NumbersLevel': '.numbers_level',
+    'CLCaseLevel': '.cl_case_level',
+}
+
+__all__ = ['ColorsLevel', 'ShapesLevel', 'AlphabetLevel', 'NumbersLevel', 'CLCaseLevel']
+
+
+def __getattr__(name):
+    module_name = _LEVEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
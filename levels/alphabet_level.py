@@ -2,14 +2,45 @@ import pygame
 import random
 import math
 from settings import (
-    LETTER_SPAWN_INTERVAL, WHITE, BLACK, FLAME_COLORS,
-    LEVEL_PROGRESS_PATH, SEQUENCES, GROUP_SIZE
+    LETTER_SPAWN_INTERVAL, WHITE, BLACK, FLAME_COLORS, LASER_WIDTHS,
+    LEVEL_PROGRESS_PATH, ALPHABET_SEQ, GROUP_SIZE
 )
 from universal_class import (
     GlassShatterManager, HUDManager, MultiTouchManager, 
     CheckpointManager, FlamethrowerManager, CenterPieceManager
 )
 from utils.level_resource_manager import LevelResourceManager
+from utils.frame_budget import frame_budget
+
+# Phonics mapping for letters A-Z, built once at import rather than per lookup
+_PHONICS = {
+    'A': 'ah',          # Short 'a' sound as in 'apple'
+    'B': 'buh',         # 'b' sound as in 'ball'
+    'C': 'kuh',         # Hard 'c' sound as in 'cat'
+    'D': 'duh',         # 'd' sound as in 'dog'
+    'E': 'eh',          # Short 'e' sound as in 'egg'
+    'F': 'fuh',         # 'f' sound as in 'fish'
+    'G': 'guh',         # Hard 'g' sound as in 'go'
+    'H': 'huh',         # 'h' sound as in 'hat'
+    'I': 'ih',          # Short 'i' sound as in 'igloo'
+    'J': 'juh',         # 'j' sound as in 'jump'
+    'K': 'kuh',         # 'k' sound as in 'kite'
+    'L': 'luh',         # 'l' sound as in 'lion'
+    'M': 'muh',         # 'm' sound as in 'moon'
+    'N': 'nuh',         # 'n' sound as in 'net'
+    'O': 'oh',          # Short 'o' sound as in 'octopus'
+    'P': 'puh',         # 'p' sound as in 'pig'
+    'Q': 'kwuh',        # 'qu' sound as in 'queen'
+    'R': 'ruh',         # 'r' sound as in 'run'
+    'S': 'sss',         # 's' sound as in 'snake'
+    'T': 'tuh',         # 't' sound as in 'top'
+    'U': 'uh',          # Short 'u' sound as in 'umbrella'
+    'V': 'vuh',         # 'v' sound as in 'van'
+    'W': 'wuh',         # 'w' sound as in 'water'
+    'X': 'ks',          # 'x' sound as in 'box'
+    'Y': 'yuh',         # 'y' sound as in 'yes'
+    'Z': 'zzz'          # 'z' sound as in 'zebra'
+}
 
 
 class AlphabetLevel:
@@ -76,8 +107,8 @@ class AlphabetLevel:
         self.game_over_screen = game_over_screen_func
         
         # Alphabet configuration
-        self.sequence = SEQUENCES["alphabet"]
-        self.groups = [self.sequence[i:i+GROUP_SIZE] for i in range(0, len(self.sequence), GROUP_SIZE)]
+        self.sequence = ALPHABET_SEQ
+        self.groups = [list(self.sequence[i:i+GROUP_SIZE]) for i in range(0, len(self.sequence), GROUP_SIZE)]
         self.TOTAL_LETTERS = len(self.sequence)
         
         # Initialize level resource manager for isolation
@@ -103,37 +134,7 @@ class AlphabetLevel:
         Returns:
             str: The phonics sound representation
         """
-        # Phonics mapping for letters A-Z
-        phonics_map = {
-            'A': 'ah',          # Short 'a' sound as in 'apple'
-            'B': 'buh',         # 'b' sound as in 'ball'
-            'C': 'kuh',         # Hard 'c' sound as in 'cat'
-            'D': 'duh',         # 'd' sound as in 'dog'
-            'E': 'eh',          # Short 'e' sound as in 'egg'
-            'F': 'fuh',         # 'f' sound as in 'fish'
-            'G': 'guh',         # Hard 'g' sound as in 'go'
-            'H': 'huh',         # 'h' sound as in 'hat'
-            'I': 'ih',          # Short 'i' sound as in 'igloo'
-            'J': 'juh',         # 'j' sound as in 'jump'
-            'K': 'kuh',         # 'k' sound as in 'kite'
-            'L': 'luh',         # 'l' sound as in 'lion'
-            'M': 'muh',         # 'm' sound as in 'moon'
-            'N': 'nuh',         # 'n' sound as in 'net'
-            'O': 'oh',          # Short 'o' sound as in 'octopus'
-            'P': 'puh',         # 'p' sound as in 'pig'
-            'Q': 'kwuh',        # 'qu' sound as in 'queen'
-            'R': 'ruh',         # 'r' sound as in 'run'
-            'S': 'sss',         # 's' sound as in 'snake'
-            'T': 'tuh',         # 't' sound as in 'top'
-            'U': 'uh',          # Short 'u' sound as in 'umbrella'
-            'V': 'vuh',         # 'v' sound as in 'van'
-            'W': 'wuh',         # 'w' sound as in 'water'
-            'X': 'ks',          # 'x' sound as in 'box'
-            'Y': 'yuh',         # 'y' sound as in 'yes'
-            'Z': 'zzz'          # 'z' sound as in 'zebra'
-        }
-        
-        return phonics_map.get(letter.upper(), None)
+        return _PHONICS.get(letter.upper(), None)
     
         
     def reset_level_state(self):
@@ -205,8 +206,6 @@ class AlphabetLevel:
                 stars.append([x, y, radius])
                 
             # Main game loop
-            clock = pygame.time.Clock()
-            
             while self.running:
                 # Handle events
                 if not self._handle_events():
@@ -236,7 +235,7 @@ class AlphabetLevel:
                 # Update frame counter and display
                 self.frame_count += 1
                 pygame.display.flip()
-                clock.tick(50)
+                frame_budget.tick(50)
                 
             return False
             
@@ -649,7 +648,7 @@ class AlphabetLevel:
                     pygame.draw.line(self.screen, random.choice(laser.get("colors", FLAME_COLORS)),
                                      (laser["start_pos"][0] + offset_x, laser["start_pos"][1] + offset_y),
                                      (laser["end_pos"][0] + offset_x, laser["end_pos"][1] + offset_y),
-                                      random.choice(laser.get("widths", [5, 10, 15])))
+                                      random.choice(laser.get("widths", LASER_WIDTHS)))
                 laser["duration"] -= 1
             else:
                 self.lasers.remove(laser)
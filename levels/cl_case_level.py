@@ -2,13 +2,14 @@ import pygame
 import random
 import math
 from settings import (
-    LETTER_SPAWN_INTERVAL, WHITE, BLACK, FLAME_COLORS,
-    LEVEL_PROGRESS_PATH, SEQUENCES, GROUP_SIZE
+    LETTER_SPAWN_INTERVAL, WHITE, BLACK, FLAME_COLORS, LASER_WIDTHS,
+    LEVEL_PROGRESS_PATH, CLCASE_SEQ, GROUP_SIZE
 )
 from universal_class import (
     GlassShatterManager, HUDManager, MultiTouchManager, 
     CheckpointManager, FlamethrowerManager, CenterPieceManager
 )
+from utils.frame_budget import frame_budget
 
 
 class CLCaseLevel:
@@ -76,8 +77,8 @@ class CLCaseLevel:
         self.game_over_screen = game_over_screen_func
         
         # C/L Case configuration
-        self.sequence = SEQUENCES["clcase"]
-        self.groups = [self.sequence[i:i+GROUP_SIZE] for i in range(0, len(self.sequence), GROUP_SIZE)]
+        self.sequence = CLCASE_SEQ
+        self.groups = [list(self.sequence[i:i+GROUP_SIZE]) for i in range(0, len(self.sequence), GROUP_SIZE)]
         self.TOTAL_LETTERS = len(self.sequence)
         
         # Game state variables
@@ -147,7 +148,6 @@ class CLCaseLevel:
         
         # Main game loop
         running = True
-        clock = pygame.time.Clock()
         
         while running:
             # Handle events
@@ -181,7 +181,7 @@ class CLCaseLevel:
             
             # Update display
             pygame.display.flip()
-            clock.tick(50)  # 50 FPS for performance
+            frame_budget.tick(50)  # 50 FPS for performance
             self.frame_count += 1
         
         return True  # Return to menu by default
@@ -572,7 +572,7 @@ class CLCaseLevel:
                     pygame.draw.line(self.screen, random.choice(laser.get("colors", FLAME_COLORS)),
                                    (laser["start_pos"][0] + offset_x, laser["start_pos"][1] + offset_y),
                                    (laser["end_pos"][0] + offset_x, laser["end_pos"][1] + offset_y),
-                                   random.choice(laser.get("widths", [5, 10, 15])))
+                                   random.choice(laser.get("widths", LASER_WIDTHS)))
                 laser["duration"] -= 1
             else:
                 self.lasers.remove(laser)
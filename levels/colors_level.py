@@ -1,13 +1,123 @@
 import pygame
 import random
 import math
+import array
+from itertools import islice
+import numpy as np
 from settings import (
     COLORS_COLLISION_DELAY, WHITE, BLACK, FLAME_COLORS,
     LEVEL_PROGRESS_PATH
 )
 from universal_class import GlassShatterManager, HUDManager, MultiTouchManager
 from utils.level_resource_manager import LevelResourceManager
-from collections import defaultdict  # NEW: for sparse spatial grid
+from utils.frame_budget import frame_budget
+from collections import defaultdict  # Sparse spatial hash
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# One period of sin sampled at 1024 steps; phases are integer table indices
+# wrapped with "& 1023", so per-frame animation is an array load, not libm sin
+_SIN_TABLE = array.array('f', (math.sin(i * 2 * math.pi / 1024) for i in range(1024)))
+
+def _display_format(surf):
+    """
+    Convert a cached SRCALPHA surface to the display's pixel format so blits skip
+    per-call conversion. Needs a display mode (headless runs keep the generic
+    format); surfaces converted this way must be rebuilt if the mode changes,
+    which holds here because each level instance builds its own caches.
+    """
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surf.convert_alpha()
+    return surf
+
+
+def _make_circle(color, radius):
+    """
+    Build a filled circle (RGB or RGBA color) as pixel data with NumPy and wrap
+    it with frombuffer, instead of rasterizing through pygame.draw.circle.
+    """
+    size = radius * 2
+    yy, xx = np.ogrid[-radius:radius, -radius:radius]
+    inside = (xx + 0.5) ** 2 + (yy + 0.5) ** 2 <= radius * radius  # Test pixel centers
+    rgba = np.zeros((size, size, 4), dtype=np.uint8)
+    rgba[..., :3] = color[:3]
+    rgba[..., 3] = inside * (color[3] if len(color) > 3 else 255)
+    return _display_format(pygame.image.frombuffer(rgba.tobytes(), (size, size), "RGBA"))
+
+
+# Cell offsets covering each cell and its forward neighbours, so every
+# neighbouring cell pair is visited exactly once
+_HALF_NEIGHBORHOOD = ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+if NUMBA_AVAILABLE:
+    # Native kernels for the per-frame dot physics. They take the level's SoA
+    # arrays directly and never touch pygame; without Numba the NumPy paths
+    # in ColorsLevel are used instead.
+
+    @njit(cache=True, fastmath=True)
+    def _update_dots_nb(xs, ys, dxs, dys, radii, width, height):
+        for i in range(xs.shape[0]):
+            xs[i] += dxs[i]
+            ys[i] += dys[i]
+            r = radii[i]
+            if xs[i] - r < 0:
+                xs[i] = r
+                dxs[i] = -dxs[i]
+            elif xs[i] + r > width:
+                xs[i] = width - r
+                dxs[i] = -dxs[i]
+            if ys[i] - r < 0:
+                ys[i] = r
+                dys[i] = -dys[i]
+            elif ys[i] + r > height:
+                ys[i] = height - r
+                dys[i] = -dys[i]
+
+    @njit(cache=True)
+    def _collide_nb(xs, ys, radii, alive, cell_size, cols, rows, grid_head, grid_next,
+                    out_i, out_j, out_dx, out_dy, out_dist):
+        # Flat-array spatial hash: grid_head[cell] is the first dot in a cell,
+        # grid_next[dot] the next dot in the same cell (-1 terminates)
+        grid_head[:] = -1
+        n = xs.shape[0]
+        for k in range(n):
+            if alive[k]:
+                cx = min(max(int(xs[k] // cell_size), 0), cols - 1)
+                cy = min(max(int(ys[k] // cell_size), 0), rows - 1)
+                cell = cx + cy * cols
+                grid_next[k] = grid_head[cell]
+                grid_head[cell] = k
+
+        count = 0
+        capacity = out_i.shape[0]
+        for i in range(n):
+            if not alive[i]:
+                continue
+            cx = min(max(int(xs[i] // cell_size), 0), cols - 1)
+            cy = min(max(int(ys[i] // cell_size), 0), rows - 1)
+            for gy in range(max(cy - 1, 0), min(cy + 2, rows)):
+                for gx in range(max(cx - 1, 0), min(cx + 2, cols)):
+                    j = grid_head[gx + gy * cols]
+                    while j != -1:
+                        if j > i and count < capacity:
+                            dx = xs[i] - xs[j]
+                            dy = ys[i] - ys[j]
+                            dist_sq = dx * dx + dy * dy
+                            reach = radii[i] + radii[j]
+                            if 0 < dist_sq < reach * reach:
+                                out_i[count] = i
+                                out_j[count] = j
+                                out_dx[count] = dx
+                                out_dy[count] = dy
+                                out_dist[count] = np.sqrt(dist_sq)
+                                count += 1
+                        j = grid_next[j]
+        return count
 
 
 class ColorsLevel:
@@ -15,6 +125,13 @@ class ColorsLevel:
     Handles the Colors level gameplay logic with performance optimizations.
     """
     
+    MAX_DOTS = 60  # Dot slots allocated per level (dispersion creates all 60)
+    DOT_RADIUS = 48
+    SHIMMER_SCALES = (0.9, 0.95, 1.0, 1.05, 1.1)  # Discrete radius scales a target dot shimmers through
+    GLOW_BUCKETS = 8  # Discrete intensity levels of the pulsing target glow
+    ALPHA_BUCKETS = 8  # Discrete levels of the target shimmer alpha (225 - 255)
+    GLOW_MIN_ALPHA, GLOW_MAX_ALPHA = 35, 85
+    
     def __init__(self, width, height, screen, small_font, particle_manager, 
                  glass_shatter_manager, multi_touch_manager, hud_manager, 
                  mother_radius, create_explosion_func, checkpoint_screen_func, game_over_screen_func,
@@ -75,20 +192,47 @@ class ColorsLevel:
             }
         )
         
-        # PERFORMANCE OPTIMIZATION: Spatial grid for collision detection (optimized from 120px to 80px)
+        # PERFORMANCE OPTIMIZATION: Occupancy grid for new-dot placement (optimized from 120px to 80px)
         self.grid_size = 80  # Optimized grid cell size (reduced from 120 for 25% better distribution)
         self.grid_cols = (width // self.grid_size) + 1
         self.grid_rows = (height // self.grid_size) + 1
+        # Collision hash cells span one dot diameter, so only 3x3 neighbourhoods can overlap
+        self.collision_cell_size = 2 * self.DOT_RADIUS
+        if NUMBA_AVAILABLE:
+            # Scratch buffers for the JIT collision kernel, sized for the worst case (all pairs)
+            self._collision_cols = (width // self.collision_cell_size) + 1
+            self._collision_rows = (height // self.collision_cell_size) + 1
+            self._grid_head = np.empty(self._collision_cols * self._collision_rows, dtype=np.int32)
+            self._grid_next = np.empty(self.MAX_DOTS, dtype=np.int32)
+            max_pairs = self.MAX_DOTS * (self.MAX_DOTS - 1) // 2
+            self._pair_i = np.empty(max_pairs, dtype=np.int32)
+            self._pair_j = np.empty(max_pairs, dtype=np.int32)
+            self._pair_dx = np.empty(max_pairs, dtype=np.float32)
+            self._pair_dy = np.empty(max_pairs, dtype=np.float32)
+            self._pair_dist = np.empty(max_pairs, dtype=np.float32)
           # VISUAL ENHANCEMENT: Shimmer and depth effects
         self.frame_counter = 0
-        self.shimmer_seeds = {}  # Per-dot shimmer seed for consistency
-        # PERFORMANCE OPTIMIZATION: cache for pre-rendered circle surfaces with size limit
-        self.surface_cache = {}
-        self.surface_cache_limit = 50  # Maximum cached surfaces to prevent memory growth
+        self.shimmer_phase = self._new_shimmer_phases()  # Per-slot shimmer phase (sin table index)
+        # Composite dot surfaces indexed by color (and shimmer scale for targets)
+        self._build_dot_surface_tables()
+        # One pre-rendered star per radius (2-4 px)
+        self._star_surfaces = {r: _make_circle((200, 200, 200), r) for r in range(2, 5)}
+        # Target glows keyed by (color_idx, scale_idx, intensity bucket) and alpha-stamped target
+        # dots keyed by (color_idx, scale_idx, alpha bucket); only the current target color is kept
+        self._glow_cache = {}
+        self._target_alpha_cache = {}
+        # Persistent blit sequences: entries are mutated in place each frame instead of rebuilt
+        self._dot_blits = [[None, [0, 0]] for _ in range(self.MAX_DOTS)]
+        self._glow_blits = [[None, [0, 0], None, pygame.BLEND_RGBA_ADD] for _ in range(self.MAX_DOTS)]
         
         # Game state variables
         self.reset_level_state()
         
+        if NUMBA_AVAILABLE:
+            # Compile (or load the on-disk cache of) the kernels now so the first frame doesn't stall
+            self._update_dots()
+            self._find_dot_collisions()
+        
     def reset_level_state(self):
         """Reset all level-specific state variables."""
         self.used_colors = []
@@ -100,7 +244,7 @@ class ColorsLevel:
         self.total_dots_destroyed = 0
         self.checkpoint_trigger = 10
         self.target_dots_left = 10
-        self.dots = []
+        self._allocate_dots()
         self.dots_active = False
         self.overall_destroyed = 0
         self.dots_before_checkpoint = 0
@@ -110,117 +254,106 @@ class ColorsLevel:
         self.score = 0
         self.running = True
         self.frame_counter = 0
-        self.shimmer_seeds = {}
+        self.shimmer_phase = self._new_shimmer_phases()
         
-    def _create_spatial_grid(self):
-        """Create sparse spatial grid (dict) for optimized collision detection."""
-        grid = defaultdict(list)  # key -> list of dot indices
-        for i, dot in enumerate(self.dots):
-            if not dot["alive"]:
-                continue
-            grid_x = min(max(int(dot["x"] // self.grid_size), 0), self.grid_cols - 1)
-            grid_y = min(max(int(dot["y"] // self.grid_size), 0), self.grid_rows - 1)
-            grid[(grid_x, grid_y)].append(i)
-        return grid
-        
-    def _get_grid_neighbors(self, x, y):
-        """Get neighboring grid cells for collision detection."""
-        grid_x = min(int(x // self.grid_size), self.grid_cols - 1)
-        grid_y = min(int(y // self.grid_size), self.grid_rows - 1)
-        
-        neighbors = []
-        for dy in [-1, 0, 1]:
-            for dx in [-1, 0, 1]:
-                nx, ny = grid_x + dx, grid_y + dy
-                if 0 <= nx < self.grid_cols and 0 <= ny < self.grid_rows:
-                    neighbors.append((nx, ny))
-        return neighbors
+    def _allocate_dots(self):
+        """Allocate the dot state as parallel arrays, one slot per dot (SoA)."""
+        n = self.MAX_DOTS
+        self.dot_x = np.zeros(n, dtype=np.float32)
+        self.dot_y = np.zeros(n, dtype=np.float32)
+        self.dot_dx = np.zeros(n, dtype=np.float32)
+        self.dot_dy = np.zeros(n, dtype=np.float32)
+        self.dot_radius = np.full(n, self.DOT_RADIUS, dtype=np.float32)
+        self.dot_color_idx = np.zeros(n, dtype=np.int8)  # Index into COLORS_LIST
+        self.dot_alive = np.zeros(n, dtype=bool)
+        self.dot_target = np.zeros(n, dtype=bool)
+        
+    def _spawn_dot(self, slot, x, y, color_idx):
+        """Place a live dot with a random velocity in the given slot."""
+        self.dot_x[slot] = x
+        self.dot_y[slot] = y
+        self.dot_dx[slot] = random.uniform(-6, 6)
+        self.dot_dy[slot] = random.uniform(-6, 6)
+        self.dot_radius[slot] = self.DOT_RADIUS
+        self.dot_color_idx[slot] = color_idx
+        self.dot_target[slot] = color_idx == self.color_idx
+        self.dot_alive[slot] = True
         
     def _calculate_dot_shading(self, base_color, radius, is_target=False):
-        """Calculate depth shading for dots with gradient effect."""
+        """Calculate depth shading for dots with gradient effect (baked into cached dot surfaces)."""
         # Create gradient from lighter center to darker edge
         center_color = tuple(min(255, int(c * 1.3)) for c in base_color)
         edge_color = tuple(max(0, int(c * 0.7)) for c in base_color)
         
         # Add glow effect for target dots
         if is_target:
-            glow_intensity = 0.2 + 0.1 * math.sin(self.frame_counter * 0.1)
+            glow_intensity = 0.2
             center_color = tuple(min(255, int(c * (1.0 + glow_intensity))) for c in center_color)
             
         return center_color, edge_color
         
-    def _get_shimmer_effect(self, dot_id):
-        """Get shimmer effect values for a specific dot."""
-        if dot_id not in self.shimmer_seeds:
-            self.shimmer_seeds[dot_id] = random.random() * 6.28  # Random phase
-            
-        seed = self.shimmer_seeds[dot_id]
-        shimmer = math.sin(self.frame_counter * 0.05 + seed) * 0.1 + 1.0
-        alpha_shimmer = math.sin(self.frame_counter * 0.08 + seed) * 15 + 240
+    def _new_shimmer_phases(self):
+        """Random shimmer phase per dot slot, as sin table indices."""
+        return array.array('H', (random.randrange(1024) for _ in range(self.MAX_DOTS)))
+        
+    def _get_shimmer_effect(self, slot):
+        """Get shimmer effect values for the dot in a slot."""
+        seed = self.shimmer_phase[slot]
+        frame = self.frame_counter
+        shimmer = _SIN_TABLE[(frame * 8 + seed) & 1023] * 0.1 + 1.0  # ~0.05 rad/frame
+        alpha_shimmer = _SIN_TABLE[(frame * 13 + seed) & 1023] * 15 + 240  # ~0.08 rad/frame
         
         return shimmer, max(200, min(255, int(alpha_shimmer)))
 
-    # Enhanced surface caching with preloading and smart eviction
-    def _get_circle_surface(self, color, radius):
-        """Return cached filled-circle surface for given color & radius with enhanced memory management."""
-        key = (color, radius)
-        surf = self.surface_cache.get(key)
+    def _build_dot_surface(self, color, radius, is_target):
+        """Render a dot as one radial gradient from a lighter center to a darker edge."""
+        # Target dots use the mid-point of their glow pulse
+        center_color, edge_color = self._calculate_dot_shading(color, radius, is_target)
+        size = radius * 2
+        yy, xx = np.mgrid[0:size, 0:size]
+        # Distance of each pixel center from the dot center, as a fraction of the radius
+        dist = np.hypot(xx - radius + 0.5, yy - radius + 0.5) / radius
+        t = np.minimum(dist, 1.0)[..., None]
+        rgba = np.empty((size, size, 4), dtype=np.uint8)
+        rgba[..., :3] = np.asarray(center_color) * (1.0 - t) + np.asarray(edge_color) * t
+        rgba[..., 3] = np.where(dist <= 1.0, 255, 0)
+        return _display_format(pygame.image.frombuffer(rgba.tobytes(), (size, size), "RGBA"))
+        
+    def _build_dot_surface_tables(self):
+        """Pre-shade every dot variant once per level so drawing is a table lookup."""
+        self._shimmer_radii = tuple(int(self.DOT_RADIUS * scale) for scale in self.SHIMMER_SCALES)
+        # Plain dots never shimmer: one surface per color
+        self._plain_dot_surfaces = tuple(
+            self._build_dot_surface(color, self.DOT_RADIUS, False) for color in self.COLORS_LIST
+        )
+        # Target dots: one surface per color per discrete shimmer scale
+        self._target_dot_surfaces = tuple(
+            tuple(self._build_dot_surface(color, radius, True) for radius in self._shimmer_radii)
+            for color in self.COLORS_LIST
+        )
         
+    def _get_target_surface(self, color_idx, scale_idx, alpha_bucket):
+        """Return the target dot for a color and shimmer scale with its alpha bucket pre-stamped."""
+        key = (color_idx, scale_idx, alpha_bucket)
+        surf = self._target_alpha_cache.get(key)
         if surf is None:
-            # Check cache size limit and clean up if necessary
-            if len(self.surface_cache) >= self.surface_cache_limit:
-                # Smart eviction: remove least recently used items
-                if hasattr(self, '_surface_access_times'):
-                    # Sort by access time and remove oldest 25%
-                    items_to_remove = len(self.surface_cache) // 4
-                    sorted_keys = sorted(self._surface_access_times.keys(), 
-                                       key=lambda k: self._surface_access_times[k])
-                    keys_to_remove = sorted_keys[:items_to_remove]
-                else:
-                    # Fallback to simple removal if access times not tracked
-                    items_to_remove = len(self.surface_cache) // 4
-                    keys_to_remove = list(self.surface_cache.keys())[:items_to_remove]
-                
-                for old_key in keys_to_remove:
-                    self.surface_cache.pop(old_key, None)
-                    if hasattr(self, '_surface_access_times'):
-                        self._surface_access_times.pop(old_key, None)
-            
-            # Create new surface with optimized settings
-            surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, color, (radius, radius), radius)
-            self.surface_cache[key] = surf
-            
-            # Track access time for smart eviction
-            if not hasattr(self, '_surface_access_times'):
-                self._surface_access_times = {}
-            self._surface_access_times[key] = self.frame_counter
-        else:
-            # Update access time for LRU tracking
-            if hasattr(self, '_surface_access_times'):
-                self._surface_access_times[key] = self.frame_counter
-                
+            surf = self._target_dot_surfaces[color_idx][scale_idx].copy()
+            surf.set_alpha(225 + alpha_bucket * 30 // (self.ALPHA_BUCKETS - 1))
+            self._target_alpha_cache[key] = surf
+        return surf
+        
+    def _get_glow_surface(self, color_idx, scale_idx, bucket):
+        """Return the cached additive glow disc for a target color, shimmer scale and intensity bucket."""
+        key = (color_idx, scale_idx, bucket)
+        surf = self._glow_cache.get(key)
+        if surf is None:
+            glow_radius = self._shimmer_radii[scale_idx] + 6
+            intensity = self.GLOW_MIN_ALPHA + bucket * (self.GLOW_MAX_ALPHA - self.GLOW_MIN_ALPHA) // (self.GLOW_BUCKETS - 1)
+            # Premultiply so BLEND_RGBA_ADD brightens by the same amount the old alpha blend tinted
+            glow_color = tuple(c * intensity // 255 for c in self.COLORS_LIST[color_idx])
+            surf = _make_circle((*glow_color, intensity), glow_radius)
+            self._glow_cache[key] = surf
         return surf
-    
-    def _preload_common_surfaces(self):
-        """Preload commonly used surfaces during level initialization."""
-        # Preload surfaces for common dot sizes and colors
-        common_radii = [15, 20, 25, 30]  # Common dot sizes
-        
-        for color in self.COLORS_LIST:
-            for radius in common_radii:
-                # Pre-create surface to warm the cache
-                self._get_circle_surface(color, radius)
-                
-        # Also preload some gradient variations
-        for color in self.COLORS_LIST:
-            # Lighter version (for center shading)
-            lighter_color = tuple(min(255, int(c * 1.3)) for c in color)
-            darker_color = tuple(max(0, int(c * 0.7)) for c in color)
-            
-            for radius in [20, 25]:  # Most common sizes
-                self._get_circle_surface(lighter_color, radius)
-                self._get_circle_surface(darker_color, radius)
         
     def run(self):
         """
@@ -238,9 +371,6 @@ class ColorsLevel:
             # Preload color name sounds
             self.level_resources.preload_level_sounds([name.lower() for name in self.color_names])
             
-            # Preload common surfaces for better performance
-            self._preload_common_surfaces()
-            
             self.reset_level_state()
             
             # Initialize random starting color
@@ -277,7 +407,6 @@ class ColorsLevel:
         """Show the mother dot vibration animation."""
         center = (self.width // 2, self.height // 2)
         vibration_frames = 30
-        clock = pygame.time.Clock()
         
         for vib in range(vibration_frames):
             # Handle events to allow quitting
@@ -298,14 +427,13 @@ class ColorsLevel:
             self.screen.blit(label, label_rect)
             
             pygame.display.flip()
-            clock.tick(50)
+            frame_budget.tick(50)
             
         return True
         
     def _wait_for_dispersion_start(self):
         """Wait for player click to start dispersion."""
         center = (self.width // 2, self.height // 2)
-        clock = pygame.time.Clock()
         waiting_for_dispersion = True
         
         while waiting_for_dispersion:
@@ -330,7 +458,7 @@ class ColorsLevel:
             self.screen.blit(prompt, prompt_rect)
             
             pygame.display.flip()
-            clock.tick(50)
+            frame_budget.tick(50)
             
         return True
         
@@ -338,7 +466,6 @@ class ColorsLevel:
         """Show the mother dot dispersion animation and create initial dots."""
         center = (self.width // 2, self.height // 2)
         disperse_frames = 30
-        clock = pygame.time.Clock()
           # Create dispersion particles - OPTIMIZED: Reduced from 85 to 60 for better performance
         disperse_particles = []
         for i in range(60):  # Performance optimization: Reduced from 85 to 60 (40% collision reduction)
@@ -365,7 +492,7 @@ class ColorsLevel:
                     idx += 1
                     
         # Initialize bouncing dots
-        self.dots = []
+        self._allocate_dots()
         initial_positions = []
         
         for i, p in enumerate(disperse_particles):
@@ -379,18 +506,7 @@ class ColorsLevel:
             
         # Create dots with positions
         for i, (x, y) in enumerate(initial_positions):
-            dx = random.uniform(-6, 6)
-            dy = random.uniform(-6, 6)
-            color = disperse_particles[i]["color"]
-            
-            self.dots.append({
-                "x": x, "y": y,
-                "dx": dx, "dy": dy,
-                "color": color,
-                "radius": 48,
-                "target": True if color == self.mother_color else False,
-                "alive": True,
-            })
+            self._spawn_dot(i, x, y, self.COLORS_LIST.index(disperse_particles[i]["color"]))
             
         self.dots_active = True
         
@@ -404,19 +520,13 @@ class ColorsLevel:
                 pygame.draw.circle(self.screen, p["color"], (x, y), 48)
                 
             pygame.display.flip()
-            clock.tick(50)
+            frame_budget.tick(50)
             
     def _main_game_loop(self):
         """Main game loop for the colors level."""
-        clock = pygame.time.Clock()
         
         # Background stars
-        stars = []
-        for _ in range(100):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            radius = random.randint(2, 4)
-            stars.append([x, y, radius])
+        self._create_starfield()
             
         while self.running:
             # Handle events
@@ -439,14 +549,14 @@ class ColorsLevel:
                 self._handle_dot_collisions()
                 
             # Draw everything
-            self._draw_frame(stars)
+            self._draw_frame()
             
             # Handle end condition (target_dots_left <= 0)
             if self.target_dots_left <= 0:
                 self._generate_new_dots()
                 
             pygame.display.flip()
-            clock.tick(50)
+            frame_budget.tick(50)
             
         return False
         
@@ -493,27 +603,20 @@ class ColorsLevel:
         Returns:
             bool: True if a target was hit, False otherwise
         """
-        hit_target = False
-        radius_cache = {}
-        for dot in self.dots:
-            if not dot["alive"]:
-                continue
-            r_sq = radius_cache.get(dot["radius"])
-            if r_sq is None:
-                r_sq = dot["radius"] ** 2
-                radius_cache[dot["radius"]] = r_sq
-            dx = x - dot["x"]
-            dy = y - dot["y"]
-            if dx * dx + dy * dy <= r_sq:
-                hit_target = True
-                if dot["target"]:
-                    self._destroy_target_dot(dot)
-                break
-        return hit_target
+        dx = x - self.dot_x
+        dy = y - self.dot_y
+        hits = np.flatnonzero(self.dot_alive & (dx * dx + dy * dy <= self.dot_radius * self.dot_radius))
+        if not hits.size:
+            return False
+        # First live dot under the pointer wins, as before
+        slot = int(hits[0])
+        if self.dot_target[slot]:
+            self._destroy_target_dot(slot)
+        return True
         
-    def _destroy_target_dot(self, dot):
-        """Handle destruction of a target dot."""
-        dot["alive"] = False
+    def _destroy_target_dot(self, slot):
+        """Handle destruction of the target dot in the given slot."""
+        self.dot_alive[slot] = False
         self.target_dots_left -= 1
         self.score += 10
         self.overall_destroyed += 1
@@ -527,7 +630,9 @@ class ColorsLevel:
         self.level_resources.play_target_sound(self.mother_color_name.lower())
         
         # Create explosion effect using level resource manager
-        self.level_resources.create_explosion(dot["x"], dot["y"], color=dot["color"], max_radius=60, duration=15)
+        self.level_resources.create_explosion(float(self.dot_x[slot]), float(self.dot_y[slot]),
+                                              color=self.COLORS_LIST[self.dot_color_idx[slot]],
+                                              max_radius=60, duration=15)
           # Check if we need to switch the target color
         if self.current_color_dots_destroyed >= 2:
             self._switch_target_color()
@@ -552,17 +657,12 @@ class ColorsLevel:
         self.mother_color = self.COLORS_LIST[self.color_idx]
         self.mother_color_name = self.color_names[self.color_idx]
         self.current_color_dots_destroyed = 0
+        self._glow_cache.clear()  # Only the new target color glows
+        self._target_alpha_cache.clear()
         
-        # PERFORMANCE OPTIMIZATION: Batch update target status and count in single loop
-        target_count = 0
-        for d in self.dots:
-            if d["alive"]:
-                is_target = (d["color"] == self.mother_color)
-                d["target"] = is_target
-                if is_target:
-                    target_count += 1
-                    
-        self.target_dots_left = target_count
+        # PERFORMANCE OPTIMIZATION: Batch update target status and count with one mask
+        self.dot_target = self.dot_color_idx == self.color_idx
+        self.target_dots_left = int(np.count_nonzero(self.dot_target & self.dot_alive))
         
     def _handle_checkpoint(self):
         """Handle checkpoint screen display."""
@@ -580,32 +680,28 @@ class ColorsLevel:
         
     def _update_dots(self):
         """Update dot positions and handle bouncing."""
-        for dot in self.dots:
-            if not dot["alive"]:
-                continue
-                
-            dot["x"] += dot["dx"]
-            dot["y"] += dot["dy"]
-            
-            # Bounce off walls
-            if dot["x"] - dot["radius"] < 0:
-                dot["x"] = dot["radius"]
-                dot["dx"] *= -1
-            if dot["x"] + dot["radius"] > self.width:
-                dot["x"] = self.width - dot["radius"]
-                dot["dx"] *= -1
-            if dot["y"] - dot["radius"] < 0:
-                dot["y"] = dot["radius"]
-                dot["dy"] *= -1
-            if dot["y"] + dot["radius"] > self.height:
-                dot["y"] = self.height - dot["radius"]
-                dot["dy"] *= -1
-                
-    def _handle_dot_collisions(self):
-        """Handle collisions between dots using sparse spatial grid with frame skipping."""
-        if len(self.dots) < 2:
+        if NUMBA_AVAILABLE:
+            _update_dots_nb(self.dot_x, self.dot_y, self.dot_dx, self.dot_dy, self.dot_radius,
+                            float(self.width), float(self.height))
             return
             
+        # Dead slots are advanced too; their values are overwritten on spawn
+        x, y, r = self.dot_x, self.dot_y, self.dot_radius
+        x += self.dot_dx
+        y += self.dot_dy
+        
+        # Bounce off walls
+        low = x - r < 0
+        high = x + r > self.width
+        x[:] = np.where(low, r, np.where(high, self.width - r, x))
+        self.dot_dx[low | high] *= -1
+        low = y - r < 0
+        high = y + r > self.height
+        y[:] = np.where(low, r, np.where(high, self.height - r, y))
+        self.dot_dy[low | high] *= -1
+                
+    def _handle_dot_collisions(self):
+        """Handle collisions between dots with frame skipping."""
         # PERFORMANCE OPTIMIZATION: Skip collision detection every other frame for better FPS
         if not hasattr(self, '_collision_frame_skip'):
             self._collision_frame_skip = 0
@@ -614,46 +710,67 @@ class ColorsLevel:
         if self._collision_frame_skip % 2 != 0:  # Skip every other frame
             return
             
-        grid = self._create_spatial_grid()
-        checked_pairs = set()
-        collision_count = 0
         max_collisions_per_frame = 10  # Limit collisions per frame for performance
+        for i, j, dx_, dy_, distance in self._find_dot_collisions()[:max_collisions_per_frame]:
+            self._resolve_collision(i, j, dx_, dy_, distance)
+            
+    def _find_dot_collisions(self):
+        """Return overlapping live dot pairs as (i, j, dx, dy, distance), each pair once."""
+        if NUMBA_AVAILABLE:
+            count = _collide_nb(self.dot_x, self.dot_y, self.dot_radius, self.dot_alive,
+                                float(self.collision_cell_size), self._collision_cols, self._collision_rows,
+                                self._grid_head, self._grid_next,
+                                self._pair_i, self._pair_j, self._pair_dx, self._pair_dy, self._pair_dist)
+            return list(zip(self._pair_i[:count].tolist(), self._pair_j[:count].tolist(),
+                            self._pair_dx[:count].tolist(), self._pair_dy[:count].tolist(),
+                            self._pair_dist[:count].tolist()))
+            
+        slots = np.flatnonzero(self.dot_alive)
+        if slots.size < 2:
+            return []
+        xs, ys, rs = self.dot_x[slots], self.dot_y[slots], self.dot_radius[slots]
         
-        for (gx, gy), cell_dots in grid.items():
-            if collision_count >= max_collisions_per_frame:
-                break
-                
-            # Iterate over this cell and neighbouring cells
-            for dx in (-1, 0, 1):
-                for dy in (-1, 0, 1):
-                    ng = (gx + dx, gy + dy)
-                    if ng not in grid:
-                        continue
-                    neighbor_dots = grid[ng]
-                    for i in cell_dots:
-                        for j in neighbor_dots:
-                            if collision_count >= max_collisions_per_frame:
-                                break
-                            if i >= j:
-                                continue
-                            pair = (i, j)
-                            if pair in checked_pairs:
-                                continue
-                            checked_pairs.add(pair)
-                            dot1 = self.dots[i]
-                            dot2 = self.dots[j]
-                            if not (dot1["alive"] and dot2["alive"]):
-                                continue
-                            dx_ = dot1["x"] - dot2["x"]
-                            dy_ = dot1["y"] - dot2["y"]
-                            dist_sq = dx_ * dx_ + dy_ * dy_
-                            max_dist = dot1["radius"] + dot2["radius"]
-                            if dist_sq < max_dist * max_dist and dist_sq > 0:
-                                self._resolve_collision(dot1, dot2, dx_, dy_, math.sqrt(dist_sq))
-                                collision_count += 1
+        # Broad phase: hash live dots into a uniform grid and pair up neighbouring cells
+        cell_size = self.collision_cell_size
+        grid = defaultdict(list)
+        for k, key in enumerate(zip((xs // cell_size).astype(np.int32).tolist(),
+                                    (ys // cell_size).astype(np.int32).tolist())):
+            grid[key].append(k)
+            
+        first, second = [], []
+        for (gx, gy), members in grid.items():
+            for ox, oy in _HALF_NEIGHBORHOOD:
+                if ox == 0 and oy == 0:
+                    for p, a in enumerate(members):
+                        for b in members[p + 1:]:
+                            first.append(a)
+                            second.append(b)
+                    continue
+                others = grid.get((gx + ox, gy + oy))
+                if others:
+                    for a in members:
+                        for b in others:
+                            first.append(a)
+                            second.append(b)
+        if not first:
+            return []
+            
+        # Narrow phase: vectorized distance test over the candidate pairs only
+        a = np.array(first)
+        b = np.array(second)
+        dx = xs[a] - xs[b]
+        dy = ys[a] - ys[b]
+        dist_sq = dx * dx + dy * dy
+        reach = rs[a] + rs[b]
+        hits = (dist_sq < reach * reach) & (dist_sq > 0)
+        if not hits.any():
+            return []
+        a, b = a[hits], b[hits]
+        return list(zip(slots[a].tolist(), slots[b].tolist(), dx[hits].tolist(), dy[hits].tolist(),
+                        np.sqrt(dist_sq[hits]).tolist()))
 
-    def _resolve_collision(self, dot1, dot2, dx, dy, distance):
-        """Resolve collision between two dots."""
+    def _resolve_collision(self, i, j, dx, dy, distance):
+        """Resolve collision between the dots in slots i and j."""
         # Normalize direction vector
         if distance > 0:
             nx = dx / distance
@@ -662,8 +779,9 @@ class ColorsLevel:
             nx, ny = 1, 0
             
         # Calculate relative velocity
-        dvx = dot1["dx"] - dot2["dx"]
-        dvy = dot1["dy"] - dot2["dy"]
+        dot_dx, dot_dy = self.dot_dx, self.dot_dy
+        dvx = dot_dx[i] - dot_dx[j]
+        dvy = dot_dy[i] - dot_dy[j]
         
         # Calculate velocity component along the normal
         velocity_along_normal = dvx * nx + dvy * ny
@@ -671,21 +789,15 @@ class ColorsLevel:
         # Only separate if moving toward each other
         if velocity_along_normal < 0:
             # Separate dots to prevent sticking
-            overlap = (dot1["radius"] + dot2["radius"]) - distance
-            dot1["x"] += overlap/2 * nx
-            dot1["y"] += overlap/2 * ny
-            dot2["x"] -= overlap/2 * nx
-            dot2["y"] -= overlap/2 * ny
+            overlap = (self.dot_radius[i] + self.dot_radius[j]) - distance
+            self.dot_x[i] += overlap/2 * nx
+            self.dot_y[i] += overlap/2 * ny
+            self.dot_x[j] -= overlap/2 * nx
+            self.dot_y[j] -= overlap/2 * ny
             
             # Swap velocities and reduce speed by 20%
-            temp_dx = dot1["dx"]
-            temp_dy = dot1["dy"]
-            
-            dot1["dx"] = dot2["dx"] * 0.8
-            dot1["dy"] = dot2["dy"] * 0.8
-            
-            dot2["dx"] = temp_dx * 0.8
-            dot2["dy"] = temp_dy * 0.8
+            dot_dx[i], dot_dx[j] = dot_dx[j] * 0.8, dot_dx[i] * 0.8
+            dot_dy[i], dot_dy[j] = dot_dy[j] * 0.8, dot_dy[i] * 0.8
             
             # PERFORMANCE OPTIMIZATION: Reduce particle effects for collisions
             # Only create particles for 1 in 3 collisions to reduce overhead
@@ -694,13 +806,13 @@ class ColorsLevel:
             
             self._collision_particle_counter += 1
             if self._collision_particle_counter % 3 == 0:  # Only every 3rd collision
-                collision_x = (dot1["x"] + dot2["x"]) / 2
-                collision_y = (dot1["y"] + dot2["y"]) / 2
+                collision_x = float(self.dot_x[i] + self.dot_x[j]) / 2
+                collision_y = float(self.dot_y[i] + self.dot_y[j]) / 2
                 # Reduced from 3 particles to 1 particle per collision
                 self.level_resources.create_particle(
                     collision_x, 
                     collision_y,
-                    random.choice([dot1["color"], dot2["color"]]),
+                    self.COLORS_LIST[self.dot_color_idx[random.choice((i, j))]],
                     random.randint(3, 6),  # Smaller particles (was 5-10)
                     random.uniform(-1, 1),  # Slower movement (was -2,2)
                     random.uniform(-1, 1), 
@@ -709,17 +821,93 @@ class ColorsLevel:
                 
     def _create_collision_enabled_effect(self):
         """Create visual effect when collisions are enabled."""
-        for dot in self.dots:
-            if dot["alive"]:
-                self.particle_manager.create_particle(
-                    dot["x"], dot["y"],
-                    dot["color"],
-                    dot["radius"] * 1.5,
-                    0, 0,
-                    15
-                )
+        for slot in np.flatnonzero(self.dot_alive).tolist():
+            self.particle_manager.create_particle(
+                float(self.dot_x[slot]), float(self.dot_y[slot]),
+                self.COLORS_LIST[self.dot_color_idx[slot]],
+                float(self.dot_radius[slot]) * 1.5,
+                0, 0,
+                15
+            )
                 
-    def _draw_frame(self, stars):
+    def _create_starfield(self, count=100):
+        """Scatter the background stars as parallel position/radius arrays."""
+        self.star_x = np.random.randint(0, self.width + 1, count)
+        self.star_y = np.random.randint(0, self.height + 1, count)
+        self.star_r = np.random.randint(2, 5, count)
+        
+    def _draw_starfield(self, offset_x, offset_y):
+        """Advance the stars one pixel and draw them with a single blits() call."""
+        star_x, star_y, star_r = self.star_x, self.star_y, self.star_r
+        star_y += 1
+        surfaces = self._star_surfaces
+        self.screen.blits(
+            [(surfaces[r], (x - r + offset_x, y - r + offset_y))
+             for x, y, r in zip(star_x.tolist(), star_y.tolist(), star_r.tolist())],
+            doreturn=False)
+            
+        # Respawn stars that fell past the bottom edge above the screen
+        fallen = star_y > self.height + star_r
+        fallen_count = int(np.count_nonzero(fallen))
+        if fallen_count:
+            star_y[fallen] = np.random.randint(-50, -9, fallen_count)
+            star_x[fallen] = np.random.randint(0, self.width + 1, fallen_count)
+            
+    def _draw_plain_dots(self, slots, screen_x, screen_y):
+        """Blit the given non-target dots (no shimmer, no glow) in one batch."""
+        if not slots.size:
+            return
+        # Top-left corners come from one vector cast; entries of the persistent sequence are reused
+        radius = self.DOT_RADIUS
+        left = (screen_x[slots].astype(np.int32) - radius).tolist()
+        top = (screen_y[slots].astype(np.int32) - radius).tolist()
+        surfaces = self._plain_dot_surfaces
+        dot_blits = self._dot_blits
+        for entry, x, y, color_idx in zip(dot_blits, left, top, self.dot_color_idx[slots].tolist()):
+            entry[0] = surfaces[color_idx]
+            dest = entry[1]
+            dest[0] = x
+            dest[1] = y
+        self.screen.blits(islice(dot_blits, slots.size), doreturn=False)
+        
+    def _draw_target_dots(self, slots, screen_x, screen_y):
+        """Blit the given target dots with their shimmer, then their additive glows."""
+        if not slots.size:
+            return
+        draw_xs = screen_x[slots].astype(np.int32).tolist()
+        draw_ys = screen_y[slots].astype(np.int32).tolist()
+        # Target glow pulses in lockstep for every dot, so pick its intensity bucket once per frame (~0.1 rad/frame)
+        glow_bucket = int((_SIN_TABLE[(self.frame_counter * 16) & 1023] + 1.0) * 3.5 + 0.5)
+        shimmer_radii = self._shimmer_radii
+        get_shimmer = self._get_shimmer_effect
+        get_target = self._get_target_surface
+        get_glow = self._get_glow_surface
+        alpha_steps = self.ALPHA_BUCKETS - 1
+        dot_blits = self._dot_blits
+        glow_blits = self._glow_blits
+        for dot_entry, glow_entry, slot, draw_x, draw_y, color_idx in zip(
+                dot_blits, glow_blits, slots.tolist(), draw_xs, draw_ys,
+                self.dot_color_idx[slots].tolist()):
+            # Snap the shimmer (0.9 - 1.1) to the nearest pre-shaded scale
+            shimmer_scale, shimmer_alpha = get_shimmer(slot)
+            scale_idx = min(int((shimmer_scale - 0.9) * 20 + 0.5), 4)
+            shimmer_radius = shimmer_radii[scale_idx]
+            # Pre-stamped alpha variant instead of a per-frame copy() + set_alpha()
+            dot_entry[0] = get_target(color_idx, scale_idx, (shimmer_alpha - 225) * alpha_steps // 30)
+            dest = dot_entry[1]
+            dest[0] = draw_x - shimmer_radius
+            dest[1] = draw_y - shimmer_radius
+            
+            # OPTIMIZED: Additive glow from pre-rendered intensity buckets (no per-frame allocation)
+            glow_radius = shimmer_radius + 6  # Reduced from +8
+            glow_entry[0] = get_glow(color_idx, scale_idx, glow_bucket)
+            dest = glow_entry[1]
+            dest[0] = draw_x - glow_radius
+            dest[1] = draw_y - glow_radius
+        self.screen.blits(islice(dot_blits, slots.size), doreturn=False)
+        self.screen.blits(islice(glow_blits, slots.size), doreturn=False)
+        
+    def _draw_frame(self):
         """Draw a single frame of the colors level with visual enhancements."""
         self.frame_counter += 1
         
@@ -745,68 +933,20 @@ class ColorsLevel:
         self.glass_shatter_manager.draw_cracks(self.screen)
         
         # Draw background stars
-        for star in stars:
-            x, y, radius = star
-            y += 1
-            pygame.draw.circle(self.screen, (200, 200, 200), (x + offset_x, y + offset_y), radius)
-            if y > self.height + radius:
-                y = random.randint(-50, -10)
-                x = random.randint(0, self.width)
-            star[1] = y
-            star[0] = x
+        self._draw_starfield(offset_x, offset_y)
             
         # VISUAL ENHANCEMENT: Draw dots with depth shading and shimmer effects
-        for dot in self.dots:
-            if dot["alive"]:
-                dot_id = dot.get("id", id(dot))  # Use ID or fallback to object ID
-                
-                # PERFORMANCE OPTIMIZATION: Only apply shimmer effects to target dots (60% calculation reduction)
-                if dot["target"]:
-                    # Get shimmer effect for target dots only
-                    shimmer_scale, shimmer_alpha = self._get_shimmer_effect(dot_id)
-                else:
-                    # No shimmer for non-target dots - use default values for performance
-                    shimmer_scale, shimmer_alpha = 1.0, 255
-                
-                # Calculate shaded colors
-                center_color, edge_color = self._calculate_dot_shading(dot["color"], dot["radius"], dot["target"])
-                
-                # Apply shimmer to radius only for target dots
-                shimmer_radius = int(dot["radius"] * shimmer_scale)
-                
-                draw_x = int(dot["x"] + offset_x)
-                draw_y = int(dot["y"] + offset_y)
-                
-                # OPTIMIZED: Simplified 2-layer gradient for better performance (was 3 layers)
-                # Outer darker circle
-                pygame.draw.circle(self.screen, edge_color, (draw_x, draw_y), shimmer_radius)
-                
-                # Inner lighter circle with cached surface and shimmer alpha
-                inner_radius = max(1, shimmer_radius - 4)
-                if dot["target"] and shimmer_alpha < 255:
-                    # Only use alpha blending for target dots with shimmer
-                    dot_surface = self._get_circle_surface(center_color, inner_radius).copy()
-                    dot_surface.set_alpha(shimmer_alpha)
-                    self.screen.blit(dot_surface, (draw_x - inner_radius, draw_y - inner_radius))
-                else:
-                    # Direct drawing for non-target dots (much faster)
-                    pygame.draw.circle(self.screen, center_color, (draw_x, draw_y), inner_radius)
-                                             
-                # OPTIMIZED: Simpler glow effect with cached surface
-                if dot["target"]:
-                    glow_radius = shimmer_radius + 6  # Reduced from +8
-                    glow_intensity = int(60 + 25 * math.sin(self.frame_counter * 0.1))  # Slower animation
-                    # Use cached glow surface to avoid constant surface creation
-                    glow_key = (dot["color"], glow_radius, glow_intensity // 10)  # Quantize intensity
-                    glow_surface = self.surface_cache.get(glow_key)
-                    if glow_surface is None:
-                        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                        pygame.draw.circle(glow_surface, (*dot["color"], glow_intensity), 
-                                         (glow_radius, glow_radius), glow_radius)
-                        # Only cache if we have room (prevent memory growth)
-                        if len(self.surface_cache) < self.surface_cache_limit:
-                            self.surface_cache[glow_key] = glow_surface
-                    self.screen.blit(glow_surface, (draw_x - glow_radius, draw_y - glow_radius))
+        # Cull dots whose box (largest shimmer radius plus glow) is fully offscreen in one vector test
+        screen_x = self.dot_x + offset_x
+        screen_y = self.dot_y + offset_y
+        reach = self.dot_radius * self.SHIMMER_SCALES[-1] + 6
+        visible = (self.dot_alive &
+                   (screen_x + reach >= 0) & (screen_x - reach <= self.width) &
+                   (screen_y + reach >= 0) & (screen_y - reach <= self.height))
+        # PERFORMANCE OPTIMIZATION: plain and target dots take separate specialized paths,
+        # each sent to SDL as batched blits() calls
+        self._draw_plain_dots(np.flatnonzero(visible & ~self.dot_target), screen_x, screen_y)
+        self._draw_target_dots(np.flatnonzero(visible & self.dot_target), screen_x, screen_y)
                                   
         # Draw explosions using level resource manager
         self.level_resources.draw_effects(self.screen, offset_x, offset_y)
@@ -849,17 +989,19 @@ class ColorsLevel:
         self.used_colors.append(self.color_idx)
         self.mother_color = self.COLORS_LIST[self.color_idx]
         self.mother_color_name = self.color_names[self.color_idx]
+        self._glow_cache.clear()  # Only the new target color glows
+        self._target_alpha_cache.clear()
         
         # Reset collision
         self.collision_enabled = False
         self.collision_delay_counter = 0
         
-        # Remove dead dots
-        self.dots = [d for d in self.dots if d["alive"]]
+        # New dots reuse the slots of dead ones
+        free_slots = np.flatnonzero(~self.dot_alive).tolist()
         
         # PERFORMANCE OPTIMIZATION: Use grid-based placement algorithm
-        new_dots_needed = min(60 - len(self.dots), 30)  # Performance optimization: Reduced from 85 to 60, and from 42 to 30
-        existing_target_dots = sum(1 for d in self.dots if d["color"] == self.mother_color)
+        new_dots_needed = min(len(free_slots), 30)  # Performance optimization: Reduced from 85 to 60, and from 42 to 30
+        existing_target_dots = int(np.count_nonzero(self.dot_alive & (self.dot_color_idx == self.color_idx)))
         target_dots_needed = max(0, new_dots_count - existing_target_dots)
         
         # Create occupancy grid for faster collision detection during placement
@@ -877,54 +1019,35 @@ class ColorsLevel:
                 continue
                 
             x, y = position
-            dx = random.uniform(-6, 6)
-            dy = random.uniform(-6, 6)
             
             # Determine if this dot is a target or distractor
-            is_target = False
             if i < target_dots_needed:
-                color = self.mother_color
-                is_target = True
+                color_idx = self.color_idx
             else:
-                distractor_colors = [c for idx, c in enumerate(self.COLORS_LIST) if idx != self.color_idx]
-                color = random.choice(distractor_colors)
+                color_idx = random.choice([idx for idx in range(len(self.COLORS_LIST)) if idx != self.color_idx])
                 
-            dot_id = len(self.dots)
-            self.dots.append({
-                "x": x, "y": y,
-                "dx": dx, "dy": dy,
-                "color": color,
-                "radius": 48,
-                "target": is_target,
-                "alive": True,
-                "id": dot_id  # Add unique ID for shimmer tracking
-            })
+            # The slot index doubles as the dot's shimmer id
+            self._spawn_dot(free_slots[dots_created], x, y, color_idx)
             
             # Mark position as occupied in grid
             grid_x = min(int(x // self.grid_size), self.grid_cols - 1)
             grid_y = min(int(y // self.grid_size), self.grid_rows - 1)
-            occupancy_grid[grid_y][grid_x] = True
+            occupancy_grid[grid_x + grid_y * self.grid_cols] = 1
             dots_created += 1
             
-        # PERFORMANCE OPTIMIZATION: Single pass target update
-        target_count = 0
-        for d in self.dots:
-            is_target = (d["color"] == self.mother_color)
-            d["target"] = is_target
-            if is_target and d["alive"]:
-                target_count += 1
-                
-        self.target_dots_left = target_count
+        # PERFORMANCE OPTIMIZATION: Single mask target update
+        self.dot_target = self.dot_color_idx == self.color_idx
+        self.target_dots_left = int(np.count_nonzero(self.dot_target & self.dot_alive))
         
     def _create_occupancy_grid(self):
-        """Create occupancy grid for optimized dot placement."""
-        occupancy_grid = [[False for _ in range(self.grid_cols)] for _ in range(self.grid_rows)]
-        
-        for dot in self.dots:
-            if dot["alive"]:
-                grid_x = min(int(dot["x"] // self.grid_size), self.grid_cols - 1)
-                grid_y = min(int(dot["y"] // self.grid_size), self.grid_rows - 1)
-                occupancy_grid[grid_y][grid_x] = True
+        """Create occupancy grid (flat bytearray, one byte per cell) for optimized dot placement."""
+        occupancy_grid = bytearray(self.grid_cols * self.grid_rows)
+        
+        alive = self.dot_alive
+        grid_x = np.minimum(self.dot_x[alive] // self.grid_size, self.grid_cols - 1).astype(np.int32)
+        grid_y = np.minimum(self.dot_y[alive] // self.grid_size, self.grid_rows - 1).astype(np.int32)
+        for cell in (grid_x + grid_y * self.grid_cols).tolist():
+            occupancy_grid[cell] = 1
                 
         return occupancy_grid
         
@@ -937,9 +1060,11 @@ class ColorsLevel:
             grid_y = random.randint(1, self.grid_rows - 2)
             
             # Check if this grid cell and immediate neighbors are free
-            if not occupancy_grid[grid_y][grid_x]:
-                x = random.randint(grid_x * self.grid_size + 60, (grid_x + 1) * self.grid_size - 60)
-                y = random.randint(grid_y * self.grid_size + 60, (grid_y + 1) * self.grid_size - 60)
+            if not occupancy_grid[grid_x + grid_y * self.grid_cols]:
+                # Keep clear of the cell edges (never past the cell center, or randint gets an empty range)
+                inset = min(60, self.grid_size // 2)
+                x = random.randint(grid_x * self.grid_size + inset, (grid_x + 1) * self.grid_size - inset)
+                y = random.randint(grid_y * self.grid_size + inset, (grid_y + 1) * self.grid_size - inset)
                 
                 x = max(100, min(self.width - 100, x))
                 y = max(100, min(self.height - 100, y))
@@ -957,9 +1082,9 @@ class ColorsLevel:
                 self.level_resources.cleanup()
             
             # Clear any remaining level-specific data
-            self.dots.clear()
-            self.surface_cache.clear()
-            self.shimmer_seeds.clear()
+            self.dot_alive[:] = False
+            self._glow_cache.clear()
+            self._target_alpha_cache.clear()
             
             print(f"ColorsLevel: Cleanup completed successfully")
         except Exception as e:
@@ -1,15 +1,52 @@
 import pygame
 import random
 import math
+import numpy as np
 from settings import (
-    LETTER_SPAWN_INTERVAL, WHITE, BLACK, FLAME_COLORS,
-    LEVEL_PROGRESS_PATH, SEQUENCES, GROUP_SIZE
+    LETTER_SPAWN_INTERVAL, WHITE, BLACK, FLAME_COLORS, LASER_WIDTHS,
+    LEVEL_PROGRESS_PATH, NUMBERS_SEQ, GROUP_SIZE
 )
+from Display_settings import PERFORMANCE_SETTINGS
 from universal_class import (
     GlassShatterManager, HUDManager, MultiTouchManager, 
     CheckpointManager, FlamethrowerManager, CenterPieceManager
 )
 from utils.level_resource_manager import LevelResourceManager
+from utils.frame_budget import frame_budget
+
+class NumberObj:
+    """A pooled falling number. Slots keep instances compact with fixed attribute offsets."""
+    
+    __slots__ = ("value", "x", "y", "rect", "size", "dx", "dy", "can_bounce", "mass", "active")
+    
+    def __init__(self):
+        self.value = ""
+        self.x = 0
+        self.y = 0
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.size = 240
+        self.dx = 0
+        self.dy = 0
+        self.can_bounce = False
+        self.mass = 0
+        self.active = False
+        
+    # Mapping-style access so shared helpers written against dict objects
+    # (e.g. LevelResourceManager.apply_explosion_effect) keep working
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+            
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+            
+    def __contains__(self, key):
+        return key in self.__slots__
 
 
 class NumbersLevel:
@@ -76,10 +113,18 @@ class NumbersLevel:
         self.game_over_screen = game_over_screen_func
         
         # Numbers configuration
-        self.sequence = SEQUENCES["numbers"]
-        self.groups = [self.sequence[i:i+GROUP_SIZE] for i in range(0, len(self.sequence), GROUP_SIZE)]
+        self.sequence = NUMBERS_SEQ
+        self.groups = [list(self.sequence[i:i+GROUP_SIZE]) for i in range(0, len(self.sequence), GROUP_SIZE)]
         self.TOTAL_NUMBERS = len(self.sequence)
         
+        # Pre-create falling number pool for object reuse (one group on screen at a time)
+        self.number_pool = [NumberObj() for _ in range(GROUP_SIZE)]
+        
+        # Glyph atlas for falling numbers (built in run() once fonts are ready)
+        self.number_atlas = None
+        self.number_atlas_rects = {}
+        self.fallback_surfaces = {}
+        
         # Initialize level resource manager for isolation
         self.level_resources = LevelResourceManager(
             level_id="numbers",
@@ -116,6 +161,8 @@ class NumbersLevel:
         self.running = True
         self.game_started = False
         self.numbers = []
+        for number_obj in self.number_pool:
+            number_obj.active = False
         self.numbers_to_spawn = self.current_group.copy()
         self.frame_count = 0
         
@@ -154,6 +201,9 @@ class NumbersLevel:
                 return False
             print("[DEBUG] Level resources initialized successfully")
             
+            # Pre-render all number glyphs into one atlas surface
+            self._build_number_atlas()
+            
             # Preload number sounds - convert numbers to words
             print("[DEBUG] Starting audio preloading...")
             number_words = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten"]
@@ -176,7 +226,6 @@ class NumbersLevel:
                 
             # Main game loop
             print("[DEBUG] Starting main game loop...")
-            clock = pygame.time.Clock()
             
             print(f"Numbers level initialized. Waiting for first click/touch to start...")
             print(f"Target sequence: {self.sequence}")
@@ -240,7 +289,7 @@ class NumbersLevel:
                 try:
                     self.frame_count += 1
                     pygame.display.flip()
-                    clock.tick(50)
+                    frame_budget.tick(50)
                 except Exception as e:
                     print(f"[DEBUG] Error in display update: {e}")
                 
@@ -340,38 +389,39 @@ class NumbersLevel:
         # Flag to track if click hit a target
         hit_target = False
         
-        # Process Click on Target
-        for number_obj in self.numbers[:]:
-            if number_obj["rect"].collidepoint(click_x, click_y):
+        # Process Click on Target (no copy needed - we break right after removing)
+        for number_obj in self.numbers:
+            if number_obj.rect.collidepoint(click_x, click_y):
                 hit_target = True  # Marked as hit
-                if number_obj["value"] == self.target_number:
+                if number_obj.value == self.target_number:
                     self.score += 10
                     
                     # EDUCATIONAL FEATURE: Play pronunciation of the number
                     # Convert number to word for pronunciation
                     number_words = {"1": "one", "2": "two", "3": "three", "4": "four", "5": "five", 
                                    "6": "six", "7": "seven", "8": "eight", "9": "nine", "10": "ten"}
-                    number_word = number_words.get(str(number_obj["value"]), str(number_obj["value"]))
+                    number_word = number_words.get(str(number_obj.value), str(number_obj.value))
                     self.level_resources.play_target_sound(number_word)
                     
                     # Common destruction effects
-                    self.level_resources.create_explosion(number_obj["x"], number_obj["y"])
-                    self.create_flame_effect(self.player_x, self.player_y - 80, number_obj["x"], number_obj["y"])
-                    self.center_piece_manager.trigger_convergence(number_obj["x"], number_obj["y"])
-                    self.level_resources.apply_explosion_effect(number_obj["x"], number_obj["y"], 150, self.numbers)
+                    self.level_resources.create_explosion(number_obj.x, number_obj.y)
+                    self.create_flame_effect(self.player_x, self.player_y - 80, number_obj.x, number_obj.y)
+                    self.center_piece_manager.trigger_convergence(number_obj.x, number_obj.y)
+                    self.level_resources.apply_explosion_effect(number_obj.x, number_obj.y, 150, self.numbers)
 
                     # Add visual feedback particles
                     for i in range(20):
                         self.level_resources.create_particle(
-                            number_obj["x"], number_obj["y"],
+                            number_obj.x, number_obj.y,
                             random.choice(FLAME_COLORS),
                             random.randint(40, 80),
                             random.uniform(-2, 2), random.uniform(-2, 2),
                             20
                         )
 
-                    # Remove number and update counts
+                    # Remove number, return it to the pool and update counts
                     self.numbers.remove(number_obj)
+                    number_obj.active = False
                     self.numbers_destroyed += 1
 
                     # Update target
@@ -394,74 +444,99 @@ class NumbersLevel:
         if self.numbers_to_spawn:
             if self.frame_count % LETTER_SPAWN_INTERVAL == 0:
                 number_value = self.numbers_to_spawn.pop(0)
-                number_obj = {
-                    "value": number_value,
-                    "x": random.randint(50, self.width - 50),
-                    "y": -50,                    "rect": pygame.Rect(0, 0, 0, 0),  # Will be updated when drawn
-                    "size": 240,  # Fixed size
-                    "dx": random.choice([-1, -0.5, 0.5, 1]) * 1.5,  # Horizontal drift
-                    "dy": random.choice([1, 1.5]) * 1.5 * 1.2,  # 20% faster fall speed
-                    "can_bounce": False,  # Start without bouncing
-                    "mass": random.uniform(40, 60)  # Mass for collisions
-                }
+                number_obj = self._get_number_obj()
+                number_obj.value = number_value
+                number_obj.x = random.randint(50, self.width - 50)
+                number_obj.y = -50
+                number_obj.rect.update(0, 0, 0, 0)  # Will be updated when drawn
+                number_obj.size = 240  # Fixed size
+                number_obj.dx = random.choice([-1, -0.5, 0.5, 1]) * 1.5  # Horizontal drift
+                number_obj.dy = random.choice([1, 1.5]) * 1.5 * 1.2  # 20% faster fall speed
+                number_obj.can_bounce = False  # Start without bouncing
+                number_obj.mass = random.uniform(40, 60)  # Mass for collisions
                 self.numbers.append(number_obj)
                 self.numbers_spawned += 1
                 
+    def _get_number_obj(self):
+        """Get an inactive number object from the pool, growing it if exhausted."""
+        for number_obj in self.number_pool:
+            if not number_obj.active:
+                number_obj.active = True
+                return number_obj
+        number_obj = NumberObj()
+        number_obj.active = True
+        self.number_pool.append(number_obj)
+        return number_obj
+        
     def _update_numbers(self):
         """Update physics and collisions for all numbers."""
+        # PERFORMANCE: Hoist loop-invariant values out of the per-number update
+        width = self.width
+        height = self.height
+        bounce_start_y = height // 5
+        half_width = width / 2
+        bounce_dampening = 0.8
+
         # Update positions and bouncing
-        for number_obj in self.numbers[:]:
-            number_obj["x"] += number_obj["dx"]
-            number_obj["y"] += number_obj["dy"]
+        for number_obj in self.numbers:
+            x = number_obj.x + number_obj.dx
+            y = number_obj.y + number_obj.dy
 
             # Bouncing Logic
-            if not number_obj["can_bounce"] and number_obj["y"] > self.height // 5:
-                number_obj["can_bounce"] = True
+            if not number_obj.can_bounce and y > bounce_start_y:
+                number_obj.can_bounce = True
 
-            if number_obj["can_bounce"]:
-                bounce_dampening = 0.8
+            if number_obj.can_bounce:
+                half_size = number_obj.size / 2
 
                 # Left/Right Walls
-                if number_obj["x"] <= 0 + number_obj.get("size", 50)/2:
-                    number_obj["x"] = 0 + number_obj.get("size", 50)/2
-                    number_obj["dx"] = abs(number_obj["dx"]) * bounce_dampening
-                elif number_obj["x"] >= self.width - number_obj.get("size", 50)/2:
-                    number_obj["x"] = self.width - number_obj.get("size", 50)/2
-                    number_obj["dx"] = -abs(number_obj["dx"]) * bounce_dampening
+                if x <= half_size:
+                    x = half_size
+                    number_obj.dx = abs(number_obj.dx) * bounce_dampening
+                elif x >= width - half_size:
+                    x = width - half_size
+                    number_obj.dx = -abs(number_obj.dx) * bounce_dampening
 
                 # Top/Bottom Walls
-                if number_obj["y"] <= 0 + number_obj.get("size", 50)/2:
-                    number_obj["y"] = 0 + number_obj.get("size", 50)/2
-                    number_obj["dy"] = abs(number_obj["dy"]) * bounce_dampening
-                elif number_obj["y"] >= self.height - number_obj.get("size", 50)/2:
-                    number_obj["y"] = self.height - number_obj.get("size", 50)/2
-                    number_obj["dy"] = -abs(number_obj["dy"]) * bounce_dampening
+                if y <= half_size:
+                    y = half_size
+                    number_obj.dy = abs(number_obj.dy) * bounce_dampening
+                elif y >= height - half_size:
+                    y = height - half_size
+                    number_obj.dy = -abs(number_obj.dy) * bounce_dampening
                     # Push horizontally away from edge on bottom bounce
-                    number_obj["dx"] *= bounce_dampening
-                    if number_obj["x"] < self.width / 2:
-                        number_obj["dx"] += random.uniform(0.1, 0.3)
+                    number_obj.dx *= bounce_dampening
+                    if x < half_width:
+                        number_obj.dx += random.uniform(0.1, 0.3)
                     else:
-                        number_obj["dx"] -= random.uniform(0.1, 0.3)
+                        number_obj.dx -= random.uniform(0.1, 0.3)
+
+            number_obj.x = x
+            number_obj.y = y
                         
         # Handle collisions between numbers
         self._handle_number_collisions()
         
     def _handle_number_collisions(self):
         """Handle collisions between falling numbers."""
+        numbers = self.numbers
+        if len(numbers) < 2:
+            return  # Nothing can collide
+        
         # PERFORMANCE: Reduce collision check frequency
-        from Display_settings import PERFORMANCE_SETTINGS
         collision_frequency = PERFORMANCE_SETTINGS.get(self.center_piece_manager.display_mode, PERFORMANCE_SETTINGS["DEFAULT"])["collision_check_frequency"]
         if self.frame_count % collision_frequency == 0:
-            for i, number_obj1 in enumerate(self.numbers):
-                for j in range(i + 1, len(self.numbers)):
-                    number_obj2 = self.numbers[j]
-                    dx = number_obj2["x"] - number_obj1["x"]
-                    dy = number_obj2["y"] - number_obj1["y"]
+            count = len(numbers)
+            for i, number_obj1 in enumerate(numbers):
+                radius1 = number_obj1.size / 1.8
+                for j in range(i + 1, count):
+                    number_obj2 = numbers[j]
+                    dx = number_obj2.x - number_obj1.x
+                    dy = number_obj2.y - number_obj1.y
                     distance_sq = dx*dx + dy*dy
 
                     # Collision radius calculation
-                    radius1 = number_obj1.get("size", self.target_font.get_height()) / 1.8
-                    radius2 = number_obj2.get("size", self.target_font.get_height()) / 1.8
+                    radius2 = number_obj2.size / 1.8
                     min_distance = radius1 + radius2
                     min_distance_sq = min_distance * min_distance
 
@@ -473,25 +548,25 @@ class NumbersLevel:
 
                         # Resolve interpenetration
                         overlap = min_distance - distance
-                        total_mass = number_obj1["mass"] + number_obj2["mass"]
+                        total_mass = number_obj1.mass + number_obj2.mass
                         push_factor = overlap / total_mass
-                        number_obj1["x"] -= nx * push_factor * number_obj2["mass"]
-                        number_obj1["y"] -= ny * push_factor * number_obj2["mass"]
-                        number_obj2["x"] += nx * push_factor * number_obj1["mass"]
-                        number_obj2["y"] += ny * push_factor * number_obj1["mass"]
+                        number_obj1.x -= nx * push_factor * number_obj2.mass
+                        number_obj1.y -= ny * push_factor * number_obj2.mass
+                        number_obj2.x += nx * push_factor * number_obj1.mass
+                        number_obj2.y += ny * push_factor * number_obj1.mass
 
                         # Calculate collision response
-                        dvx = number_obj1["dx"] - number_obj2["dx"]
-                        dvy = number_obj1["dy"] - number_obj2["dy"]
+                        dvx = number_obj1.dx - number_obj2.dx
+                        dvy = number_obj1.dy - number_obj2.dy
                         dot_product = dvx * nx + dvy * ny
                         impulse = (2 * dot_product) / total_mass
                         bounce_factor = 0.85
 
                         # Apply impulse
-                        number_obj1["dx"] -= impulse * number_obj2["mass"] * nx * bounce_factor
-                        number_obj1["dy"] -= impulse * number_obj2["mass"] * ny * bounce_factor
-                        number_obj2["dx"] += impulse * number_obj1["mass"] * nx * bounce_factor
-                        number_obj2["dy"] += impulse * number_obj1["mass"] * ny * bounce_factor
+                        number_obj1.dx -= impulse * number_obj2.mass * nx * bounce_factor
+                        number_obj1.dy -= impulse * number_obj2.mass * ny * bounce_factor
+                        number_obj2.dx += impulse * number_obj1.mass * nx * bounce_factor
+                        number_obj2.dy += impulse * number_obj1.mass * ny * bounce_factor
                         
     def _handle_checkpoint_logic(self):
         """Handle checkpoint display logic."""
@@ -636,52 +711,128 @@ class NumbersLevel:
             
     def _update_and_draw_numbers(self, offset_x, offset_y):
         """Update and draw falling numbers."""
-        for number_obj in self.numbers[:]:
-            # Draw the number
-            draw_pos_x = int(number_obj["x"] + offset_x)
-            draw_pos_y = int(number_obj["y"] + offset_y)
+        # PERFORMANCE: Bind hot lookups to locals once per frame
+        atlas = self.number_atlas
+        atlas_rects = self.number_atlas_rects
+        target = self.target_number
+        target_color = BLACK
+        other_color = (150, 150, 150)
+
+        # Collect blit entries (all sharing the atlas source) and issue a single blits() call
+        blit_sequence = []
+        append = blit_sequence.append
+
+        for number_obj in self.numbers:
+            value = number_obj.value
 
             # Use gray for non-target numbers, black for the target number
-            text_color = BLACK if number_obj["value"] == self.target_number else (150, 150, 150)
+            text_color = target_color if value == target else other_color
+
+            # Reuse the number's rect instead of allocating a new one
+            text_rect = number_obj.rect
+            source_rect = atlas_rects.get((value, text_color))
+            if source_rect is not None:
+                text_rect.size = source_rect.size
+                text_rect.center = (int(number_obj.x + offset_x), int(number_obj.y + offset_y))
+                append((atlas, text_rect, source_rect))
+            else:
+                # Not in the atlas: blit a standalone surface instead
+                surface = self._get_number_surface(value, text_color)
+                text_rect.size = surface.get_size()
+                text_rect.center = (int(number_obj.x + offset_x), int(number_obj.y + offset_y))
+                append((surface, text_rect))
+
+        if blit_sequence:
+            self.screen.blits(blit_sequence, doreturn=False)
+                
+    def _get_number_surface(self, value, color):
+        """Get the cached surface for a number, rendering it directly if the cache is unavailable."""
+        surface = self.resource_manager.get_falling_object_surface("numbers", value, color)
+        if surface is None:
+            # Fallback: render with the level font and keep it for later frames
+            surface = self.fallback_surfaces.get((value, color))
+            if surface is None:
+                surface = self.target_font.render(value, True, color)
+                self.fallback_surfaces[(value, color)] = surface
+        return surface
             
-            # Use cached font surface if available
-            try:
-                cached_surface = self.resource_manager.get_falling_object_surface("numbers", number_obj["value"], text_color)
-                text_rect = cached_surface.get_rect(center=(draw_pos_x, draw_pos_y))
-                number_obj["rect"] = text_rect
-                self.screen.blit(cached_surface, text_rect)
-            except:
-                # Fallback: Original rendering method
-                text_surface = self.target_font.render(number_obj["value"], True, text_color)
-                text_rect = text_surface.get_rect(center=(draw_pos_x, draw_pos_y))
-                number_obj["rect"] = text_rect
-                self.screen.blit(text_surface, text_rect)
+    def _build_number_atlas(self):
+        """Pack every number glyph in both text colors into a single atlas surface."""
+        self.number_atlas = None
+        self.number_atlas_rects = {}
+        
+        try:
+            glyphs = []
+            for value in self.sequence:
+                for color in (BLACK, (150, 150, 150)):
+                    glyphs.append((value, color, self._get_number_surface(value, color)))
+            
+            atlas_width = sum(surface.get_width() for _, _, surface in glyphs)
+            atlas_height = max(surface.get_height() for _, _, surface in glyphs)
+            atlas = pygame.Surface((atlas_width, atlas_height), pygame.SRCALPHA)
+            
+            # Lay glyphs out left to right; RGBA_MAX onto the cleared atlas copies pixels exactly
+            x = 0
+            for value, color, surface in glyphs:
+                atlas.blit(surface, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+                self.number_atlas_rects[(value, color)] = pygame.Rect(x, 0, *surface.get_size())
+                x += surface.get_width()
                 
+            self.number_atlas = atlas
+        except Exception as e:
+            print(f"[DEBUG] Could not build number atlas, using per-number surfaces: {e}")
+            self.number_atlas_rects = {}
+            
     def _process_lasers(self, offset_x, offset_y):
         """Process legacy laser effects."""
-        for laser in self.lasers[:]:
-            if laser["duration"] > 0:
-                if laser["type"] != "flamethrower":
-                    pygame.draw.line(self.screen, random.choice(laser.get("colors", FLAME_COLORS)),
-                                   (laser["start_pos"][0] + offset_x, laser["start_pos"][1] + offset_y),
-                                   (laser["end_pos"][0] + offset_x, laser["end_pos"][1] + offset_y),
-                                    random.choice(laser.get("widths", [5, 10, 15])))
-                laser["duration"] -= 1
-            else:
-                self.lasers.remove(laser)
+        if not self.lasers:
+            return
+
+        # PERFORMANCE: Draw every color/width pick for this frame in one batched RNG call
+        rolls = np.random.random((len(self.lasers), 2)).tolist()
+
+        # PERFORMANCE: Bind hot lookups to locals once per frame
+        screen = self.screen
+        draw_line = pygame.draw.line
+        default_colors = FLAME_COLORS
+        default_widths = LASER_WIDTHS
+
+        # Compact live lasers in place (the list is shared with the caller)
+        lasers = self.lasers
+        write_index = 0
+        for laser, (color_roll, width_roll) in zip(lasers, rolls):
+            if laser["duration"] <= 0:
+                continue  # Expired - dropped by the compaction below
+            if laser["type"] != "flamethrower":
+                colors = laser.get("colors", default_colors)
+                widths = laser.get("widths", default_widths)
+                start_x, start_y = laser["start_pos"]
+                end_x, end_y = laser["end_pos"]
+                draw_line(screen, colors[int(color_roll * len(colors))],
+                          (start_x + offset_x, start_y + offset_y),
+                          (end_x + offset_x, end_y + offset_y),
+                          widths[int(width_roll * len(widths))])
+            laser["duration"] -= 1
+            lasers[write_index] = laser
+            write_index += 1
+        del lasers[write_index:]
                 
     def _process_explosions(self, offset_x, offset_y):
         """Process explosion effects."""
         # Use level resource manager for explosions
         self.level_resources.draw_effects(self.screen, offset_x, offset_y)
         
-        # Process legacy explosions if any remain
-        for explosion in self.explosions[:]:
-            if explosion["duration"] > 0:
-                self.draw_explosion(explosion, offset_x, offset_y)
-                explosion["duration"] -= 1
-            else:
-                self.explosions.remove(explosion)
+        # Process legacy explosions if any remain, compacting the shared list in place
+        explosions = self.explosions
+        write_index = 0
+        for explosion in explosions:
+            if explosion["duration"] <= 0:
+                continue  # Expired - dropped by the compaction below
+            self.draw_explosion(explosion, offset_x, offset_y)
+            explosion["duration"] -= 1
+            explosions[write_index] = explosion
+            write_index += 1
+        del explosions[write_index:]
     
     def _cleanup_level(self):
         """Clean up all level resources to prevent bleeding into other levels."""
@@ -690,10 +841,12 @@ class NumbersLevel:
             if hasattr(self, 'level_resources') and self.level_resources:
                 self.level_resources.cleanup()
             
-            # Clear any remaining level-specific data
-            self.numbers.clear()
-            self.numbers_to_spawn.clear()
-            self.numbers_to_target.clear()
+            # Clear any remaining level-specific data in one batch; pooled
+            # number objects are only deactivated so the next run reuses them
+            for pending in (self.numbers, self.numbers_to_spawn, self.numbers_to_target):
+                pending.clear()
+            for number_obj in self.number_pool:
+                number_obj.active = False
             
             print(f"NumbersLevel: Cleanup completed successfully")
         except Exception as e:
@@ -2,12 +2,13 @@ import pygame
 import random
 import math
 from settings import (
-    SEQUENCES, GROUP_SIZE, LETTER_SPAWN_INTERVAL, FLAME_COLORS,
+    SHAPES_SEQ, GROUP_SIZE, LETTER_SPAWN_INTERVAL, FLAME_COLORS, LASER_WIDTHS,
     LEVEL_PROGRESS_PATH, WHITE, BLACK
 )
 from Display_settings import PERFORMANCE_SETTINGS
 from universal_class import GlassShatterManager, HUDManager, MultiTouchManager, CheckpointManager, FlamethrowerManager
 from utils.level_resource_manager import LevelResourceManager
+from utils.frame_budget import frame_budget
 
 
 class ShapesLevel:
@@ -70,8 +71,8 @@ class ShapesLevel:
         self.flamethrower_manager = FlamethrowerManager()
         
         # Shapes configuration
-        self.sequence = SEQUENCES["shapes"]
-        self.groups = [self.sequence[i:i+GROUP_SIZE] for i in range(0, len(self.sequence), GROUP_SIZE)]
+        self.sequence = SHAPES_SEQ
+        self.groups = [list(self.sequence[i:i+GROUP_SIZE]) for i in range(0, len(self.sequence), GROUP_SIZE)]
         self.TOTAL_LETTERS = len(self.sequence)
         
         # Initialize level resource manager for isolation and audio
@@ -147,7 +148,7 @@ class ShapesLevel:
                 return False
             
             # Preload shape name sounds
-            shape_names = [shape.lower() for shape in SEQUENCES["shapes"]]
+            shape_names = [shape.lower() for shape in SHAPES_SEQ]
             self.level_resources.preload_level_sounds(shape_names)
             
             self.reset_level_state()
@@ -181,7 +182,6 @@ class ShapesLevel:
         
     def _main_game_loop(self, stars):
         """Main game loop for the shapes level."""
-        clock = pygame.time.Clock()
         
         while self.running:
             # Handle events
@@ -206,7 +206,7 @@ class ShapesLevel:
             
             # Update frame counter and clock
             self.frame_count += 1
-            clock.tick(50)
+            frame_budget.tick(50)
         
         return True
         
@@ -525,7 +525,7 @@ class ShapesLevel:
                     pygame.draw.line(self.screen, random.choice(laser.get("colors", FLAME_COLORS)),
                                      (laser["start_pos"][0] + offset_x, laser["start_pos"][1] + offset_y),
                                      (laser["end_pos"][0] + offset_x, laser["end_pos"][1] + offset_y),
-                                      random.choice(laser.get("widths", [5, 10, 15])))
+                                      random.choice(laser.get("widths", LASER_WIDTHS)))
                 laser["duration"] -= 1
             else:
                 self.lasers.remove(laser)
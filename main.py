@@ -14,13 +14,61 @@ and audio enhancements while maintaining maximum stability. It features:
 
 import pygame
 import sys
-import traceback
 import os
 import pathlib
 import gc
 import tempfile
+import logging
+import logging.handlers
+import queue
+import atexit
 from typing import Optional
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+# Log through a queue so the game loop never blocks on console I/O; a
+# background listener thread does the actual writing.  run() sets this up,
+# not the import, so importers keep their own logging configuration.
+_log_listener = None
+_log_handler = None
+_saved_root_level = None
+
+
+def _start_log_listener():
+    """Route root logging through the queue and start the listener (safe to call twice)."""
+    global _log_listener, _log_handler, _saved_root_level
+    if _log_listener is not None:
+        return
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    _saved_root_level = root.level
+    _log_handler = logging.handlers.QueueHandler(log_queue)
+    root.addHandler(_log_handler)
+    root.setLevel(logging.INFO)
+    _log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stderr))
+    _log_listener.start()
+
+
+def _stop_log_listener():
+    """Detach the queue handler, flush queued records and stop the listener (safe to call twice)."""
+    global _log_listener, _log_handler
+    root = logging.getLogger()
+    if _log_handler is not None:
+        root.removeHandler(_log_handler)
+        root.setLevel(_saved_root_level)
+        _log_handler = None
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
 # Ensure repository root is on sys.path for imports
 _REPO_ROOT = pathlib.Path(__file__).resolve().parent
 if str(_REPO_ROOT) not in sys.path:
@@ -38,6 +86,7 @@ try:
     from utils.level_resource_manager import LevelResourceManager
     from utils.audio_manager import AudioManager
     from utils.sound_effects_manager import SoundEffectsManager
+    from utils.frame_budget import frame_budget
 except ImportError as e:
     print(f"Critical import error: {e}")
     print("Please ensure all required modules are available.")
@@ -50,6 +99,24 @@ class SuperStudentGame:
     Provides robust error handling, resource management, and performance optimization.
     """
     
+    # Fixed attribute layout; managers are read every level start, so they are
+    # slots rather than entries in a dict
+    __slots__ = (
+        "running", "screen", "clock", "width", "height",
+        "resource_manager", "resources", "_initialized",
+        "particle_manager", "audio_manager", "sound_effects_manager",
+        "glass_shatter", "multi_touch", "hud", "checkpoint", "flamethrower", "center_piece",
+        "_level_pool", "_level_resources_pool", "display_mode", "error_count", "max_errors",
+        "lock_file", "lock_file_path", "_headless_mode",
+        "_proc", "_mem_check_counter", "_mem_check_interval", "_mem_limit_mb",
+        "_saved_gc_threshold",
+    )
+    
+    # Universal class managers created by initialize_resources
+    _MANAGER_NAMES = ("glass_shatter", "multi_touch", "hud", "checkpoint", "flamethrower", "center_piece")
+    # Managers owned directly by the game, in the order they are cleaned up
+    _cleanup_order = ("audio_manager", "sound_effects_manager", "particle_manager")
+    
     def __init__(self):
         """Initialize the game controller with all necessary managers."""
         self.running = True
@@ -58,15 +125,33 @@ class SuperStudentGame:
         self.width = 0
         self.height = 0
         self.resource_manager = None
+        self.resources = None  # Fonts dict built once by initialize_resources
+        self._initialized = False  # Set once initialize_resources succeeds
         self.particle_manager = None
         self.audio_manager = None
         self.sound_effects_manager = None
-        self.managers = {}
+        self.glass_shatter = None
+        self.multi_touch = None
+        self.hud = None
+        self.checkpoint = None
+        self.flamethrower = None
+        self.center_piece = None
+        # Pooled per-level objects, reused across level restarts instead of rebuilt
+        self._level_pool = {}  # level class -> level instance
+        self._level_resources_pool = {}  # level mode -> LevelResourceManager
         self.display_mode = DEFAULT_MODE
         self.error_count = 0
         self.max_errors = 5  # Maximum errors before graceful shutdown
         self.lock_file = None
         self.lock_file_path = os.path.join(tempfile.gettempdir(), "ss6_game.lock")
+        self._headless_mode = None  # Detected on first use
+        
+        # Memory pressure monitoring (process handle cached, checks throttled)
+        self._proc = psutil.Process() if psutil else None
+        self._mem_check_counter = 0
+        self._mem_check_interval = 60  # Calls between unforced checks
+        self._mem_limit_mb = 200
+        self._saved_gc_threshold = None  # Set while run() has the collector tuned
         
     def check_single_instance(self) -> bool:
         """
@@ -82,10 +167,10 @@ class SuperStudentGame:
                     with open(self.lock_file_path, 'r') as f:
                         pid = int(f.read().strip())
                     
-                    # Check if process exists (Windows-compatible)
-                    import psutil
-                    if psutil.pid_exists(pid):
-                        print(f"Another SS6 instance is already running (PID: {pid})")
+                    # Check if process exists (Windows-compatible); without
+                    # psutil the owner can't be checked, so the lock counts as stale
+                    if psutil is not None and psutil.pid_exists(pid):
+                        logger.warning(f"Another SS6 instance is already running (PID: {pid})")
                         return False
                     else:
                         # Stale lock file, remove it
@@ -103,7 +188,7 @@ class SuperStudentGame:
             return True
             
         except Exception as e:
-            print(f"Warning: Could not check for single instance: {e}")
+            logger.warning(f"Warning: Could not check for single instance: {e}")
             return True  # Allow to run if check fails
     
     def cleanup_lock_file(self):
@@ -111,9 +196,9 @@ class SuperStudentGame:
         try:
             if self.lock_file and os.path.exists(self.lock_file):
                 os.remove(self.lock_file)
-                print("Lock file cleaned up")
+                logger.info("Lock file cleaned up")
         except Exception as e:
-            print(f"Warning: Could not clean up lock file: {e}")
+            logger.warning(f"Warning: Could not clean up lock file: {e}")
         
     def initialize_pygame(self) -> bool:
         """
@@ -124,9 +209,9 @@ class SuperStudentGame:
         """
         try:
             # Check for headless environment before initializing audio
-            headless_mode = self._detect_headless_environment()
+            headless_mode = self._headless
             if headless_mode:
-                print("Headless environment detected - initializing in silent mode")
+                logger.info("Headless environment detected - initializing in silent mode")
                 os.environ['SDL_AUDIODRIVER'] = 'dummy'
             
             # Initialize pygame with environment-appropriate settings
@@ -138,11 +223,15 @@ class SuperStudentGame:
             else:
                 pygame.init()
             
-            # Configure allowed events for performance
+            # Configure allowed events for performance. Everything is allowed by
+            # default, so block all types first; blocked events are dropped by SDL
+            # before they reach the queue instead of being filtered in get().
+            pygame.event.set_blocked(None)
             pygame.event.set_allowed([
                 pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION,
                 pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, 
-                pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION
+                pygame.MOUSEBUTTONUP,
+                pygame.USEREVENT + 1  # Audio events posted by AudioManager
             ])
             
             # Get display info and setup screen
@@ -163,20 +252,38 @@ class SuperStudentGame:
             except pygame.error:
                 # Fallback for headless - create a surface
                 self.screen = pygame.Surface((self.width, self.height))
-                print("Display unavailable - using virtual surface")
+                logger.info("Display unavailable - using virtual surface")
             
-            self.clock = pygame.time.Clock()
+            self.clock = frame_budget.clock
             
-            print(f"Pygame initialized successfully - Resolution: {self.width}x{self.height}")
-            print(f"Audio mode: {'Silent' if headless_mode else 'Enabled'}")
+            logger.info(f"Pygame initialized successfully - Resolution: {self.width}x{self.height}")
+            logger.info(f"Audio mode: {'Silent' if headless_mode else 'Enabled'}")
             return True
             
         except Exception as e:
-            print(f"Failed to initialize pygame: {e}")
+            logger.error(f"Failed to initialize pygame: {e}")
             return False
     
-    def _detect_headless_environment(self) -> bool:
-        """Detect if we're running in a headless environment."""
+    @property
+    def managers(self) -> dict:
+        """The initialized universal class managers keyed by name."""
+        managers = {}
+        for name in self._MANAGER_NAMES:
+            manager = getattr(self, name)
+            if manager is not None:
+                managers[name] = manager
+        return managers
+    
+    @property
+    def _headless(self) -> bool:
+        """Detect (once per game instance) if we're running in a headless environment."""
+        if self._headless_mode is None:
+            self._headless_mode = self._detect_headless()
+        return self._headless_mode
+    
+    @staticmethod
+    def _detect_headless() -> bool:
+        """Check the environment for signs that no display or audio device is available."""
         # Check for explicit audio driver setting
         if os.environ.get('SDL_AUDIODRIVER') == 'dummy':
             return True
@@ -205,14 +312,23 @@ class SuperStudentGame:
         """
         try:
             # Load display mode preferences
-            self.display_mode = load_display_mode()
+            display_mode = load_display_mode()
+            
+            # The welcome screen calls back here after a mode pick; only
+            # rebuild when the display mode actually changed
+            if self._initialized:
+                if display_mode == self.display_mode:
+                    return True
+                self._release_managers()
+                self._initialized = False
+            self.display_mode = display_mode
             
             # Initialize core resource manager
             self.resource_manager = ResourceManager()
             self.resource_manager.set_display_mode(self.display_mode)
             
-            # Initialize core resources
-            resources = self.resource_manager.initialize_game_resources()
+            # Initialize core resources once and reuse them for every menu/level
+            resources = self.resources = self.resource_manager.initialize_game_resources()
             
             # Initialize particle manager with optimized settings
             max_particles = MAX_PARTICLES[self.display_mode]
@@ -224,121 +340,146 @@ class SuperStudentGame:
             self.sound_effects_manager = SoundEffectsManager()
             
             # Initialize universal class managers
-            self.managers = {
-                'glass_shatter': GlassShatterManager(self.width, self.height, self.particle_manager),
-                'multi_touch': MultiTouchManager(self.width, self.height),
-                'hud': HUDManager(self.width, self.height, resources['small_font'], None),
-                'checkpoint': CheckpointManager(self.width, self.height, resources['fonts'], resources['small_font']),
-                'flamethrower': FlamethrowerManager(),
-                'center_piece': CenterPieceManager(
-                    self.width, self.height, self.display_mode, 
-                    self.particle_manager, MAX_SWIRL_PARTICLES[self.display_mode], 
-                    self.resource_manager
-                )
-            }
+            self.glass_shatter = GlassShatterManager(self.width, self.height, self.particle_manager)
+            self.multi_touch = MultiTouchManager(self.width, self.height)
+            self.hud = HUDManager(self.width, self.height, resources['small_font'], None)
+            self.checkpoint = CheckpointManager(self.width, self.height, resources['fonts'], resources['small_font'])
+            self.flamethrower = FlamethrowerManager()
+            self.center_piece = CenterPieceManager(
+                self.width, self.height, self.display_mode, 
+                self.particle_manager, MAX_SWIRL_PARTICLES[self.display_mode], 
+                self.resource_manager
+            )
             
             # Link managers that need references to each other
-            self.managers['hud'].glass_shatter_manager = self.managers['glass_shatter']
+            self.hud.glass_shatter_manager = self.glass_shatter
+            
+            # Pooled levels hold references to the old managers, so drop them
+            self._level_pool.clear()
+            self._level_resources_pool.clear()
             
             # Save display mode preference
             save_display_mode(self.display_mode)
             
-            print(f"Resources initialized successfully for display mode: {self.display_mode}")
-            print(f"Audio Manager: {'Enabled' if self.audio_manager.enabled else 'Disabled'}")
-            print(f"Sound Effects: {'Enabled' if self.sound_effects_manager.enabled else 'Disabled'}")
+            # A display-mode rebuild inside run() re-freezes the new resources
+            if self._saved_gc_threshold is not None:
+                self._tune_gc()
+            
+            self._initialized = True
+            logger.info(f"Resources initialized successfully for display mode: {self.display_mode}")
+            logger.info(f"Audio Manager: {'Enabled' if self.audio_manager.enabled else 'Disabled'}")
+            logger.info(f"Sound Effects: {'Enabled' if self.sound_effects_manager.enabled else 'Disabled'}")
             
             return True
             
         except Exception as e:
-            print(f"Failed to initialize resources: {e}")
-            traceback.print_exc()
+            logger.exception(f"Failed to initialize resources: {e}")
             return False
     
     def cleanup_resources(self):
         """Thoroughly clean up all resources to prevent memory leaks with enhanced cleanup."""
         try:
-            print("Cleaning up game resources...")
+            logger.info("Cleaning up game resources...")
             
             # Enhanced cleanup with memory pressure monitoring
-            import psutil
-            process = psutil.Process()
-            memory_before = process.memory_info().rss / 1024 / 1024  # MB
-            
-            # Cleanup audio systems
-            if hasattr(self, 'audio_manager') and self.audio_manager:
-                self.audio_manager.cleanup()
-                del self.audio_manager
-                
-            if hasattr(self, 'sound_effects_manager') and self.sound_effects_manager:
-                self.sound_effects_manager.cleanup()
-                del self.sound_effects_manager
-            
-            # Cleanup particle systems with enhanced clearing
-            if hasattr(self, 'particle_manager') and self.particle_manager:
-                if hasattr(self.particle_manager, 'cleanup'):
-                    self.particle_manager.cleanup()
-                else:
-                    # Enhanced fallback cleanup
-                    self.particle_manager.particles.clear()
-                    for particle in self.particle_manager.particle_pool:
-                        particle["active"] = False
-                        # Clear particle data
-                        particle.update({"x": 0, "y": 0, "dx": 0, "dy": 0, "duration": 0})
-                del self.particle_manager
-            
-            # Enhanced manager cleanup
-            for manager_name, manager in self.managers.items():
-                if hasattr(manager, 'cleanup'):
-                    manager.cleanup()
-                # Force deletion of manager references
-                del manager
-            self.managers.clear()
-            
-            # Clear resource manager caches
-            if hasattr(self, 'resource_manager') and self.resource_manager:
-                if hasattr(self.resource_manager, 'font_cache'):
-                    self.resource_manager.font_cache.clear()
-                del self.resource_manager
-            
-            # Aggressive garbage collection
-            gc.collect()
-            gc.collect()  # Call twice for circular references
+            process = self._proc
+            memory_before = process.memory_info().rss / 1024 / 1024 if process else 0.0  # MB
+            
+            self._release_managers()
+            self._initialized = False
+            
+            # Undo _tune_gc's collector threshold
+            if self._saved_gc_threshold is not None:
+                gc.set_threshold(*self._saved_gc_threshold)
+                self._saved_gc_threshold = None
+            
+            # Young generations only; the full collection runs once on exit
+            gc.collect(1)
             
             # Clean up lock file
             self.cleanup_lock_file()
             
             # Memory usage reporting
-            memory_after = process.memory_info().rss / 1024 / 1024  # MB
-            memory_freed = memory_before - memory_after
-            print(f"Resource cleanup completed - Memory freed: {memory_freed:.2f}MB")
+            if process:
+                memory_after = process.memory_info().rss / 1024 / 1024  # MB
+                memory_freed = memory_before - memory_after
+                logger.info(f"Resource cleanup completed - Memory freed: {memory_freed:.2f}MB")
+            else:
+                logger.info("Resource cleanup completed")
             
         except Exception as e:
-            print(f"Error during resource cleanup: {e}")
+            logger.error(f"Error during resource cleanup: {e}")
     
-    def _check_memory_pressure(self) -> bool:
-        """Check if system is under memory pressure and trigger cleanup if needed."""
-        try:
-            import psutil
-            memory = psutil.virtual_memory()
-            
-            # If available memory is less than 20% or we're using > 200MB
-            if memory.percent > 80:
-                print(f"Memory pressure detected: {memory.percent}% used")
-                gc.collect()  # Force garbage collection
-                return True
-                
-            process = psutil.Process()
-            process_memory = process.memory_info().rss / 1024 / 1024  # MB
+    def _release_managers(self):
+        """Clean up and drop the managers created by initialize_resources."""
+        # Audio before particles; every attribute is set in __init__
+        for name in self._cleanup_order:
+            manager = getattr(self, name)
+            if manager is not None:
+                manager.cleanup()
+                setattr(self, name, None)
+        
+        # Universal class managers (not all of them define cleanup)
+        for name in self._MANAGER_NAMES:
+            manager = getattr(self, name)
+            if manager is not None:
+                cleanup = getattr(manager, 'cleanup', None)
+                if cleanup is not None:
+                    cleanup()
+                setattr(self, name, None)
+        
+        # Clear resource manager caches
+        if self.resource_manager is not None:
+            self.resource_manager.clear_caches()
+            self.resource_manager = None
+        self.resources = None
+        
+        # _tune_gc froze these out of the collector; unfreeze so the released
+        # managers and fonts can actually be collected
+        if self._saved_gc_threshold is not None:
+            gc.unfreeze()
+    
+    def _tune_gc(self):
+        """
+        Move the long-lived fonts, surfaces and managers out of the collector's
+        generations so gameplay collections stay short, and collect less often
+        to avoid random mid-frame pauses.
+        
+        Only run() enables this, since it changes process-wide collector state;
+        cleanup_resources restores the previous threshold.
+        """
+        if self._saved_gc_threshold is None:
+            self._saved_gc_threshold = gc.get_threshold()
+        gc.collect()
+        gc.freeze()
+        gc.set_threshold(50000, 10, 10)
+    
+    def _check_memory_pressure(self, force: bool = False) -> bool:
+        """
+        Check if the game is under memory pressure and trigger cleanup if needed.
+        
+        Unforced calls only sample memory every ``_mem_check_interval`` calls so
+        this is cheap enough to call per frame; pass ``force=True`` at natural
+        checkpoints such as level completion.
+        """
+        if self._proc is None:
+            return False  # psutil unavailable, assume no pressure
             
-            if process_memory > 200:  # More than 200MB
-                print(f"High process memory usage: {process_memory:.1f}MB")
-                gc.collect()
-                return True
-                
+        self._mem_check_counter += 1
+        if not force and self._mem_check_counter % self._mem_check_interval:
             return False
             
+        try:
+            process_memory = self._proc.memory_info().rss / 1024 / 1024  # MB
         except Exception:
             return False  # If we can't check, assume no pressure
+            
+        if process_memory > self._mem_limit_mb:
+            logger.warning(f"High process memory usage: {process_memory:.1f}MB")
+            gc.collect()
+            return True
+            
+        return False
     
     def handle_error(self, error: Exception, context: str = "Unknown"):
         """
@@ -350,14 +491,11 @@ class SuperStudentGame:
         """
         self.error_count += 1
         
-        print(f"\n=== ERROR #{self.error_count} in {context} ===")
-        print(f"Error: {error}")
-        print("Traceback:")
-        traceback.print_exc()
-        print("=" * 50)
+        logger.error(f"\n=== ERROR #{self.error_count} in {context} ===\nError: {error}", exc_info=True)
+        logger.error("=" * 50)
         
         if self.error_count >= self.max_errors:
-            print(f"Maximum error count ({self.max_errors}) reached. Shutting down gracefully...")
+            logger.error(f"Maximum error count ({self.max_errors}) reached. Shutting down gracefully...")
             self.running = False
     
     def run_level(self, level_mode: str) -> bool:
@@ -371,42 +509,39 @@ class SuperStudentGame:
             bool: True if level should restart, False otherwise
         """
         try:
-            print(f"\n=== Starting Level: {level_mode} ===")
+            logger.info(f"\n=== Starting Level: {level_mode} ===")
             
-            # Create level resource manager for isolation
-            level_resource_manager = LevelResourceManager(
-                audio_manager=self.audio_manager,
-                sound_effects_manager=self.sound_effects_manager
-            )
+            # Reuse the level resource manager for this mode (isolated per level)
+            level_resource_manager = self._acquire_level_resources(level_mode)
             
-            # Get core resources for level
-            resources = self.resource_manager.initialize_game_resources()
+            # Reuse the core resources built by initialize_resources
+            resources = self.resources
             
             # Common level arguments
             level_args = (
                 self.width, self.height, self.screen,
                 resources['fonts'], resources['small_font'], resources['target_font'],
-                self.particle_manager, self.managers['glass_shatter'], self.managers['multi_touch'],
-                self.managers['hud'], self.managers['checkpoint'], self.managers['center_piece'],
-                self.managers['flamethrower'], level_resource_manager
+                self.particle_manager, self.glass_shatter, self.multi_touch,
+                self.hud, self.checkpoint, self.center_piece,
+                self.flamethrower, level_resource_manager
             )
             
-            # Create and run the appropriate level
-            level_instance = None
-            
+            # Create (or reuse) and run the appropriate level
             if level_mode == "colors":
-                level_instance = ColorsLevel(*level_args)
+                level_class = ColorsLevel
             elif level_mode == "shapes":
-                level_instance = ShapesLevel(*level_args)
+                level_class = ShapesLevel
             elif level_mode == "alphabet":
-                level_instance = AlphabetLevel(*level_args)
+                level_class = AlphabetLevel
             elif level_mode == "numbers":
-                level_instance = NumbersLevel(*level_args)
+                level_class = NumbersLevel
             elif level_mode == "clcase":
-                level_instance = CLCaseLevel(*level_args)
+                level_class = CLCaseLevel
             else:
                 raise ValueError(f"Unknown level mode: {level_mode}")
             
+            level_instance = self._acquire_level(level_class, level_args, level_resource_manager)
+            
             # Run the level
             result = level_instance.run()
             
@@ -414,24 +549,71 @@ class SuperStudentGame:
             level_resource_manager.cleanup()
             
             # Check for memory pressure after level completion
-            if self._check_memory_pressure():
-                print("Performing additional cleanup due to memory pressure")
+            if self._check_memory_pressure(force=True):
+                logger.info("Performing additional cleanup due to memory pressure")
                 gc.collect()
             
-            print(f"Level {level_mode} completed successfully")
+            logger.info(f"Level {level_mode} completed successfully")
             return result
             
         except Exception as e:
             self.handle_error(e, f"Level: {level_mode}")
             return False
     
+    def _acquire_level_resources(self, level_mode: str) -> LevelResourceManager:
+        """
+        Get the pooled LevelResourceManager for a level mode, creating it on first use.
+        
+        Args:
+            level_mode: The game mode/level the resources belong to
+            
+        Returns:
+            LevelResourceManager: A manager reset to a clean state that reuses the
+                game's audio managers instead of building its own
+        """
+        level_resources = self._level_resources_pool.get(level_mode)
+        if level_resources is None:
+            level_resources = LevelResourceManager(
+                level_id=level_mode, width=self.width, height=self.height
+            )
+            self._level_resources_pool[level_mode] = level_resources
+        level_resources.reset(self.audio_manager, self.sound_effects_manager)
+        return level_resources
+    
+    def _acquire_level(self, level_class, level_args, level_resources: LevelResourceManager):
+        """
+        Get the pooled instance of a level class, creating it on first use.
+        
+        Args:
+            level_class: The level class to instantiate
+            level_args: Constructor arguments used when no pooled instance exists
+            level_resources: The pooled resource manager the level runs on
+            
+        Returns:
+            The level instance with its state reset
+        """
+        level_instance = self._level_pool.get(level_class)
+        if level_instance is None:
+            level_instance = level_class(*level_args)
+            self._level_pool[level_class] = level_instance
+            # Keep the effect limits the level configured for its own manager
+            own_resources = getattr(level_instance, 'level_resources', None)
+            if own_resources is not None:
+                level_resources.max_effects = own_resources.max_effects
+        else:
+            level_instance.reset_level_state()
+        # Levels build a standalone manager in __init__ (it holds no audio until
+        # initialize()); run on the pooled one so the game's audio managers are reused
+        level_instance.level_resources = level_resources
+        return level_instance
+    
     def main_loop(self):
         """Main game loop with comprehensive error handling and resource management."""
         try:
             # Show welcome screen and get display mode
             self.display_mode = welcome_screen(
                 self.width, self.height, self.screen, 
-                self.resource_manager.initialize_game_resources()['small_font'],
+                self.resources['small_font'],
                 lambda: self.initialize_resources()
             )
             
@@ -441,7 +623,7 @@ class SuperStudentGame:
                     # Show level selection menu
                     selected_mode = level_menu(
                         self.width, self.height, self.screen,
-                        self.resource_manager.initialize_game_resources()['small_font']
+                        self.resources['small_font']
                     )
                     
                     if selected_mode is None:
@@ -452,11 +634,11 @@ class SuperStudentGame:
                     
                     # Handle level restart for shapes and colors levels
                     while restart_level and selected_mode in ["shapes", "colors"]:
-                        print(f"Restarting level: {selected_mode}")
+                        logger.info(f"Restarting level: {selected_mode}")
                         restart_level = self.run_level(selected_mode)
                         
                 except KeyboardInterrupt:
-                    print("Game interrupted by user")
+                    logger.info("Game interrupted by user")
                     break
                 except Exception as e:
                     self.handle_error(e, "Main Loop")
@@ -468,49 +650,52 @@ class SuperStudentGame:
     
     def run(self):
         """Main entry point for the game."""
+        _start_log_listener()
         try:
-            print("=" * 60)
-            print("SUPER STUDENT 6 - ENHANCED EDITION")
-            print("=" * 60)
+            logger.info("=" * 60)
+            logger.info("SUPER STUDENT 6 - ENHANCED EDITION")
+            logger.info("=" * 60)
             
             # Check for single instance
             if not self.check_single_instance():
-                print("Another instance is already running. Exiting.")
+                logger.warning("Another instance is already running. Exiting.")
                 return 1
             
-            print("Initializing game systems...")
+            logger.info("Initializing game systems...")
             
             # Initialize pygame
             if not self.initialize_pygame():
-                print("Failed to initialize pygame. Exiting.")
+                logger.error("Failed to initialize pygame. Exiting.")
                 return 1
             
             # Initialize game resources
             if not self.initialize_resources():
-                print("Failed to initialize game resources. Exiting.")
+                logger.error("Failed to initialize game resources. Exiting.")
                 return 1
+            self._tune_gc()
                 
-            print("Initialization complete. Starting game...")
+            logger.info("Initialization complete. Starting game...")
             
             # Run main game loop
             self.main_loop()
             
-            print("Game session completed.")
+            logger.info("Game session completed.")
             return 0
             
         except KeyboardInterrupt:
-            print("\nGame interrupted by user")
+            logger.info("\nGame interrupted by user")
             return 0
         except Exception as e:
-            print(f"Critical error: {e}")
-            traceback.print_exc()
+            logger.exception(f"Critical error: {e}")
             return 1
         finally:
             # Always cleanup resources
             self.cleanup_resources()
+            gc.collect(2)
             if pygame.get_init():
                 pygame.quit()
-            print("Game shutdown complete.")
+            logger.info("Game shutdown complete.")
+            _stop_log_listener()
 
 
 def main():
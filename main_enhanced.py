@@ -18,6 +18,7 @@ import traceback
 import os
 import pathlib
 import gc
+import importlib
 from typing import Optional
 
 # Ensure repository root is on sys.path for imports
@@ -29,9 +30,7 @@ if str(_REPO_ROOT) not in sys.path:
 try:
     from settings import *
     from Display_settings import *
-    from universal_class import *
     from welcome_screen import welcome_screen, level_menu
-    from levels import ColorsLevel, ShapesLevel, AlphabetLevel, NumbersLevel, CLCaseLevel
     from utils.resource_manager import ResourceManager
     from utils.particle_system import ParticleManager
     from utils.level_resource_manager import LevelResourceManager
@@ -43,6 +42,29 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Level classes are imported on first use to keep them off the startup path
+_LEVEL_MODULES = {
+    "colors": ("levels.colors_level", "ColorsLevel"),
+    "shapes": ("levels.shapes_level", "ShapesLevel"),
+    "alphabet": ("levels.alphabet_level", "AlphabetLevel"),
+    "numbers": ("levels.numbers_level", "NumbersLevel"),
+    "clcase": ("levels.cl_case_level", "CLCaseLevel"),
+}
+_level_classes = {}
+
+
+def _load_level_class(level_mode: str):
+    """Import (once) and return the level class for a game mode."""
+    level_class = _level_classes.get(level_mode)
+    if level_class is None:
+        if level_mode not in _LEVEL_MODULES:
+            raise ValueError(f"Unknown level mode: {level_mode}")
+        module_name, class_name = _LEVEL_MODULES[level_mode]
+        level_class = getattr(importlib.import_module(module_name), class_name)
+        _level_classes[level_mode] = level_class
+    return level_class
+
+
 class SuperStudentGame:
     """
     Main game controller that manages the entire SS6 application lifecycle.
@@ -109,6 +131,12 @@ class SuperStudentGame:
             bool: True if initialization successful, False otherwise
         """
         try:
+            # Deferred so universal_class is only parsed once resources are needed
+            from universal_class import (
+                GlassShatterManager, MultiTouchManager, HUDManager,
+                CheckpointManager, FlamethrowerManager, CenterPieceManager
+            )
+            
             # Load display mode preferences
             self.display_mode = load_display_mode()
             
@@ -239,21 +267,8 @@ class SuperStudentGame:
                 self.managers['flamethrower'], level_resource_manager
             )
             
-            # Create and run the appropriate level
-            level_instance = None
-            
-            if level_mode == "colors":
-                level_instance = ColorsLevel(*level_args)
-            elif level_mode == "shapes":
-                level_instance = ShapesLevel(*level_args)
-            elif level_mode == "alphabet":
-                level_instance = AlphabetLevel(*level_args)
-            elif level_mode == "numbers":
-                level_instance = NumbersLevel(*level_args)
-            elif level_mode == "clcase":
-                level_instance = CLCaseLevel(*level_args)
-            else:
-                raise ValueError(f"Unknown level mode: {level_mode}")
+            # Create and run the appropriate level (imported on first use)
+            level_instance = _load_level_class(level_mode)(*level_args)
             
             # Run the level
             result = level_instance.run()
@@ -9,12 +9,22 @@ to identify optimization opportunities.
 import os
 import sys
 import time
+import threading
+import tracemalloc
 import psutil
 import gc
+import subprocess
+import atexit
+
+# Headless by default; set these before pygame is imported to override
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
 import pygame
 import cProfile
 import pstats
 import io
+from collections import Counter
 from pathlib import Path
 
 # Add repository root to Python path
@@ -28,6 +38,7 @@ try:
     from utils.resource_manager import ResourceManager
     from utils.audio_manager import AudioManager
     from utils.sound_effects_manager import SoundEffectsManager
+    from utils.surface_cache import make_circle_surf
     from universal_class import (
         GlassShatterManager, MultiTouchManager, HUDManager,
         CheckpointManager, FlamethrowerManager, CenterPieceManager
@@ -45,17 +56,49 @@ class PerformanceAnalyzer:
     def __init__(self):
         self.results = {}
         self.process = psutil.Process()
+        self.sample_interval = 0.001  # Seconds between stack samples
+        self.trace_allocations = True  # Attribute Python heap allocations with tracemalloc
+        
+        # One pygame session shared by every test instead of init/quit per test
+        pygame.init()
+        pygame.mixer.quit()  # Disable audio
+        self.screen = pygame.display.set_mode((800, 600), pygame.HIDDEN)
+        self.font = pygame.font.Font(None, 24)  # Default TTF parsed once, not per test
+        atexit.register(pygame.quit)
         
     def measure_memory_usage(self, func, *args, **kwargs):
-        """Measure memory usage of a function."""
+        """
+        Measure memory usage of a function.
+        
+        Reports the process RSS delta and, when trace_allocations is set, the
+        Python heap delta from tracemalloc along with the source lines that
+        allocated the most. RSS is noisy (page faults, shared mappings) while
+        tracemalloc only counts Python allocations, so both are returned.
+        """
         # Force garbage collection before measurement
         gc.collect()
         mem_before = self.process.memory_info().rss / 1024 / 1024  # MB
         
+        if self.trace_allocations:
+            tracemalloc.start()
+            snapshot_before = tracemalloc.take_snapshot()
+        
         # Execute function
         start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
+        try:
+            result = func(*args, **kwargs)
+            end_time = time.time()
+            
+            top_allocations = []
+            python_alloc_delta = 0.0
+            if self.trace_allocations:
+                snapshot_after = tracemalloc.take_snapshot()
+                stats = snapshot_after.compare_to(snapshot_before, 'lineno')
+                python_alloc_delta = sum(stat.size_diff for stat in stats) / 1024 / 1024  # MB
+                top_allocations = [str(stat) for stat in stats[:10]]
+        finally:
+            if self.trace_allocations:
+                tracemalloc.stop()
         
         # Measure memory after
         mem_after = self.process.memory_info().rss / 1024 / 1024  # MB
@@ -65,7 +108,9 @@ class PerformanceAnalyzer:
             'execution_time': end_time - start_time,
             'memory_before': mem_before,
             'memory_after': mem_after,
-            'memory_delta': mem_after - mem_before
+            'memory_delta': mem_after - mem_before,
+            'python_alloc_delta': python_alloc_delta,
+            'top_allocations': top_allocations
         }
     
     def profile_function(self, func, *args, **kwargs):
@@ -88,6 +133,60 @@ class PerformanceAnalyzer:
             'profile_output': s.getvalue()
         }
     
+    def profile_function_sampled(self, func, *args, **kwargs):
+        """
+        Profile a function by sampling its call stack from a background thread.
+        
+        Unlike cProfile this doesn't instrument every call, so short hot loops
+        run at close to full speed and their timings aren't skewed. Falls back
+        to profile_function when stack sampling isn't supported.
+        """
+        if not hasattr(sys, '_current_frames'):
+            return self.profile_function(func, *args, **kwargs)
+        
+        target_id = threading.get_ident()
+        counts = Counter()
+        samples = 0
+        stop = threading.Event()
+        
+        def sampler():
+            nonlocal samples
+            while not stop.wait(self.sample_interval):
+                frame = sys._current_frames().get(target_id)
+                if frame is None:
+                    continue
+                samples += 1
+                # Count each function once per sample (cumulative time)
+                seen = set()
+                while frame is not None:
+                    code = frame.f_code
+                    key = (code.co_filename, code.co_firstlineno, code.co_name)
+                    if key not in seen:
+                        seen.add(key)
+                        counts[key] += 1
+                    frame = frame.f_back
+        
+        sampler_thread = threading.Thread(target=sampler, name="profile-sampler", daemon=True)
+        sampler_thread.start()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            stop.set()
+            sampler_thread.join()
+        
+        # Format statistics, most frequently sampled first
+        s = io.StringIO()
+        s.write(f"{samples} samples at {self.sample_interval * 1000:.1f}ms intervals\n")
+        for (filename, lineno, name), count in counts.most_common(20):
+            share = 100.0 * count / samples if samples else 0.0
+            s.write(f"  {count:6d} {share:5.1f}%  {name} ({os.path.basename(filename)}:{lineno})\n")
+        
+        return {
+            'result': result,
+            'profile_output': s.getvalue(),
+            'samples': samples
+        }
+    
     def test_particle_system_performance(self):
         """Test particle system performance at different scales."""
         print("=== Testing Particle System Performance ===")
@@ -120,7 +219,7 @@ class PerformanceAnalyzer:
             results[count] = perf_data
             
             print(f"  Time: {perf_data['execution_time']:.3f}s")
-            print(f"  Memory delta: {perf_data['memory_delta']:.2f}MB")
+            print(f"  Memory delta: {perf_data['memory_delta']:.2f}MB (Python heap: {perf_data['python_alloc_delta']:.2f}MB)")
         
         self.results['particle_system'] = results
         return results
@@ -129,128 +228,96 @@ class PerformanceAnalyzer:
         """Test colors level initialization performance."""
         print("=== Testing Colors Level Initialization ===")
         
-        # Initialize pygame without audio to avoid ALSA errors
-        os.environ['SDL_AUDIODRIVER'] = 'dummy'
-        pygame.init()
-        pygame.mixer.quit()  # Disable audio
-        
-        try:
-            # Create minimal test environment
-            width, height = 800, 600
-            screen = pygame.display.set_mode((width, height), pygame.HIDDEN)
-            font = pygame.font.Font(None, 24)
+        # Create minimal test environment on the shared session
+        screen = self.screen
+        width, height = screen.get_size()
+        font = self.font
+        
+        # Create required managers
+        particle_manager = ParticleManager(max_particles=100)
+        glass_shatter = GlassShatterManager(width, height, particle_manager)
+        multi_touch = MultiTouchManager(width, height)
+        hud_manager = HUDManager(width, height, font, None)
+        
+        def init_colors_level():
+            # Create minimal colors level for testing
+            level = ColorsLevel(
+                width=width, height=height, screen=screen, small_font=font,
+                particle_manager=particle_manager,
+                glass_shatter_manager=glass_shatter,
+                multi_touch_manager=multi_touch,
+                hud_manager=hud_manager,
+                mother_radius=50,
+                create_explosion_func=lambda *args: None,
+                checkpoint_screen_func=lambda *args: True,
+                game_over_screen_func=lambda *args: True,
+                explosions_list=[],
+                draw_explosion_func=lambda *args: None
+            )
             
-            # Create required managers
-            particle_manager = ParticleManager(max_particles=100)
-            glass_shatter = GlassShatterManager(width, height, particle_manager)
-            multi_touch = MultiTouchManager(width, height)
-            hud_manager = HUDManager(width, height, font, None)
+            # Initialize level state
+            level.reset_level_state()
             
-            def init_colors_level():
-                # Create minimal colors level for testing
-                level = ColorsLevel(
-                    width=width, height=height, screen=screen, small_font=font,
-                    particle_manager=particle_manager,
-                    glass_shatter_manager=glass_shatter,
-                    multi_touch_manager=multi_touch,
-                    hud_manager=hud_manager,
-                    mother_radius=50,
-                    create_explosion_func=lambda *args: None,
-                    checkpoint_screen_func=lambda *args: True,
-                    game_over_screen_func=lambda *args: True,
-                    explosions_list=[],
-                    draw_explosion_func=lambda *args: None
-                )
-                
-                # Initialize level state
-                level.reset_level_state()
-                
-                # Test spatial grid creation (performance critical)
-                level.dots = []
-                for i in range(60):  # Current optimized dot count
-                    level.dots.append({
-                        'x': i * 10 % width,
-                        'y': i * 10 % height,
-                        'alive': True,
-                        'color': (255, 0, 0)
-                    })
-                
-                # Test grid operations
-                for _ in range(100):  # Simulate game loop iterations
-                    grid = level._create_spatial_grid()
-                    neighbors = level._get_grid_neighbors(400, 300)
-                
-                return level
-            
-            perf_data = self.measure_memory_usage(init_colors_level)
+            # Test dot kinematics and collision detection (performance critical)
+            for i in range(level.MAX_DOTS):  # Current optimized dot count
+                level._spawn_dot(i, i * 10 % width, i * 10 % height, 1)
             
-            print(f"  Initialization time: {perf_data['execution_time']:.3f}s")
-            print(f"  Memory delta: {perf_data['memory_delta']:.2f}MB")
+            # Simulate game loop iterations
+            for _ in range(100):
+                level._update_dots()
+                pairs = level._find_dot_collisions()
             
-            self.results['colors_level_init'] = perf_data
-            return perf_data
-            
-        finally:
-            pygame.quit()
+            return level
+        
+        perf_data = self.measure_memory_usage(init_colors_level)
+        
+        print(f"  Initialization time: {perf_data['execution_time']:.3f}s")
+        print(f"  Memory delta: {perf_data['memory_delta']:.2f}MB (Python heap: {perf_data['python_alloc_delta']:.2f}MB)")
+        for line in perf_data['top_allocations'][:3]:
+            print(f"    {line}")
+        
+        self.results['colors_level_init'] = perf_data
+        return perf_data
     
     def test_surface_caching_performance(self):
         """Test surface caching performance impact."""
         print("=== Testing Surface Caching Performance ===")
         
-        os.environ['SDL_AUDIODRIVER'] = 'dummy'
-        pygame.init()
-        pygame.mixer.quit()
-        
-        try:
-            screen = pygame.display.set_mode((800, 600), pygame.HIDDEN)
+        def test_with_cache():
+            make_circle_surf.cache_clear()
             
-            def test_with_cache():
-                cache = {}
-                surfaces_created = 0
-                
-                # Simulate repeated surface creation with caching
-                for _ in range(1000):
-                    color = (255, 0, 0)
-                    radius = 20
-                    key = (color, radius)
-                    
-                    if key not in cache:
-                        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                        pygame.draw.circle(surf, color, (radius, radius), radius)
-                        cache[key] = surf
-                        surfaces_created += 1
-                
-                return surfaces_created
+            # Simulate repeated surface creation with the shared lru_cache factory
+            for _ in range(1000):
+                make_circle_surf((255, 0, 0), 20)
             
-            def test_without_cache():
-                surfaces_created = 0
-                
-                # Simulate repeated surface creation without caching
-                for _ in range(1000):
-                    color = (255, 0, 0)
-                    radius = 20
-                    
-                    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(surf, color, (radius, radius), radius)
-                    surfaces_created += 1
-                
-                return surfaces_created
-            
-            cached_perf = self.measure_memory_usage(test_with_cache)
-            uncached_perf = self.measure_memory_usage(test_without_cache)
-            
-            print(f"  With cache - Time: {cached_perf['execution_time']:.3f}s, Memory: {cached_perf['memory_delta']:.2f}MB")
-            print(f"  Without cache - Time: {uncached_perf['execution_time']:.3f}s, Memory: {uncached_perf['memory_delta']:.2f}MB")
-            print(f"  Performance improvement: {uncached_perf['execution_time'] / cached_perf['execution_time']:.2f}x faster")
+            return make_circle_surf.cache_info().misses
+        
+        def test_without_cache():
+            surfaces_created = 0
             
-            self.results['surface_caching'] = {
-                'cached': cached_perf,
-                'uncached': uncached_perf,
-                'improvement_factor': uncached_perf['execution_time'] / cached_perf['execution_time']
-            }
+            # Simulate repeated surface creation without caching
+            for _ in range(1000):
+                color = (255, 0, 0)
+                radius = 20
+                
+                surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(surf, color, (radius, radius), radius)
+                surfaces_created += 1
             
-        finally:
-            pygame.quit()
+            return surfaces_created
+        
+        cached_perf = self.measure_memory_usage(test_with_cache)
+        uncached_perf = self.measure_memory_usage(test_without_cache)
+        
+        print(f"  With cache - Time: {cached_perf['execution_time']:.3f}s, Memory: {cached_perf['memory_delta']:.2f}MB")
+        print(f"  Without cache - Time: {uncached_perf['execution_time']:.3f}s, Memory: {uncached_perf['memory_delta']:.2f}MB")
+        print(f"  Performance improvement: {uncached_perf['execution_time'] / cached_perf['execution_time']:.2f}x faster")
+        
+        self.results['surface_caching'] = {
+            'cached': cached_perf,
+            'uncached': uncached_perf,
+            'improvement_factor': uncached_perf['execution_time'] / cached_perf['execution_time']
+        }
     
     def test_audio_manager_performance(self):
         """Test audio manager performance and memory usage."""
@@ -294,26 +361,25 @@ class PerformanceAnalyzer:
         print("=== Testing Import Performance ===")
         
         import_tests = [
-            ('pygame', 'import pygame'),
-            ('settings', 'from settings import *'),
-            ('universal_class', 'from universal_class import *'),
-            ('utils.particle_system', 'from utils.particle_system import ParticleManager'),
-            ('utils.audio_manager', 'from utils.audio_manager import AudioManager'),
-            ('levels.colors_level', 'from levels.colors_level import ColorsLevel'),
+            'pygame',
+            'settings',
+            'universal_class',
+            'utils.particle_system',
+            'utils.audio_manager',
+            'levels.colors_level',
         ]
         
         results = {}
         
-        for module_name, import_statement in import_tests:
-            start_time = time.time()
+        for module_name in import_tests:
             try:
-                exec(import_statement)
-                end_time = time.time()
+                elapsed, modules_loaded = self._time_import(module_name)
                 results[module_name] = {
                     'success': True,
-                    'time': end_time - start_time
+                    'time': elapsed,
+                    'modules_loaded': modules_loaded
                 }
-                print(f"  {module_name}: {results[module_name]['time']:.3f}s")
+                print(f"  {module_name}: {elapsed:.3f}s ({modules_loaded} modules)")
             except Exception as e:
                 results[module_name] = {
                     'success': False,
@@ -325,6 +391,48 @@ class PerformanceAnalyzer:
         self.results['imports'] = results
         return results
     
+    def _time_import(self, module_name):
+        """
+        Time a cold import of a module in a fresh interpreter.
+        
+        Re-importing in this process would re-run module side effects (thread
+        pools, atexit hooks, the shared frame budget, Numba compilation), so
+        each module is imported by its own ``python -X importtime`` child and
+        the timings are read back from its report.
+        
+        Returns:
+            tuple: (seconds, number of modules the import loaded)
+        """
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+            cwd=_REPO_ROOT, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            lines = proc.stderr.strip().splitlines()
+            raise ImportError(lines[-1] if lines else f"import {module_name} failed")
+        
+        # "import time: self [us] | cumulative | imported package", one line per
+        # module in load order with nested imports indented under their parent;
+        # the requested module's top-level line closes its subtree
+        elapsed_us = 0
+        modules_loaded = 0
+        subtree = 0  # Modules loaded since the previous top-level import
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            fields = line[len("import time:"):].split("|")
+            if len(fields) != 3 or not fields[1].strip().isdigit():
+                continue  # Column header
+            package = fields[2].rstrip()[1:]
+            subtree += 1
+            if package.startswith(" "):
+                continue  # Nested import, part of the current subtree
+            if package == module_name:
+                elapsed_us, modules_loaded = int(fields[1]), subtree
+            subtree = 0
+        
+        return elapsed_us / 1e6, modules_loaded
+    
     def generate_report(self):
         """Generate comprehensive performance report."""
         print("\n" + "=" * 60)
@@ -359,8 +467,9 @@ class PerformanceAnalyzer:
             print(f"  Total import time: {total_import_time:.3f}s")
             
             slowest_import = max(
-                (name, data) for name, data in self.results['imports'].items() 
-                if data['success']
+                ((name, data) for name, data in self.results['imports'].items() 
+                 if data['success']),
+                key=lambda item: item[1]['time']
             )[0]
             print(f"  Slowest import: {slowest_import}")
         
@@ -5,22 +5,28 @@ COLORS_COLLISION_DELAY = 250
 LEVEL_PROGRESS_PATH = "level_progress.txt"
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
-FLAME_COLORS = [
+FLAME_COLORS = (
     (255, 69, 0),
     (255, 215, 0),
     (0, 191, 255)
-]
+)
+LASER_WIDTHS = (5, 10, 15)  # Default widths for lasers without their own "widths"
 LASER_EFFECTS = [{
-    "colors": [(255, 0, 0), (255, 128, 0)],
-    "widths": [3, 5],
+    "colors": ((255, 0, 0), (255, 128, 0)),
+    "widths": (3, 5),
     "type": "flamethrower"
 }]
 LETTER_SPAWN_INTERVAL = 60
+# Sequences are immutable and shared; levels copy a group before consuming it
+ALPHABET_SEQ = tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+NUMBERS_SEQ = tuple(str(i) for i in range(1, 11))
+CLCASE_SEQ = tuple("abcdefghijklmnopqrstuvwxyz")
+SHAPES_SEQ = ("Circle", "Square", "Triangle", "Rectangle", "Pentagon")
 SEQUENCES = {
-    "alphabet": list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"),
-    "numbers": [str(i) for i in range(1, 11)],
-    "clcase": list("abcdefghijklmnopqrstuvwxyz"),
-    "shapes": ["Circle", "Square", "Triangle", "Rectangle", "Pentagon"]
+    "alphabet": ALPHABET_SEQ,
+    "numbers": NUMBERS_SEQ,
+    "clcase": CLCASE_SEQ,
+    "shapes": SHAPES_SEQ
 }
-GAME_MODES = ['alphabet', 'numbers', 'clcase', 'shapes', 'colors']
+GAME_MODES = ('alphabet', 'numbers', 'clcase', 'shapes', 'colors')
 GROUP_SIZE = 5
\ No newline at end of file
@@ -7,14 +7,6 @@ are re-exported here to allow the new import path to work immediately.
 
 from __future__ import annotations
 
-# Re-export managers for the transition phase.
-from .managers.multi_touch import MultiTouchManager  # noqa: F401
-from .managers.glass_shatter import GlassShatterManager  # noqa: F401
-from .managers.hud import HUDManager  # noqa: F401
-from .managers.checkpoint import CheckpointManager  # noqa: F401
-from .managers.flamethrower import FlamethrowerManager  # noqa: F401
-from .managers.center_piece import CenterPieceManager  # noqa: F401
-
 __all__ = [
     "GlassShatterManager",
     "HUDManager",
@@ -22,4 +14,16 @@ __all__ = [
     "CheckpointManager",
     "FlamethrowerManager",
     "CenterPieceManager",
-]
\ No newline at end of file
+]
+
+
+# Re-export managers for the transition phase; resolved lazily through the
+# *managers* subpackage so importing *core* stays cheap.
+def __getattr__(name):
+    if name in __all__:
+        from . import managers
+
+        value = getattr(managers, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,18 +9,40 @@ that new-style imports work:
 
 from __future__ import annotations
 
-# Re-import MultiTouchManager from the local module which now owns the
-# implementation.  The remaining managers are still provided by the
-# legacy *universal_class* file until they are migrated.
-
-from .glass_shatter import GlassShatterManager  # noqa: F401
-from .multi_touch import MultiTouchManager  # noqa: F401
-from .hud import HUDManager  # noqa: F401
-from .checkpoint import CheckpointManager  # noqa: F401
-from .flamethrower import FlamethrowerManager  # noqa: F401
-from .center_piece import CenterPieceManager  # noqa: F401
+import importlib
+
+# MultiTouchManager is implemented in the local *multi_touch* module.  The
+# remaining managers are still provided by the legacy *universal_class*
+# file until they are migrated; their modules re-export the legacy classes
+# directly rather than subclassing them, so both import paths name the
+# same class object.
+#
+# Submodules are imported on first attribute access (PEP 562) so importing
+# this package, or one of its modules, doesn't drag in every manager.
+_LAZY = {
+    "GlassShatterManager": ".glass_shatter",
+    "MultiTouchManager": ".multi_touch",
+    "HUDManager": ".hud",
+    "CheckpointManager": ".checkpoint",
+    "FlamethrowerManager": ".flamethrower",
+    "CenterPieceManager": ".center_piece",
+}
 # Remaining legacy exports can be dropped once all managers are migrated.
 
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __all__ = [
     "GlassShatterManager",
     "HUDManager",
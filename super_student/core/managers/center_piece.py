@@ -1,10 +1,17 @@
-"""Center piece manager wrapper (handles swirl / visual centerpiece)."""
+"""Center piece manager (handles swirl / visual centerpiece)."""
 
 from __future__ import annotations
 
-from universal_class import CenterPieceManager as _LegacyCenterPieceManager
 
-class CenterPieceManager(_LegacyCenterPieceManager):
-    """Alias for the legacy CenterPieceManager implementation."""
+def __getattr__(name):
+    # Deferred so importing this module doesn't load *universal_class*
+    # (and pygame with it) until the class is actually needed.
+    if name == "CenterPieceManager":
+        from universal_class import CenterPieceManager
 
-    pass
\ No newline at end of file
+        globals()["CenterPieceManager"] = CenterPieceManager
+        return CenterPieceManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["CenterPieceManager"]
@@ -1,10 +1,17 @@
-"""Checkpoint screen manager wrapper."""
+"""Checkpoint screen manager."""
 
 from __future__ import annotations
 
-from universal_class import CheckpointManager as _LegacyCheckpointManager
 
-class CheckpointManager(_LegacyCheckpointManager):
-    """Alias for the legacy CheckpointManager implementation."""
+def __getattr__(name):
+    # Deferred so importing this module doesn't load *universal_class*
+    # (and pygame with it) until the class is actually needed.
+    if name == "CheckpointManager":
+        from universal_class import CheckpointManager
 
-    pass
\ No newline at end of file
+        globals()["CheckpointManager"] = CheckpointManager
+        return CheckpointManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["CheckpointManager"]
@@ -1,10 +1,17 @@
-"""Flamethrower / laser visual effect manager wrapper."""
+"""Flamethrower / laser visual effect manager."""
 
 from __future__ import annotations
 
-from universal_class import FlamethrowerManager as _LegacyFlamethrowerManager
 
-class FlamethrowerManager(_LegacyFlamethrowerManager):
-    """Alias class providing import path stability."""
+def __getattr__(name):
+    # Deferred so importing this module doesn't load *universal_class*
+    # (and pygame with it) until the class is actually needed.
+    if name == "FlamethrowerManager":
+        from universal_class import FlamethrowerManager
 
-    pass
\ No newline at end of file
+        globals()["FlamethrowerManager"] = FlamethrowerManager
+        return FlamethrowerManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["FlamethrowerManager"]
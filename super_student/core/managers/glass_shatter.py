@@ -1,17 +1,22 @@
 """Glass shatter effect manager.
 
-Implementation migrated from the legacy *universal_class.py* file.  The code
+The implementation still lives in the legacy *universal_class.py* file and
 is re-exported here to allow gradual refactor without breaking existing
 behaviour.
 """
 
 from __future__ import annotations
 
-from universal_class import GlassShatterManager as _LegacyGlassShatterManager
 
+def __getattr__(name):
+    # Deferred so importing this module doesn't load *universal_class*
+    # (and pygame with it) until the class is actually needed.
+    if name == "GlassShatterManager":
+        from universal_class import GlassShatterManager
 
-class GlassShatterManager(_LegacyGlassShatterManager):
-    """Alias for the legacy implementation placed in its new home."""
+        globals()["GlassShatterManager"] = GlassShatterManager
+        return GlassShatterManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    # Inherit everything from the legacy class unchanged.
-    pass
\ No newline at end of file
+
+__all__ = ["GlassShatterManager"]
@@ -1,14 +1,21 @@
 """Heads-up display manager.
 
-Thin wrapper around the legacy implementation while the refactor is in
+Re-exported from the legacy implementation while the refactor is in
 progress.
 """
 
 from __future__ import annotations
 
-from universal_class import HUDManager as _LegacyHUDManager
 
-class HUDManager(_LegacyHUDManager):
-    """Alias class living in the new package namespace."""
+def __getattr__(name):
+    # Deferred so importing this module doesn't load *universal_class*
+    # (and pygame with it) until the class is actually needed.
+    if name == "HUDManager":
+        from universal_class import HUDManager
 
-    pass
\ No newline at end of file
+        globals()["HUDManager"] = HUDManager
+        return HUDManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["HUDManager"]
@@ -5,79 +5,334 @@ Moved from the legacy *universal_class.py* file to its own module.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
+import numpy as np
 import pygame
 
+# Bound once so hot paths skip the attribute lookups on the pygame module
+_FINGERDOWN = pygame.FINGERDOWN
+_FINGERUP = pygame.FINGERUP
+_FINGERMOTION = pygame.FINGERMOTION
+_FINGER_TYPES = (_FINGERDOWN, _FINGERUP, _FINGERMOTION)
+_get_ticks = pygame.time.get_ticks
+
+# Normalized motion smaller than this is treated as a repeat of the last position
+_MOTION_EPSILON = 1e-4
+
+
+def poll_finger_events() -> list[pygame.event.Event]:
+    """Pop only the queued finger events.
+
+    SDL filters by type before any Python `Event` objects are created, so
+    other events cost nothing here; they stay queued for the caller's own
+    `pygame.event.get()`.
+    """
+    return pygame.event.get(_FINGER_TYPES)
+
+
+class _ActiveTouchesView(Mapping):
+    """Live read-only ``{touch_id: (x, y)}`` view over a manager's slots."""
+
+    __slots__ = ("_manager",)
+
+    def __init__(self, manager: "MultiTouchManager"):
+        self._manager = manager
+
+    def __getitem__(self, touch_id):
+        m = self._manager
+        slot = m._slot_of(touch_id)
+        if slot < 0 or not m._active[slot]:
+            raise KeyError(touch_id)
+        x, y = m._xy[slot].tolist()
+        return x, y
+
+    def __iter__(self):
+        m = self._manager
+        return iter(m._fid[m._active.astype(bool)].tolist())
+
+    def __len__(self):
+        return self._manager.get_touch_count()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
 
 class MultiTouchManager:
-    """Manage multi-touch events, coordinate conversion and cooldowns."""
+    """Manage multi-touch events, coordinate conversion and cooldowns.
+
+    Fingers occupy a fixed number of slots stored as parallel arrays, so
+    touch events update values in place instead of churning dicts and
+    tuples.
+    """
+
+    __slots__ = (
+        "width", "height", "_scale",
+        "_fid", "_xy", "_nxy", "_cooldown_until", "_active",
+        "_cooldown_duration", "_frame_ticks", "_up_buf",
+        "_dispatch", "_active_view",
+    )
+
+    MAX_TOUCH_SLOTS = 10
+
+    # Event type -> handler method name, bound per instance in __init__
+    HANDLERS = {
+        _FINGERDOWN: "handle_touch_down",
+        _FINGERUP: "handle_touch_up",
+        _FINGERMOTION: "handle_touch_motion",
+    }
 
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.active_touches: dict[int, tuple[float, float]] = {}
-        self._touch_cooldown: dict[int, int] = {}
+        self._scale = np.array([width, height], dtype=np.float64)  # float64 so batched coords match the handlers
+        n = self.MAX_TOUCH_SLOTS
+        self._fid = np.full(n, -1, dtype=np.int64)  # finger id owning each slot (-1: unused)
+        self._xy = np.zeros((n, 2), dtype=np.float32)
+        self._nxy = np.zeros((n, 2), dtype=np.float32)  # last normalized (event.x, event.y)
+        self._cooldown_until = np.zeros(n, dtype=np.int64)  # tick at which the slot's cooldown expires
+        self._active = np.zeros(n, dtype=np.uint8)
         self._cooldown_duration = 50  # milliseconds
+        self._frame_ticks: int | None = None  # latched by begin_frame(); None reads the live clock
+        self._up_buf = [0, 0.0, 0.0]  # scratch result reused by handle_touch_up()
+        self._dispatch = {etype: getattr(self, name) for etype, name in self.HANDLERS.items()}
+        self._active_view = _ActiveTouchesView(self)
+
+    # ------------------------------------------------------------------
+    # Slot helpers
+    # ------------------------------------------------------------------
+    def _slot_of(self, touch_id: int) -> int:
+        """Return the slot assigned to ``touch_id`` or -1."""
+        hits = np.flatnonzero(self._fid == touch_id)
+        return int(hits[0]) if hits.size else -1
+
+    def _claim_slot(self, touch_id: int) -> int:
+        """Assign an inactive slot to ``touch_id``; -1 when all are in use.
+
+        Never-used slots go first.  Otherwise the lifted finger whose cooldown
+        ends earliest gives up its slot (an expired one whenever possible), so
+        recently lifted fingers keep their re-tap cooldown.
+        """
+        free = np.flatnonzero(self._active == 0)
+        if not free.size:
+            return -1
+        unused = free[self._fid[free] == -1]
+        if unused.size:
+            slot = int(unused[0])
+        else:
+            slot = int(free[np.argmin(self._cooldown_until[free])])
+        self._fid[slot] = touch_id
+        self._cooldown_until[slot] = 0
+        return slot
 
     # ------------------------------------------------------------------
     # Public helpers
     # ------------------------------------------------------------------
     def reset(self) -> None:
         """Clear all stored touches and cooldowns."""
-        self.active_touches.clear()
-        self._touch_cooldown.clear()
+        self._fid.fill(-1)
+        self._active.fill(0)
+        self._cooldown_until.fill(0)
+
+    def begin_frame(self, ticks: int | None = None) -> None:
+        """Latch the tick count used by this frame's touch events.
+
+        Call once per main-loop iteration before handling touches
+        (`pump` does this itself).  Until a frame is latched, handlers read
+        the live tick count instead.
+        """
+        self._frame_ticks = ticks if ticks is not None else _get_ticks()
 
     def handle_touch_down(self, event):
         """Convert a `pygame.FINGERDOWN` event into screen coordinates.
 
         Returns `(touch_id, x, y)` or `None` if the event is suppressed by
-        the cooldown logic.
+        the cooldown logic (or every touch slot is taken).
         """
         touch_id = event.finger_id
         touch_x = event.x * self.width
         touch_y = event.y * self.height
 
-        current_time = pygame.time.get_ticks()
-        if touch_id in self._touch_cooldown and (
-            current_time - self._touch_cooldown[touch_id] < self._cooldown_duration
-        ):
-            return None
+        current_time = self._frame_ticks
+        if current_time is None:
+            current_time = _get_ticks()
+        slot = self._slot_of(touch_id)
+        if slot >= 0:
+            if current_time < self._cooldown_until[slot]:
+                return None
+        else:
+            slot = self._claim_slot(touch_id)
+            if slot < 0:
+                return None
 
-        self._touch_cooldown[touch_id] = current_time
-        self.active_touches[touch_id] = (touch_x, touch_y)
+        self._cooldown_until[slot] = current_time + self._cooldown_duration
+        self._xy[slot] = touch_x, touch_y
+        self._nxy[slot] = event.x, event.y
+        self._active[slot] = 1
         return touch_id, touch_x, touch_y
 
     def handle_touch_up(self, event):
-        """Handle a `pygame.FINGERUP` event."""
+        """Handle a `pygame.FINGERUP` event.
+
+        Returns `[touch_id, x, y]` or `None`.  The list is a reused scratch
+        buffer, valid only until the next call; unpack or copy it.
+        """
         touch_id = event.finger_id
-        if touch_id in self.active_touches:
-            last_pos = self.active_touches.pop(touch_id)
-            return touch_id, last_pos[0], last_pos[1]
+        slot = self._slot_of(touch_id)
+        if slot >= 0 and self._active[slot]:
+            # The slot keeps its finger id so the cooldown still applies to a quick re-tap
+            self._active[slot] = 0
+            buf = self._up_buf
+            buf[0] = touch_id
+            buf[1] = self._xy.item(slot, 0)
+            buf[2] = self._xy.item(slot, 1)
+            return buf
         return None
 
     def handle_touch_motion(self, event):
-        """Handle a `pygame.FINGERMOTION` event."""
+        """Handle a `pygame.FINGERMOTION` event.
+
+        Returns `None` for unknown fingers and for repeats of the position
+        already stored (SDL re-reports stationary fingers).
+        """
         touch_id = event.finger_id
-        if touch_id in self.active_touches:
-            touch_x = event.x * self.width
-            touch_y = event.y * self.height
-            self.active_touches[touch_id] = (touch_x, touch_y)
-            return touch_id, touch_x, touch_y
-        return None
+        slot = self._slot_of(touch_id)
+        if slot < 0 or not self._active[slot]:
+            return None
+        nx, ny = event.x, event.y
+        last_nx, last_ny = self._nxy[slot].tolist()
+        if abs(nx - last_nx) < _MOTION_EPSILON and abs(ny - last_ny) < _MOTION_EPSILON:
+            return None
+        touch_x = nx * self.width
+        touch_y = ny * self.height
+        self._nxy[slot] = nx, ny
+        self._xy[slot] = touch_x, touch_y
+        return touch_id, touch_x, touch_y
+
+    def dispatch(self, event):
+        """Route a touch event to its handler; non-touch events return `None`."""
+        handler = self._dispatch.get(event.type)
+        return handler(event) if handler else None
+
+    # ------------------------------------------------------------------
+    # Batched event handling
+    # ------------------------------------------------------------------
+    @classmethod
+    def coalesce_motion(cls, events):
+        """Return *events* with only the latest `FINGERMOTION` per finger.
+
+        A finger's pending motion is emitted just before its next DOWN/UP
+        so ordering per finger is preserved; the rest go at the end.
+        """
+        coalesced = []
+        latest_motion: dict[int, pygame.event.Event] = {}
+        for event in events:
+            if event.type == _FINGERMOTION:
+                latest_motion[event.finger_id] = event
+                continue
+            if event.type in (_FINGERDOWN, _FINGERUP):
+                pending = latest_motion.pop(event.finger_id, None)
+                if pending is not None:
+                    coalesced.append(pending)
+            coalesced.append(event)
+        coalesced.extend(latest_motion.values())
+        return coalesced
+
+    def pump(self, events):
+        """Handle one frame's worth of events, coalescing finger motion.
+
+        Returns a list of `(event_type, (touch_id, x, y))` for every touch
+        event that was accepted; non-touch events are ignored.
+        """
+        self.begin_frame()
+        dispatch = self._dispatch
+        handled = []
+        motions = []  # Coalesced motions awaiting one batched _flush_motion
+        for event in self.coalesce_motion(events):
+            etype = event.type
+            if etype == _FINGERMOTION:
+                motions.append(event)
+                continue
+            handler = dispatch.get(etype)
+            if handler is None:
+                continue
+            # Apply the motions queued so far so they land before this DOWN/UP
+            if motions:
+                handled.extend(self._flush_motion(motions))
+                motions = []
+            result = handler(event)
+            if result is not None:
+                # tuple() detaches handle_touch_up's scratch buffer
+                handled.append((etype, tuple(result)))
+        if motions:
+            handled.extend(self._flush_motion(motions))
+        # Release the latch so handlers called outside a frame read the live clock
+        self._frame_ticks = None
+        return handled
+
+    def _flush_motion(self, motions):
+        """Apply coalesced motion events for several fingers in one batch."""
+        n = len(motions)
+        fids = np.fromiter((e.finger_id for e in motions), dtype=np.int64, count=n)
+        # (n, slots) match of each event's finger against the active slots
+        match = (fids[:, None] == self._fid[None, :]) & self._active.astype(bool)[None, :]
+        hit = match.any(axis=1)
+        if not hit.any():
+            return []
+        slots = match.argmax(axis=1)[hit]
+        fids = fids[hit]
+
+        norm = np.fromiter(
+            (v for e in motions for v in (e.x, e.y)), dtype=np.float64, count=2 * n
+        ).reshape(-1, 2)[hit]
+        # Drop fingers re-reported at the position already stored
+        moved = (np.abs(norm - self._nxy[slots]) >= _MOTION_EPSILON).any(axis=1)
+        if not moved.all():
+            slots, fids, norm = slots[moved], fids[moved], norm[moved]
+        self._nxy[slots] = norm
+        coords = norm * self._scale
+        self._xy[slots] = coords
+
+        return [
+            (_FINGERMOTION, (fid, x, y))
+            for fid, (x, y) in zip(fids.tolist(), coords.tolist())
+        ]
 
     # ------------------------------------------------------------------
     # Utility getters
     # ------------------------------------------------------------------
     def get_active_touches(self):
-        """Return a *copy* of the active touches dict."""
-        return self.active_touches.copy()
+        """Return a live read-only ``{touch_id: (x, y)}`` view of the active touches."""
+        return self._active_view
+
+    def iter_active(self):
+        """Yield `(touch_id, x, y)` for each active touch, straight from the slots."""
+        mask = self._active.astype(bool)
+        fids = self._fid[mask].tolist()
+        xy = self._xy[mask].tolist()
+        for i in range(len(fids)):
+            x, y = xy[i]
+            yield fids[i], x, y
+
+    def snapshot(self) -> dict:
+        """Return a new ``{touch_id: (x, y)}`` dict the caller may mutate."""
+        mask = self._active.astype(bool)
+        return {
+            fid: (x, y)
+            for fid, (x, y) in zip(self._fid[mask].tolist(), self._xy[mask].tolist())
+        }
 
     def get_touch_count(self) -> int:
-        return len(self.active_touches)
+        return int(np.count_nonzero(self._active))
 
     def is_touch_active(self, touch_id: int) -> bool:
-        return touch_id in self.active_touches
+        slot = self._slot_of(touch_id)
+        return slot >= 0 and bool(self._active[slot])
 
     def clear_touch(self, touch_id: int) -> None:
         """Force-remove a touch (cleanup)."""
-        self.active_touches.pop(touch_id, None)
-        self._touch_cooldown.pop(touch_id, None)
\ No newline at end of file
+        slot = self._slot_of(touch_id)
+        if slot >= 0:
+            self._fid[slot] = -1
+            self._active[slot] = 0
+            self._cooldown_until[slot] = 0
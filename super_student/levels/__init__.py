@@ -13,11 +13,31 @@ work identically.
 
 from __future__ import annotations
 
-from levels.colors_level import ColorsLevel  # type: ignore
-from levels.shapes_level import ShapesLevel  # type: ignore
-from levels.alphabet_level import AlphabetLevel  # type: ignore
-from levels.numbers_level import NumbersLevel  # type: ignore
-from levels.cl_case_level import CLCaseLevel  # type: ignore
+import importlib
+
+# Only one level is active at a time, so each module is imported on first
+# access (PEP 562) instead of all five at package import.
+_LAZY = {
+    "ColorsLevel": "levels.colors_level",
+    "ShapesLevel": "levels.shapes_level",
+    "AlphabetLevel": "levels.alphabet_level",
+    "NumbersLevel": "levels.numbers_level",
+    "CLCaseLevel": "levels.cl_case_level",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(importlib.import_module(module), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "ColorsLevel",
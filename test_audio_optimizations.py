@@ -7,439 +7,298 @@ This script tests all the audio optimizations implemented:
 2. Voice speed reduction (10% slower TTS)
 3. Error handling and graceful degradation
 4. Resource cleanup and memory management
+
+Run with pytest (pygame is initialised once per session in conftest.py),
+or directly as a script.  Set SS6_TEST_VERBOSE=1 for full tracebacks.
 """
 
 import sys
 import os
-import pygame
-import time
-import traceback
+
+import pytest
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from utils.audio_manager import AudioManager
-from utils.sound_effects_manager import SoundEffectsManager, get_sound_effects_manager
+from utils.sound_effects_manager import SoundEffectsManager
 from utils.level_resource_manager import LevelResourceManager
 
 
-class AudioTestSuite:
-    """Comprehensive test suite for SS6 audio optimizations."""
-    
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def audio_manager():
+    """One default AudioManager shared by the whole session."""
+    manager = AudioManager()
+    yield manager
+    manager.cleanup()
+
+
+@pytest.fixture(scope="session")
+def sound_manager():
+    """One default SoundEffectsManager shared by the whole session."""
+    manager = SoundEffectsManager()
+    yield manager
+    manager.cleanup()
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_managers(audio_manager, sound_manager):
+    """Give every test freshly-reset shared managers."""
+    audio_manager.reset()
+    sound_manager.reset()
+
+
+@pytest.fixture
+def make_sound_manager():
+    """Factory for SoundEffectsManagers; every one created is cleaned up."""
+    created = []
+
+    def make(**kwargs):
+        manager = SoundEffectsManager(**kwargs)
+        created.append(manager)
+        return manager
+
+    yield make
+    for manager in created:
+        manager.cleanup()
+
+
+@pytest.fixture
+def level_manager():
+    """A LevelResourceManager for a throwaway level, cleaned up after the test."""
+    manager = LevelResourceManager("test_level", 800, 600)
+    yield manager
+    manager.cleanup()
+
+
+# ----------------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------------
+def test_audio_manager_initialization(audio_manager):
+    """Test AudioManager initialization with optimizations."""
+    # Test that speech rate is optimized (10% slower)
+    expected_rate = int(150 * 0.9)  # 135
+    assert audio_manager.speech_rate == expected_rate, \
+        f"Expected speech rate {expected_rate}, got {audio_manager.speech_rate}"
+
+    # Test initialization success
+    assert audio_manager.mixer_initialized, "AudioManager failed to initialize mixer"
+
+    print(f"✓ Speech rate optimized: {audio_manager.speech_rate} (10% slower than {audio_manager.base_speech_rate})")
+
+
+def test_sound_effects_manager_creation(sound_manager):
+    """Test SoundEffectsManager creation and initialization."""
+    assert sound_manager.enabled, "SoundEffectsManager should be enabled after successful initialization"
+    assert sound_manager.get_sound_count() != 0, "No fart sounds were generated"
+
+    print(f"✓ Generated {sound_manager.get_sound_count()} fart sound variants")
+
+
+@pytest.mark.parametrize("max_sounds", [1, 3, 5])
+def test_fart_sound_generation(make_sound_manager, max_sounds):
+    """Test that the requested number of different fart sounds is generated."""
+    sound_manager = make_sound_manager(max_sounds=max_sounds)
+
+    assert sound_manager.get_sound_count() == max_sounds, \
+        f"Expected {max_sounds} fart sounds, got {sound_manager.get_sound_count()}"
+
+    # Test that sounds can be played (without actually playing)
+    for i in range(max_sounds):
+        assert sound_manager.fart_sounds[i], f"Fart sound {i} is None"
+
+    print(f"✓ All {max_sounds} fart sounds are valid pygame.mixer.Sound objects")
+
+
+def test_fart_sound_variety(sound_manager):
+    """Test that fart sounds rotate through variants."""
+    assert sound_manager.max_sounds == 5
+
+    # Test round-robin rotation
+    initial_rotation = sound_manager.sound_rotation
+
+    # Simulate playing sounds
+    for i in range(10):
+        sound_manager.play_destruction_sound("test")
+        expected_rotation = (initial_rotation + i + 1) % 5
+        assert sound_manager.sound_rotation == expected_rotation, \
+            f"Round-robin not working correctly at iteration {i}"
+
+    print("✓ Round-robin sound rotation working correctly")
+
+
+def test_voice_speed_optimization(audio_manager):
+    """Test that voice speed is properly optimized."""
+    # Test speech rate settings
+    base_rate = audio_manager.base_speech_rate
+    optimized_rate = audio_manager.speech_rate
+    expected_rate = int(base_rate * 0.9)
+
+    assert optimized_rate == expected_rate, \
+        f"Speech rate not optimized correctly: expected {expected_rate}, got {optimized_rate}"
+
+    print(f"✓ Speech rate optimized: {base_rate} → {optimized_rate} (10% reduction)")
+
+    # Test dynamic rate adjustment
+    audio_manager.set_speech_rate(200)
+    assert audio_manager.speech_rate == int(200 * 0.9), "Dynamic speech rate adjustment not working"
+
+    print("✓ Dynamic speech rate adjustment working")
+
+
+def test_audio_manager_reset_restores_settings(audio_manager):
+    """Test that reset() undoes every setting a test can change on the shared manager."""
+    initial = (audio_manager.enabled, audio_manager.tts_method, audio_manager.volume)
+
+    audio_manager.set_enabled(not audio_manager.enabled)
+    audio_manager.set_tts_method("prerecorded")
+    audio_manager.set_volume(0.1)
+    audio_manager.set_speech_rate(200)
+    audio_manager.reset()
+
+    assert (audio_manager.enabled, audio_manager.tts_method, audio_manager.volume) == initial, \
+        "reset() did not restore the initial settings"
+    assert audio_manager.speech_rate == int(150 * 0.9), "reset() did not restore the speech rate"
+
+    print("✓ AudioManager reset restores all settings")
+
+
+def test_level_resource_manager_integration(level_manager):
+    """Test LevelResourceManager integration with audio systems."""
+    assert level_manager.initialize(), "LevelResourceManager failed to initialize"
+
+    assert level_manager.audio_manager, "AudioManager not initialized in LevelResourceManager"
+    assert level_manager.sound_effects_manager, "SoundEffectsManager not initialized in LevelResourceManager"
+
+    print("✓ LevelResourceManager properly integrates both audio systems")
+
+    # Test methods exist and are callable
+    assert hasattr(level_manager, 'play_destruction_sound'), "play_destruction_sound method missing"
+    assert hasattr(level_manager, 'play_target_sound'), "play_target_sound method missing"
+
+    print("✓ All required audio methods are available")
+
+
+def test_error_handling(audio_manager, sound_manager):
+    """Test error handling and recovery mechanisms."""
+    # Test graceful handling of invalid input
+    result = audio_manager.play_pronunciation("")
+    assert result is not None, "play_pronunciation should return boolean, not None"
+
+    # Test graceful handling when disabled
+    sound_manager.set_enabled(False)
+    result = sound_manager.play_destruction_sound("test")
+    assert result is False, "Disabled SoundEffectsManager should return False"
+
+    print("✓ Error handling mechanisms working correctly")
+
+
+def test_graceful_degradation(level_manager):
+    """Test graceful degradation when audio systems fail."""
+    level_manager.initialize()
+
+    # Simulate audio manager failure; should still return True
+    level_manager.audio_manager = None
+    assert level_manager.play_target_sound("test"), \
+        "play_target_sound should gracefully degrade when audio_manager is None"
+
+    # Simulate sound effects manager failure; should still return True
+    level_manager.sound_effects_manager = None
+    assert level_manager.play_destruction_sound("test"), \
+        "play_destruction_sound should gracefully degrade when sound_effects_manager is None"
+
+    print("✓ Graceful degradation working correctly")
+
+
+def test_lazy_audio_failure_degrades(level_manager, monkeypatch):
+    """Test that audio managers failing to build on first use degrade like the eager path."""
+    import utils.level_resource_manager as level_resource_manager
+
+    def unavailable(*args, **kwargs):
+        raise RuntimeError("no audio device")
+
+    monkeypatch.setattr(level_resource_manager, "AudioManager", unavailable)
+    monkeypatch.setattr(level_resource_manager, "SoundEffectsManager", unavailable)
+    assert level_manager.initialize(lazy=True), "Lazy initialization should not build audio managers"
+
+    assert level_manager.play_target_sound("test"), "play_target_sound should continue silently"
+    assert level_manager.play_destruction_sound("test"), "play_destruction_sound should continue silently"
+    assert level_manager.preload_level_sounds(["test"]) == 0, "Nothing should be preloaded without audio"
+    assert level_manager.audio_manager is None
+    assert level_manager.sound_effects_manager is None
+
+    print("✓ Lazy audio failures degrade gracefully")
+
+
+def test_memory_management(make_sound_manager):
+    """Test memory management and cache limits."""
+    # Test AudioManager cache limits
+    audio_manager = AudioManager(cache_limit=5)
+    try:
+        assert audio_manager.cache_limit == 5, "Cache limit not set correctly"
+    finally:
+        audio_manager.cleanup()
+
+    # Test SoundEffectsManager sound limits
+    sound_manager = make_sound_manager(max_sounds=3)
+    assert sound_manager.max_sounds == 3, "Max sounds limit not set correctly"
+    assert sound_manager.get_sound_count() == 3, f"Expected 3 sounds, got {sound_manager.get_sound_count()}"
+
+    print("✓ Memory management and limits working correctly")
+
+
+class _FakeSound:
+    """Stand-in for a cached pygame.mixer.Sound that records stop()."""
+
     def __init__(self):
-        """Initialize the test suite."""
-        self.test_results = {}
-        self.failed_tests = []
-        self.passed_tests = []
-        
-        # Initialize pygame for audio testing
-        pygame.init()
-        pygame.mixer.init()
-        
-        print("=" * 70)
-        print("SS6 AUDIO SYSTEM OPTIMIZATION TEST SUITE")
-        print("=" * 70)
-        print()
-    
-    def run_all_tests(self):
-        """Run all audio system tests."""
-        test_methods = [
-            self.test_audio_manager_initialization,
-            self.test_sound_effects_manager_creation,
-            self.test_fart_sound_generation,
-            self.test_fart_sound_variety,
-            self.test_voice_speed_optimization,
-            self.test_level_resource_manager_integration,
-            self.test_error_handling,
-            self.test_graceful_degradation,
-            self.test_memory_management,
-            self.test_cleanup_functionality
-        ]
-        
-        for test_method in test_methods:
-            try:
-                print(f"Running {test_method.__name__}...")
-                result = test_method()
-                if result:
-                    self.passed_tests.append(test_method.__name__)
-                    print(f"✓ {test_method.__name__} PASSED")
-                else:
-                    self.failed_tests.append(test_method.__name__)
-                    print(f"✗ {test_method.__name__} FAILED")
-            except Exception as e:
-                self.failed_tests.append(test_method.__name__)
-                print(f"✗ {test_method.__name__} FAILED with exception: {e}")
-                traceback.print_exc()
-            print("-" * 50)
-        
-        self.print_summary()
-    
-    def test_audio_manager_initialization(self):
-        """Test AudioManager initialization with optimizations."""
-        try:
-            audio_manager = AudioManager()
-            
-            # Test that speech rate is optimized (10% slower)
-            expected_rate = int(150 * 0.9)  # 135
-            if audio_manager.speech_rate != expected_rate:
-                print(f"Expected speech rate {expected_rate}, got {audio_manager.speech_rate}")
-                return False
-            
-            # Test initialization success
-            if not audio_manager.mixer_initialized:
-                print("AudioManager failed to initialize mixer")
-                return False
-            
-            print(f"✓ Speech rate optimized: {audio_manager.speech_rate} (10% slower than {audio_manager.base_speech_rate})")
-            
-            # Cleanup
-            audio_manager.cleanup()
-            return True
-            
-        except Exception as e:
-            print(f"AudioManager initialization failed: {e}")
-            return False
-    
-    def test_sound_effects_manager_creation(self):
-        """Test SoundEffectsManager creation and initialization."""
-        try:
-            sound_manager = SoundEffectsManager()
-            
-            # Test that it's enabled
-            if not sound_manager.enabled:
-                print("SoundEffectsManager should be enabled after successful initialization")
-                return False
-            
-            # Test that fart sounds were generated
-            if sound_manager.get_sound_count() == 0:
-                print("No fart sounds were generated")
-                return False
-            
-            print(f"✓ Generated {sound_manager.get_sound_count()} fart sound variants")
-            
-            # Cleanup
-            sound_manager.cleanup()
-            return True
-            
-        except Exception as e:
-            print(f"SoundEffectsManager creation failed: {e}")
-            return False
-    
-    def test_fart_sound_generation(self):
-        """Test that 5 different fart sounds are generated."""
-        try:
-            sound_manager = SoundEffectsManager(max_sounds=5)
-            
-            # Check that exactly 5 sounds were generated
-            if sound_manager.get_sound_count() != 5:
-                print(f"Expected 5 fart sounds, got {sound_manager.get_sound_count()}")
-                return False
-            
-            print(f"✓ Successfully generated 5 fart sound variants")
-            
-            # Test that sounds can be played (without actually playing)
-            for i in range(5):
-                if not sound_manager.fart_sounds[i]:
-                    print(f"Fart sound {i} is None")
-                    return False
-            
-            print("✓ All fart sounds are valid pygame.mixer.Sound objects")
-            
-            # Cleanup
-            sound_manager.cleanup()
-            return True
-            
-        except Exception as e:
-            print(f"Fart sound generation test failed: {e}")
-            return False
-    
-    def test_fart_sound_variety(self):
-        """Test that fart sounds rotate through variants."""
-        try:
-            sound_manager = SoundEffectsManager(max_sounds=5)
-            
-            # Test round-robin rotation
-            initial_rotation = sound_manager.sound_rotation
-            
-            # Simulate playing sounds
-            for i in range(10):
-                sound_manager.play_destruction_sound("test")
-                expected_rotation = (initial_rotation + i + 1) % 5
-                if sound_manager.sound_rotation != expected_rotation:
-                    print(f"Round-robin not working correctly at iteration {i}")
-                    return False
-            
-            print("✓ Round-robin sound rotation working correctly")
-            
-            # Cleanup
-            sound_manager.cleanup()
-            return True
-            
-        except Exception as e:
-            print(f"Fart sound variety test failed: {e}")
-            return False
-    
-    def test_voice_speed_optimization(self):
-        """Test that voice speed is properly optimized."""
-        try:
-            audio_manager = AudioManager()
-            
-            # Test speech rate settings
-            base_rate = audio_manager.base_speech_rate
-            optimized_rate = audio_manager.speech_rate
-            expected_rate = int(base_rate * 0.9)
-            
-            if optimized_rate != expected_rate:
-                print(f"Speech rate not optimized correctly: expected {expected_rate}, got {optimized_rate}")
-                return False
-            
-            print(f"✓ Speech rate optimized: {base_rate} → {optimized_rate} (10% reduction)")
-            
-            # Test dynamic rate adjustment
-            audio_manager.set_speech_rate(200)
-            if audio_manager.speech_rate != int(200 * 0.9):
-                print("Dynamic speech rate adjustment not working")
-                return False
-            
-            print("✓ Dynamic speech rate adjustment working")
-            
-            # Cleanup
-            audio_manager.cleanup()
-            return True
-            
-        except Exception as e:
-            print(f"Voice speed optimization test failed: {e}")
-            return False
-    
-    def test_level_resource_manager_integration(self):
-        """Test LevelResourceManager integration with audio systems."""
-        try:
-            level_manager = LevelResourceManager("test_level", 800, 600)
-            
-            if not level_manager.initialize():
-                print("LevelResourceManager failed to initialize")
-                return False
-            
-            # Test that audio_manager is initialized
-            if not level_manager.audio_manager:
-                print("AudioManager not initialized in LevelResourceManager")
-                return False
-            
-            # Test that sound_effects_manager is initialized
-            if not level_manager.sound_effects_manager:
-                print("SoundEffectsManager not initialized in LevelResourceManager")
-                return False
-            
-            print("✓ LevelResourceManager properly integrates both audio systems")
-            
-            # Test methods exist and are callable
-            if not hasattr(level_manager, 'play_destruction_sound'):
-                print("play_destruction_sound method missing")
-                return False
-            
-            if not hasattr(level_manager, 'play_target_sound'):
-                print("play_target_sound method missing")
-                return False
-            
-            print("✓ All required audio methods are available")
-            
-            # Cleanup
-            level_manager.cleanup()
-            return True
-            
-        except Exception as e:
-            print(f"LevelResourceManager integration test failed: {e}")
-            return False
-    
-    def test_error_handling(self):
-        """Test error handling and recovery mechanisms."""
-        try:
-            # Test AudioManager error handling
-            audio_manager = AudioManager()
-            
-            # Test graceful handling of invalid input
-            result = audio_manager.play_pronunciation("")
-            if result is None:
-                print("play_pronunciation should return boolean, not None")
-                return False
-            
-            # Test SoundEffectsManager error handling
-            sound_manager = SoundEffectsManager()
-            
-            # Test graceful handling when disabled
-            sound_manager.set_enabled(False)
-            result = sound_manager.play_destruction_sound("test")
-            if result is not False:
-                print("Disabled SoundEffectsManager should return False")
-                return False
-            
-            print("✓ Error handling mechanisms working correctly")
-            
-            # Cleanup
-            audio_manager.cleanup()
-            sound_manager.cleanup()
-            return True
-            
-        except Exception as e:
-            print(f"Error handling test failed: {e}")
-            return False
-    
-    def test_graceful_degradation(self):
-        """Test graceful degradation when audio systems fail."""
-        try:
-            level_manager = LevelResourceManager("test_level", 800, 600)
-            level_manager.initialize()
-            
-            # Simulate audio manager failure
-            level_manager.audio_manager = None
-            
-            # Should still return True (graceful degradation)
-            result = level_manager.play_target_sound("test")
-            if not result:
-                print("play_target_sound should gracefully degrade when audio_manager is None")
-                return False
-            
-            # Simulate sound effects manager failure
-            level_manager.sound_effects_manager = None
-            
-            # Should still return True (graceful degradation)
-            result = level_manager.play_destruction_sound("test")
-            if not result:
-                print("play_destruction_sound should gracefully degrade when sound_effects_manager is None")
-                return False
-            
-            print("✓ Graceful degradation working correctly")
-            
-            # Cleanup
-            level_manager.cleanup()
-            return True
-            
-        except Exception as e:
-            print(f"Graceful degradation test failed: {e}")
-            return False
-    
-    def test_memory_management(self):
-        """Test memory management and cache limits."""
-        try:
-            # Test AudioManager cache limits
-            audio_manager = AudioManager(cache_limit=5)
-            
-            if audio_manager.cache_limit != 5:
-                print("Cache limit not set correctly")
-                return False
-            
-            # Test SoundEffectsManager sound limits
-            sound_manager = SoundEffectsManager(max_sounds=3)
-            
-            if sound_manager.max_sounds != 3:
-                print("Max sounds limit not set correctly")
-                return False
-            
-            if sound_manager.get_sound_count() != 3:
-                print(f"Expected 3 sounds, got {sound_manager.get_sound_count()}")
-                return False
-            
-            print("✓ Memory management and limits working correctly")
-            
-            # Cleanup
-            audio_manager.cleanup()
-            sound_manager.cleanup()
-            return True
-            
-        except Exception as e:
-            print(f"Memory management test failed: {e}")
-            return False
-    
-    def test_cleanup_functionality(self):
-        """Test that cleanup functions work properly."""
-        try:
-            # Test AudioManager cleanup
-            audio_manager = AudioManager()
-            initial_cache_size = len(audio_manager.sound_cache)
-            
-            # Add something to cache (simulate usage)
-            audio_manager.sound_cache["test"] = None
-            
-            # Cleanup should clear cache
-            audio_manager.cleanup()
-            
-            if len(audio_manager.sound_cache) != 0:
-                print("AudioManager cleanup did not clear cache")
-                return False
-            
-            # Test SoundEffectsManager cleanup
-            sound_manager = SoundEffectsManager()
-            initial_sound_count = sound_manager.get_sound_count()
-            
-            # Cleanup should clear sounds
-            sound_manager.cleanup()
-            
-            if sound_manager.get_sound_count() != 0:
-                print("SoundEffectsManager cleanup did not clear sounds")
-                return False
-            
-            print("✓ Cleanup functionality working correctly")
-            return True
-            
-        except Exception as e:
-            print(f"Cleanup functionality test failed: {e}")
-            return False
-    
-    def print_summary(self):
-        """Print test summary."""
-        print()
-        print("=" * 70)
-        print("TEST SUMMARY")
-        print("=" * 70)
-        print(f"Total tests: {len(self.passed_tests) + len(self.failed_tests)}")
-        print(f"Passed: {len(self.passed_tests)}")
-        print(f"Failed: {len(self.failed_tests)}")
-        print()
-        
-        if self.passed_tests:
-            print("PASSED TESTS:")
-            for test in self.passed_tests:
-                print(f"  ✓ {test}")
-            print()
-        
-        if self.failed_tests:
-            print("FAILED TESTS:")
-            for test in self.failed_tests:
-                print(f"  ✗ {test}")
-            print()
-        
-        success_rate = len(self.passed_tests) / (len(self.passed_tests) + len(self.failed_tests)) * 100
-        print(f"Success Rate: {success_rate:.1f}%")
-        
-        if len(self.failed_tests) == 0:
-            print("\n🎉 ALL TESTS PASSED! Audio optimizations are working correctly.")
-        else:
-            print(f"\n⚠️  {len(self.failed_tests)} test(s) failed. Please review the implementation.")
-        
-        print("=" * 70)
-
-
-def main():
-    """Run the audio test suite."""
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+
+def test_sound_cache_lru_eviction():
+    """Test that the sound cache evicts and stops the least recently used sound."""
+    audio_manager = AudioManager(cache_limit=3)
     try:
-        test_suite = AudioTestSuite()
-        test_suite.run_all_tests()
-        
-        # Return appropriate exit code
-        return 0 if len(test_suite.failed_tests) == 0 else 1
-        
-    except Exception as e:
-        print(f"Test suite failed to run: {e}")
-        traceback.print_exc()
-        return 1
+        sounds = {key: _FakeSound() for key in "abcd"}
+        for key in "abc":
+            audio_manager._add_to_cache(key, sounds[key])
+
+        # A hit makes "a" the most recently used, leaving "b" the oldest
+        assert audio_manager._get_cached("a") is sounds["a"]
+        audio_manager._add_to_cache("d", sounds["d"])
+
+        assert list(audio_manager.sound_cache) == ["c", "a", "d"], "Wrong sound evicted"
+        assert sounds["b"].stopped, "Evicted sound was not stopped"
+        assert not any(sounds[key].stopped for key in "acd"), "Cached sound was stopped"
     finally:
-        # Cleanup pygame
-        try:
-            pygame.quit()
-        except:
-            pass
+        audio_manager.cleanup()
+
+    print("✓ Sound cache evicts least recently used sounds")
+
+
+def test_cleanup_functionality(make_sound_manager):
+    """Test that cleanup functions work properly."""
+    # Uses its own managers: cleanup() would break the shared ones
+    audio_manager = AudioManager()
+
+    # Add something to cache (simulate usage); cleanup should clear it
+    audio_manager.sound_cache["test"] = None
+    audio_manager.cleanup()
+    assert len(audio_manager.sound_cache) == 0, "AudioManager cleanup did not clear cache"
+
+    # Cleanup should clear sounds
+    sound_manager = make_sound_manager()
+    sound_manager.cleanup()
+    assert sound_manager.get_sound_count() == 0, "SoundEffectsManager cleanup did not clear sounds"
+
+    print("✓ Cleanup functionality working correctly")
 
 
 if __name__ == "__main__":
-    exit_code = main()
-    sys.exit(exit_code)
\ No newline at end of file
+    tb = "long" if os.environ.get("SS6_TEST_VERBOSE") == "1" else "line"
+    sys.exit(pytest.main([__file__, "-v", f"--tb={tb}"]))
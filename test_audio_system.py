@@ -15,42 +15,43 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from utils.audio_manager import AudioManager
 from utils.level_resource_manager import LevelResourceManager
 
+# Test data, built once at import
+_ALPHABET_WORDS = ('a', 'b', 'c', 'd', 'e')
+_NUMBER_WORDS = ('one', 'two', 'three')
+_COLOR_WORDS = ('red', 'blue', 'green')
+_PRELOAD_WORDS = ('hello', 'world', 'test')
+_LEVEL_TEST_SOUNDS = ('test', 'sound', 'system')
+
 
 def test_audio_system():
     """Test the audio system functionality."""
     print("=== Testing Audio System ===")
     
-    # Initialize pygame
-    pygame.init()
-    
     try:
         # Test AudioManager initialization
         audio_manager = AudioManager(cache_limit=10)
         print(f"✓ AudioManager initialized: {audio_manager.get_stats()}")
         
         # Test alphabet pronunciation
-        alphabet_words = ['a', 'b', 'c', 'd', 'e']
         print("Testing alphabet pronunciation...")
-        for letter in alphabet_words[:3]:  # Test first 3 letters
+        for letter in _ALPHABET_WORDS[:3]:  # Test first 3 letters
             success = audio_manager.play_pronunciation(letter)
             print(f"  Letter '{letter}': {'✓' if success else '✗'}")
         
         # Test number pronunciation
-        number_words = ['one', 'two', 'three']
         print("Testing number pronunciation...")
-        for number in number_words:
+        for number in _NUMBER_WORDS:
             success = audio_manager.play_pronunciation(number)
             print(f"  Number '{number}': {'✓' if success else '✗'}")
         
         # Test color pronunciation
-        color_words = ['red', 'blue', 'green']
         print("Testing color pronunciation...")
-        for color in color_words:
+        for color in _COLOR_WORDS:
             success = audio_manager.play_pronunciation(color)
             print(f"  Color '{color}': {'✓' if success else '✗'}")
         
         # Test preloading
-        preloaded = audio_manager.preload_sounds(['hello', 'world', 'test'])
+        preloaded = audio_manager.preload_sounds(_PRELOAD_WORDS)
         print(f"✓ Preloaded {preloaded}/3 sounds")
         
         # Test cache stats
@@ -89,8 +90,7 @@ def test_level_resource_manager():
         print("✓ Created 10 test particles")
         
         # Test sound playing
-        test_sounds = ['test', 'sound', 'system']
-        for sound in test_sounds:
+        for sound in _LEVEL_TEST_SOUNDS:
             level_manager.play_target_sound(sound)
         print("✓ Played 3 test sounds")
         
@@ -120,10 +120,10 @@ def test_resource_isolation():
         level2 = LevelResourceManager("numbers", 800, 600)
         level3 = LevelResourceManager("colors", 800, 600)
         
-        # Initialize all
-        level1.initialize()
-        level2.initialize()
-        level3.initialize()
+        # Initialize all (lazily: audio managers are only built if a level plays a sound)
+        level1.initialize(lazy=True)
+        level2.initialize(lazy=True)
+        level3.initialize(lazy=True)
         print("✓ Initialized 3 separate level managers")
         
         # Add different effects to each
@@ -180,6 +180,10 @@ def main():
     print("=" * 50)
     
     try:
+        # Initialize pygame (under pytest, conftest.py has already done this)
+        if not pygame.get_init():
+            pygame.init()
+        
         # Run all tests
         audio_test = test_audio_system()
         resource_test = test_level_resource_manager()
@@ -8,23 +8,57 @@ Tests include initialization, resource management, error handling, and performan
 
 import sys
 import os
-import traceback
 import gc
 import time
+import tracemalloc
 import pygame
 
 # Add project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Level classes are imported once here; test_level_integration reports the outcome
+try:
+    from levels import ColorsLevel, ShapesLevel, AlphabetLevel, NumbersLevel, CLCaseLevel  # noqa: F401
+    _LEVELS_IMPORT_ERROR = None
+except Exception as e:
+    _LEVELS_IMPORT_ERROR = e
+
 
 class MainStabilityTestSuite:
     """Comprehensive test suite for the enhanced main.py stability."""
     
+    # One game (and one pygame/SDL initialization) shared by every test
+    _shared_game = None
+    _pygame_ready = False
+    
+    # Attributes every SuperStudentGame must expose
+    _REQUIRED_GAME_ATTRS = frozenset({
+        'running', 'screen', 'clock', 'width', 'height',
+        'resource_manager', 'particle_manager', 'audio_manager',
+        'sound_effects_manager', 'managers', 'display_mode',
+        'error_count', 'max_errors'
+    })
+    
     def __init__(self):
         """Initialize the test suite."""
+        # Headless drivers, set once before pygame is first initialized
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        
         self.test_results = {}
         self.failed_tests = []
         self.passed_tests = []
+        self.quiet = os.environ.get("SS6_TEST_QUIET") == "1"
+        self._timings: list[tuple[str, bool, float]] = []  # (name, passed, seconds) per test
+        
+        # Suspend cyclic GC for the run; refcounting still frees the short-lived
+        # test objects and print_summary() does a single collection at the end
+        self._old_gc_threshold = gc.get_threshold()
+        gc.disable()
+        # Move everything loaded so far (modules, levels) out of the collector's view
+        gc.collect()
+        gc.freeze()
+        self._frozen_at_start = gc.get_freeze_count()
         
         print("=" * 70)
         print("SS6 MAIN.PY STABILITY TEST SUITE")
@@ -33,7 +67,12 @@ class MainStabilityTestSuite:
     
     def run_test(self, test_name: str, test_func):
         """Run a single test with error handling and timing."""
-        print(f"Running {test_name}...")
+        # Result lines are collected and written once; SS6_TEST_QUIET=1 keeps only failures
+        header = f"Running {test_name}..."
+        if not self.quiet:
+            # Written up front so the test's own output appears under it
+            sys.stdout.write(header + "\n")
+        out = []
         start_time = time.time()
         
         try:
@@ -41,25 +80,29 @@ class MainStabilityTestSuite:
             end_time = time.time()
             
             if result:
-                print(f"✓ {test_name} PASSED ({end_time - start_time:.2f}s)")
+                out.append(f"✓ {test_name} PASSED ({end_time - start_time:.2f}s)")
                 self.passed_tests.append(test_name)
                 self.test_results[test_name] = True
             else:
-                print(f"✗ {test_name} FAILED ({end_time - start_time:.2f}s)")
+                out.append(f"✗ {test_name} FAILED ({end_time - start_time:.2f}s)")
                 self.failed_tests.append(test_name)
                 self.test_results[test_name] = False
                 
         except Exception as e:
             end_time = time.time()
-            print(f"✗ {test_name} FAILED with exception ({end_time - start_time:.2f}s)")
-            print(f"   Error: {e}")
+            out.append(f"✗ {test_name} FAILED with exception ({end_time - start_time:.2f}s)")
+            out.append(f"   Error: {e}")
             self.failed_tests.append(test_name)
             self.test_results[test_name] = False
         
-        print("-" * 50)
+        self._timings.append((test_name, self.test_results[test_name], end_time - start_time))
         
-        # Force garbage collection between tests
-        gc.collect()
+        if self.quiet:
+            if self.test_results[test_name]:
+                return
+            out.insert(0, header)
+        out.append("-" * 50)
+        sys.stdout.write("\n".join(out) + "\n")
     
     def test_main_import(self) -> bool:
         """Test that main.py imports without errors."""
@@ -70,24 +113,30 @@ class MainStabilityTestSuite:
             print(f"Import error: {e}")
             return False
     
+    def _game(self):
+        """Return the SuperStudentGame shared by the tests, creating it on first use.
+        
+        Creating the game and initializing pygame/SDL costs hundreds of ms, so it
+        happens once per suite; tests reset whatever state they mutate.
+        """
+        cls = MainStabilityTestSuite
+        if cls._shared_game is None:
+            from main import SuperStudentGame
+            game = SuperStudentGame()
+            cls._pygame_ready = game.initialize_pygame()
+            cls._shared_game = game
+        return cls._shared_game
+    
     def test_superstudent_game_class(self) -> bool:
         """Test SuperStudentGame class initialization."""
         try:
-            from main import SuperStudentGame
-            game = SuperStudentGame()
+            game = self._game()
             
-            # Verify essential attributes exist
-            required_attrs = [
-                'running', 'screen', 'clock', 'width', 'height',
-                'resource_manager', 'particle_manager', 'audio_manager',
-                'sound_effects_manager', 'managers', 'display_mode',
-                'error_count', 'max_errors'
-            ]
-            
-            for attr in required_attrs:
-                if not hasattr(game, attr):
-                    print(f"Missing attribute: {attr}")
-                    return False
+            # Verify essential attributes exist (dir() also lists properties)
+            missing = self._REQUIRED_GAME_ATTRS - set(dir(game))
+            if missing:
+                print(f"Missing attributes: {sorted(missing)}")
+                return False
             
             return True
             
@@ -98,17 +147,10 @@ class MainStabilityTestSuite:
     def test_pygame_initialization(self) -> bool:
         """Test pygame initialization using SuperStudentGame's improved method."""
         try:
-            # Set headless environment variables for testing
-            os.environ['SDL_VIDEODRIVER'] = 'dummy'
-            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+            game = self._game()
             
-            from main import SuperStudentGame
-            game = SuperStudentGame()
-            
-            # Test the improved initialization method
-            success = game.initialize_pygame()
-            
-            if not success:
+            # The improved initialization method ran when the game was created
+            if not self._pygame_ready:
                 print("Pygame initialization returned False")
                 return False
             
@@ -130,23 +172,14 @@ class MainStabilityTestSuite:
         except Exception as e:
             print(f"Pygame initialization error: {e}")
             return False
-        finally:
-            if 'SDL_VIDEODRIVER' in os.environ:
-                del os.environ['SDL_VIDEODRIVER']
     
     def test_resource_initialization(self) -> bool:
         """Test resource initialization using improved methods."""
         try:
-            # Set headless environment for testing
-            os.environ['SDL_VIDEODRIVER'] = 'dummy'
-            os.environ['SDL_AUDIODRIVER'] = 'dummy'
-            
-            from main import SuperStudentGame
-            
-            game = SuperStudentGame()
+            game = self._game()
             
             # Use the improved initialization methods
-            if not game.initialize_pygame():
+            if not self._pygame_ready:
                 print("Failed to initialize pygame")
                 return False
                 
@@ -169,19 +202,13 @@ class MainStabilityTestSuite:
         except Exception as e:
             print(f"Resource initialization error: {e}")
             return False
-        finally:
-            # Clean up environment variables
-            for var in ['SDL_VIDEODRIVER', 'SDL_AUDIODRIVER']:
-                if var in os.environ:
-                    del os.environ[var]
     
     def test_error_handling(self) -> bool:
         """Test error handling mechanisms."""
+        game = self._game()
+        game.error_count = 0
+        game.running = True
         try:
-            from main import SuperStudentGame
-            
-            game = SuperStudentGame()
-            
             # Test error handling method
             test_error = ValueError("Test error")
             game.handle_error(test_error, "Test Context")
@@ -205,20 +232,18 @@ class MainStabilityTestSuite:
         except Exception as e:
             print(f"Error handling test error: {e}")
             return False
+        finally:
+            # Leave the shared game usable for the remaining tests
+            game.error_count = 0
+            game.running = True
     
     def test_cleanup_functionality(self) -> bool:
         """Test resource cleanup functionality using improved methods."""
         try:
-            # Set headless environment for testing
-            os.environ['SDL_VIDEODRIVER'] = 'dummy'
-            os.environ['SDL_AUDIODRIVER'] = 'dummy'
-            
-            from main import SuperStudentGame
-            
-            game = SuperStudentGame()
+            game = self._game()
             
             # Initialize using improved methods
-            if not game.initialize_pygame():
+            if not self._pygame_ready:
                 return False
                 
             if not game.initialize_resources():
@@ -232,45 +257,32 @@ class MainStabilityTestSuite:
         except Exception as e:
             print(f"Cleanup test error: {e}")
             return False
-        finally:
-            # Clean up environment variables
-            for var in ['SDL_VIDEODRIVER', 'SDL_AUDIODRIVER']:
-                if var in os.environ:
-                    del os.environ[var]
     
     def test_memory_efficiency(self) -> bool:
         """Test memory usage and efficiency with improved methods."""
         try:
-            import psutil
-            process = psutil.Process()
-            
-            # Measure initial memory
-            initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-            
-            # Set headless environment for testing
-            os.environ['SDL_VIDEODRIVER'] = 'dummy'
-            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+            game = self._game()
+            if not self._pygame_ready:
+                return False
             
-            from main import SuperStudentGame
+            # Python-level allocations only; no syscalls or allocator noise
+            tracemalloc.start()
             
-            # Create and initialize game using improved methods
-            game = SuperStudentGame()
+            # Measure initial memory
+            initial_memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024  # MB
             
-            if not game.initialize_pygame():
-                return False
-                
             if not game.initialize_resources():
                 return False
             
             # Measure memory after initialization
-            after_init_memory = process.memory_info().rss / 1024 / 1024  # MB
+            after_init_memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024  # MB
             
             # Cleanup
             game.cleanup_resources()
             gc.collect()
             
             # Measure memory after cleanup
-            after_cleanup_memory = process.memory_info().rss / 1024 / 1024  # MB
+            after_cleanup_memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024  # MB
             
             print(f"   Initial: {initial_memory:.1f}MB")
             print(f"   After init: {after_init_memory:.1f}MB")
@@ -284,37 +296,91 @@ class MainStabilityTestSuite:
             
             return True
             
-        except ImportError:
-            print("   psutil not available, skipping memory test")
-            return True
         except Exception as e:
             print(f"Memory test error: {e}")
             return False
         finally:
-            # Clean up environment variables
-            for var in ['SDL_VIDEODRIVER', 'SDL_AUDIODRIVER']:
-                if var in os.environ:
-                    del os.environ[var]
+            # Release the tracer's own bookkeeping
+            tracemalloc.stop()
     
-    def test_level_integration(self) -> bool:
-        """Test level class integration."""
+    def test_level_resources_reuse_audio(self) -> bool:
+        """Test that running a level mode again reuses the game's audio managers."""
+        import main
+        import utils.level_resource_manager as level_resource_manager
+        
+        class StubLevel:
+            """Stands in for ColorsLevel: real levels block in their event loop."""
+            def __init__(self, *args):
+                self.level_resources = None
+            
+            def reset_level_state(self):
+                pass
+            
+            def run(self):
+                self.level_resources.initialize()
+                return False
+        
+        real_audio_manager = level_resource_manager.AudioManager
+        created = []
+        
+        class CountingAudioManager(real_audio_manager):
+            def __init__(self, *args, **kwargs):
+                created.append(self)
+                super().__init__(*args, **kwargs)
+        
+        game = self._game()
+        if not self._pygame_ready:
+            return False
+        
+        real_colors_level = main.ColorsLevel
+        level_resource_manager.AudioManager = CountingAudioManager
+        main.ColorsLevel = StubLevel
         try:
-            from main import SuperStudentGame
-            from levels import ColorsLevel, ShapesLevel, AlphabetLevel, NumbersLevel, CLCaseLevel
+            if not game.initialize_resources():
+                return False
             
-            # Verify all level classes are importable
-            level_classes = [ColorsLevel, ShapesLevel, AlphabetLevel, NumbersLevel, CLCaseLevel]
+            errors_before = game.error_count
+            game.run_level("colors")
+            after_first_run = len(created)
+            game.run_level("colors")
             
-            for level_class in level_classes:
-                if not level_class:
-                    print(f"Failed to import {level_class}")
-                    return False
+            # run_level reports failures through handle_error instead of raising
+            if game.error_count != errors_before:
+                print("run_level failed")
+                return False
+            level = game._level_pool[StubLevel]
+            if level.level_resources is not game._level_resources_pool["colors"]:
+                print("Level did not run on the pooled LevelResourceManager")
+                return False
+            if len(created) != after_first_run:
+                print(f"Second run built {len(created) - after_first_run} new AudioManager(s)")
+                return False
             
             return True
             
         except Exception as e:
-            print(f"Level integration error: {e}")
+            print(f"Level resource reuse error: {e}")
+            return False
+        finally:
+            main.ColorsLevel = real_colors_level
+            level_resource_manager.AudioManager = real_audio_manager
+            game._level_pool.pop(StubLevel, None)
+            game.cleanup_resources()
+    
+    def test_import_objects_stay_frozen(self) -> bool:
+        """Test that the resource init/cleanup cycles left the suite's import-time freeze intact."""
+        frozen = gc.get_freeze_count()
+        if frozen < self._frozen_at_start:
+            print(f"Frozen objects dropped from {self._frozen_at_start} to {frozen}")
             return False
+        return True
+    
+    def test_level_integration(self) -> bool:
+        """Test level class integration."""
+        if _LEVELS_IMPORT_ERROR is not None:
+            print(f"Level integration error: {_LEVELS_IMPORT_ERROR}")
+            return False
+        return True
     
     def run_all_tests(self):
         """Run all stability tests."""
@@ -326,51 +392,78 @@ class MainStabilityTestSuite:
             ("test_error_handling", self.test_error_handling),
             ("test_cleanup_functionality", self.test_cleanup_functionality),
             ("test_memory_efficiency", self.test_memory_efficiency),
+            ("test_level_resources_reuse_audio", self.test_level_resources_reuse_audio),
             ("test_level_integration", self.test_level_integration),
+            ("test_import_objects_stay_frozen", self.test_import_objects_stay_frozen),
         ]
         
-        for test_name, test_func in test_methods:
+        # Every later test needs main.py; if it can't be imported, fail them without running
+        first_name, first_func = test_methods[0]
+        self.run_test(first_name, first_func)
+        if not self.test_results.get(first_name, False):
+            for test_name, _ in test_methods[1:]:
+                self.test_results[test_name] = False
+                self.failed_tests.append(test_name)
+            print("Skipping remaining tests: main.py failed to import")
+            return
+        
+        for test_name, test_func in test_methods[1:]:
             self.run_test(test_name, test_func)
-            time.sleep(0.1)  # Brief pause between tests
     
     def print_summary(self):
         """Print test summary."""
+        # Single teardown for the pygame init shared by the tests
+        MainStabilityTestSuite._shared_game = None
+        pygame.quit()
+        
+        # Restore the collector suspended in __init__ and collect once
+        gc.unfreeze()
+        gc.set_threshold(*self._old_gc_threshold)
+        gc.enable()
+        gc.collect()
+        
         total_tests = len(self.test_results)
         passed_count = len(self.passed_tests)
         failed_count = len(self.failed_tests)
         
-        print("=" * 70)
-        print("STABILITY TEST SUMMARY")
-        print("=" * 70)
-        print(f"Total tests: {total_tests}")
-        print(f"Passed: {passed_count}")
-        print(f"Failed: {failed_count}")
-        print()
+        out = [
+            "=" * 70,
+            "STABILITY TEST SUMMARY",
+            "=" * 70,
+            f"Total tests: {total_tests}",
+            f"Passed: {passed_count}",
+            f"Failed: {failed_count}",
+            "",
+        ]
         
         if self.passed_tests:
-            print("PASSED TESTS:")
-            for test in self.passed_tests:
-                print(f"  ✓ {test}")
-            print()
+            out.append("PASSED TESTS:")
+            out.extend(f"  ✓ {test}" for test in self.passed_tests)
+            out.append("")
         
         if self.failed_tests:
-            print("FAILED TESTS:")
-            for test in self.failed_tests:
-                print(f"  ✗ {test}")
-            print()
+            out.append("FAILED TESTS:")
+            out.extend(f"  ✗ {test}" for test in self.failed_tests)
+            out.append("")
         
         success_rate = (passed_count / total_tests) * 100 if total_tests > 0 else 0
-        print(f"Success Rate: {success_rate:.1f}%")
-        print()
+        out.append(f"Success Rate: {success_rate:.1f}%")
+        out.append("")
         
         if success_rate >= 80:
-            print("🎉 Main.py is STABLE and ready for production use!")
+            out.append("🎉 Main.py is STABLE and ready for production use!")
         elif success_rate >= 60:
-            print("⚠️  Main.py has some issues but is mostly functional.")
+            out.append("⚠️  Main.py has some issues but is mostly functional.")
         else:
-            print("❌ Main.py has significant stability issues that need addressing.")
+            out.append("❌ Main.py has significant stability issues that need addressing.")
         
-        print("=" * 70)
+        out.append("=" * 70)
+        
+        # Machine-readable timings for CI: name,passed,seconds per test on one line
+        out.append("TIMINGS," + ",".join(f"{n},{ok},{t:.4f}" for n, ok, t in self._timings))
+        
+        # One write for the whole summary instead of a print per line
+        sys.stdout.write("\n".join(out) + "\n")
         
         return success_rate >= 80
 
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+SS6 Multi-Touch Manager Test Suite
+
+Covers the slot-array MultiTouchManager: finger down/up/motion handling,
+the re-tap cooldown and the batched pump() path.
+
+Run with pytest, or directly as a script.
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from super_student.core.managers import multi_touch
+from super_student.core.managers.multi_touch import MultiTouchManager
+
+
+def _finger(etype, finger_id, x=0.5, y=0.5):
+    """Stand-in for a pygame finger event; handlers only read these attributes."""
+    return SimpleNamespace(type=etype, finger_id=finger_id, x=x, y=y)
+
+
+@pytest.fixture
+def ticks(monkeypatch):
+    """Controllable replacement for pygame.time.get_ticks."""
+    clock = [1000]
+    monkeypatch.setattr(multi_touch, "_get_ticks", lambda: clock[0])
+    return clock
+
+
+@pytest.fixture
+def manager():
+    return MultiTouchManager(800, 600)
+
+
+# ----------------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("via_dispatch", [False, True])
+def test_retap_after_cooldown_without_begin_frame(manager, ticks, via_dispatch):
+    """A reused finger id taps again once the cooldown has passed, even with no frame latched."""
+    def down(fid):
+        event = _finger(pygame.FINGERDOWN, fid)
+        return manager.dispatch(event) if via_dispatch else manager.handle_touch_down(event)
+
+    def up(fid):
+        event = _finger(pygame.FINGERUP, fid)
+        return manager.dispatch(event) if via_dispatch else manager.handle_touch_up(event)
+
+    assert down(1) == (1, 400.0, 300.0)
+    assert up(1) is not None
+
+    # A re-tap inside the cooldown is suppressed...
+    ticks[0] += 10
+    assert down(1) is None
+
+    # ...and accepted once it has expired
+    ticks[0] += 100
+    assert down(1) == (1, 400.0, 300.0)
+    assert manager.is_touch_active(1)
+
+
+def test_retap_cooldown_survives_another_finger_down(manager, ticks):
+    """A lifted finger's slot is not handed to a new finger while its cooldown runs."""
+    assert manager.handle_touch_down(_finger(pygame.FINGERDOWN, 1)) is not None
+    assert manager.handle_touch_up(_finger(pygame.FINGERUP, 1)) is not None
+
+    # Finger 2 lands on a fresh slot, so finger 1's quick re-tap is still suppressed
+    ticks[0] += 10
+    assert manager.handle_touch_down(_finger(pygame.FINGERDOWN, 2)) is not None
+    assert manager.handle_touch_down(_finger(pygame.FINGERDOWN, 1)) is None
+
+
+def test_full_slots_reuse_expired_cooldown_first(manager, ticks):
+    """With no unused slot left, a finger whose cooldown expired is evicted before a recent one."""
+    n = manager.MAX_TOUCH_SLOTS
+    for fid in range(n):
+        manager.handle_touch_down(_finger(pygame.FINGERDOWN, fid))
+    ticks[0] += 100
+    for fid in range(n):
+        manager.handle_touch_up(_finger(pygame.FINGERUP, fid))
+
+    # Finger 0 (slot 0) re-taps, so only its cooldown is still running
+    assert manager.handle_touch_down(_finger(pygame.FINGERDOWN, 0)) is not None
+    manager.handle_touch_up(_finger(pygame.FINGERUP, 0))
+
+    ticks[0] += 10
+    assert manager.handle_touch_down(_finger(pygame.FINGERDOWN, n)) is not None
+    assert manager.handle_touch_down(_finger(pygame.FINGERDOWN, 0)) is None
+
+
+def test_pump_releases_frame_latch(manager, ticks):
+    """Handlers called after pump() read the live clock, not the pumped frame's ticks."""
+    manager.pump([_finger(pygame.FINGERDOWN, 3), _finger(pygame.FINGERUP, 3)])
+
+    ticks[0] += 100
+    assert manager.handle_touch_down(_finger(pygame.FINGERDOWN, 3)) is not None
+
+
+def test_pump_coalesces_motion(manager, ticks):
+    """Only each finger's latest motion is applied, ahead of that finger's DOWN/UP."""
+    manager.handle_touch_down(_finger(pygame.FINGERDOWN, 1, 0.1, 0.1))
+    manager.handle_touch_down(_finger(pygame.FINGERDOWN, 2, 0.2, 0.2))
+
+    handled = manager.pump([
+        _finger(pygame.FINGERMOTION, 1, 0.25, 0.25),
+        _finger(pygame.FINGERMOTION, 2, 0.375, 0.375),
+        _finger(pygame.FINGERMOTION, 1, 0.5, 0.5),
+        _finger(pygame.FINGERUP, 1),
+        _finger(pygame.FINGERMOTION, 2, 0.75, 0.75),
+    ])
+
+    assert handled == [
+        (pygame.FINGERMOTION, (1, 400.0, 300.0)),
+        (pygame.FINGERUP, (1, 400.0, 300.0)),
+        (pygame.FINGERMOTION, (2, 600.0, 450.0)),
+    ]
+
+
+def test_pump_motion_matches_handler(manager, ticks):
+    """Batched motion returns exactly the coordinates handle_touch_motion would."""
+    other = MultiTouchManager(800, 600)
+    for m in (manager, other):
+        m.handle_touch_down(_finger(pygame.FINGERDOWN, 7, 0.1, 0.1))
+
+    motion = _finger(pygame.FINGERMOTION, 7, 0.123, 0.456)
+    assert manager.pump([motion]) == [(pygame.FINGERMOTION, other.handle_touch_motion(motion))]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
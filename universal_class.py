@@ -4,6 +4,7 @@ import math
 from settings import (
     WHITE, BLACK, FLAME_COLORS
 )
+from utils.surface_cache import make_circle_surf
 
 class MultiTouchManager:
     """
@@ -848,6 +849,9 @@ class FlamethrowerManager:
     Handles flamethrower creation, drawing, and animation.
     """
     
+    # Default flame widths, shared by every flamethrower that doesn't pass its own
+    DEFAULT_WIDTHS = (20, 30, 40)
+    
     def __init__(self):
         """Initialize the flamethrower manager."""
         self.flamethrowers = []
@@ -868,7 +872,7 @@ class FlamethrowerManager:
         if colors is None:
             colors = FLAME_COLORS
         if widths is None:
-            widths = [20, 30, 40]
+            widths = self.DEFAULT_WIDTHS
             
         self.flamethrowers.append({
             "start_pos": (start_x, start_y),
@@ -881,16 +885,14 @@ class FlamethrowerManager:
         
     def update(self):
         """Update all active flamethrowers."""
-        flamethrowers_to_remove = []
-        
+        if not self.flamethrowers:
+            return
+            
         for flamethrower in self.flamethrowers:
             flamethrower["duration"] -= 1
-            if flamethrower["duration"] <= 0:
-                flamethrowers_to_remove.append(flamethrower)
                 
-        # Remove expired flamethrowers
-        for flamethrower in flamethrowers_to_remove:
-            self.flamethrowers.remove(flamethrower)
+        # Remove expired flamethrowers in a single pass
+        self.flamethrowers = [f for f in self.flamethrowers if f["duration"] > 0]
             
     def draw(self, screen, offset_x=0, offset_y=0):
         """
@@ -927,6 +929,10 @@ class FlamethrowerManager:
         if distance == 0:
             return
             
+        # Palettes are always set by create_flamethrower, so index them directly
+        widths = flamethrower["widths"]
+        colors = flamethrower["colors"]
+        
         # Draw flame circles along the line
         num_circles = max(1, int(distance // 15))  # Circle every 15 pixels, minimum 1
         for i in range(num_circles):
@@ -938,9 +944,9 @@ class FlamethrowerManager:
             circle_y = int(start_y + t * dy)
             
             # Vary circle size and color
-            base_radius = random.choice(flamethrower.get("widths", [20, 30, 40])) // 4
+            base_radius = random.choice(widths) // 4
             radius = max(1, base_radius + random.randint(-5, 5))  # Ensure minimum radius of 1
-            color = random.choice(flamethrower.get("colors", FLAME_COLORS))
+            color = random.choice(colors)
             
             # Add some randomness to position for flame effect
             jitter_x = random.randint(-8, 8)
@@ -951,8 +957,7 @@ class FlamethrowerManager:
             
             # Draw glow effect
             if glow_radius > 0:
-                glow_surface = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surface, (*color, 100), (glow_radius, glow_radius), glow_radius)
+                glow_surface = make_circle_surf((*color, 100), glow_radius)
                 screen.blit(glow_surface, (circle_x + jitter_x - glow_radius, circle_y + jitter_y - glow_radius))
             
             # Draw main flame circle
@@ -1240,8 +1245,10 @@ class CenterPieceManager:
         
     def _draw_text_target_fallback(self, screen, target_letter, mode, center_x, center_y, center_target_color):
         """Fallback text rendering method (original implementation)."""
-        # Create font (size 900 as in original)
-        player_font = pygame.font.Font(None, 900)
+        # Font (size 900 as in original), loaded from disk only once
+        player_font = getattr(self, '_fallback_font', None)
+        if player_font is None:
+            player_font = self._fallback_font = pygame.font.Font(None, 900)
         display_char = target_letter  # default
 
         if mode == "clcase":
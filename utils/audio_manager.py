@@ -1,8 +1,9 @@
 import pygame
 import os
+import atexit
 import threading
 import tempfile
-import time
+from collections import OrderedDict
 from typing import Dict, Optional, List
 from concurrent.futures import ThreadPoolExecutor
 import logging
@@ -23,6 +24,11 @@ except ImportError:
     GTTS_AVAILABLE = False
     print("Warning: gTTS not available. Online TTS disabled.")
 
+# One process-wide worker pool shared by every AudioManager, so creating a
+# manager per level doesn't spin up (and tear down) its own threads
+_SHARED_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="audio")
+atexit.register(_SHARED_EXECUTOR.shutdown, wait=False)
+
 
 class AudioManager:
     """
@@ -30,21 +36,28 @@ class AudioManager:
     Supports both offline (pyttsx3) and online (gTTS) text-to-speech engines.
     """
     
+    # Settings a caller can change at runtime that reset() puts back
+    _RESETTABLE_SETTINGS = (
+        "enabled", "degraded_mode", "degradation_reason",
+        "tts_method", "language", "volume",
+    )
+    
     def __init__(self, cache_limit: int = 50, max_workers: int = 2):
         """
         Initialize the AudioManager.
         
         Args:
             cache_limit (int): Maximum number of cached audio files
-            max_workers (int): Maximum number of worker threads for async TTS
+            max_workers (int): Kept for compatibility; all managers share one
+                two-thread worker pool
         """
         self.mixer_initialized = False
-        self.sound_cache: Dict[str, pygame.mixer.Sound] = {}
-        self.cache_access_times: Dict[str, float] = {}
+        # Decoded sounds in least- to most-recently-used order
+        self.sound_cache: "OrderedDict[str, pygame.mixer.Sound]" = OrderedDict()
         self.cache_limit = cache_limit
         self.tts_engine = None
         self.temp_dir = tempfile.mkdtemp(prefix="ss6_audio_")
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.executor = _SHARED_EXECUTOR
         self._shutdown_requested = False
         
         # Audio settings with degradation tracking
@@ -62,6 +75,10 @@ class AudioManager:
         
         # Initialize pygame mixer and TTS engine
         self.initialize()
+        
+        # Settings as initialize() left them (it may fall back to online TTS or
+        # silent mode); reset() restores these
+        self._initial_settings = {name: getattr(self, name) for name in self._RESETTABLE_SETTINGS}
     
     def initialize(self) -> bool:
         """
@@ -241,19 +258,16 @@ class AudioManager:
             
             # Check cache first
             with self._cache_lock:
-                if cache_key in self.sound_cache:
+                sound = self._get_cached(cache_key)
+                if sound is not None:
                     try:
-                        sound = self.sound_cache[cache_key]
                         sound.set_volume(self.volume)
                         sound.play()
-                        self.cache_access_times[cache_key] = time.time()
                         return True
                     except Exception as e:
                         print(f"AudioManager: Failed to play cached sound: {e}")
                         # Remove corrupted cache entry
                         del self.sound_cache[cache_key]
-                        if cache_key in self.cache_access_times:
-                            del self.cache_access_times[cache_key]
             
             # Generate and play new audio
             if blocking:
@@ -363,28 +377,24 @@ class AudioManager:
             print(f"AudioManager: Online TTS failed for '{text}': {e}")
         return None
     
+    def _get_cached(self, cache_key: str) -> Optional[pygame.mixer.Sound]:
+        """Look up a cached sound and mark it most recently used (lock held by caller)."""
+        sound = self.sound_cache.get(cache_key)
+        if sound is not None:
+            self.sound_cache.move_to_end(cache_key)
+        return sound
+    
     def _add_to_cache(self, cache_key: str, sound: pygame.mixer.Sound):
-        """Add sound to cache with automatic cleanup."""
-        # Clean cache if at limit
-        if len(self.sound_cache) >= self.cache_limit:
-            self._cleanup_old_sounds()
-        
+        """Add sound to cache, evicting least recently used sounds over the limit."""
         self.sound_cache[cache_key] = sound
-        self.cache_access_times[cache_key] = time.time()
-    
-    def _cleanup_old_sounds(self):
-        """Remove least recently used sounds from cache."""
-        if not self.cache_access_times:
-            return
-            
-        # Remove oldest 25% of cached sounds
-        items_to_remove = max(1, len(self.cache_access_times) // 4)
-        sorted_items = sorted(self.cache_access_times.items(), key=lambda x: x[1])
+        self.sound_cache.move_to_end(cache_key)
         
-        for cache_key, _ in sorted_items[:items_to_remove]:
-            if cache_key in self.sound_cache:
-                del self.sound_cache[cache_key]
-            del self.cache_access_times[cache_key]
+        while len(self.sound_cache) > self.cache_limit:
+            _, evicted = self.sound_cache.popitem(last=False)
+            try:
+                evicted.stop()
+            except Exception:
+                pass  # Sound already released by the mixer
     
     def preload_sounds(self, texts: List[str], language: str = None) -> int:
         """
@@ -429,6 +439,10 @@ class AudioManager:
             cache_key (str): Cache key for the sound
         """
         try:
+            # The worker pool is shared, so tasks can outlive this manager
+            if self._shutdown_requested:
+                return
+                
             sound = self._generate_audio(text, language)
             if sound:
                 # Use pygame's threadsafe event system to add to cache
@@ -470,7 +484,17 @@ class AudioManager:
         """Clear all cached sounds."""
         with self._cache_lock:
             self.sound_cache.clear()
-            self.cache_access_times.clear()
+    
+    def reset(self):
+        """Drop cached sounds and restore the settings initialize() left.
+
+        Unlike cleanup() the mixer and TTS engine stay initialised, so the
+        manager can be reused (e.g. shared across a test session).
+        """
+        self.clear_cache()
+        self.set_speech_rate(150)
+        for name, value in self._initial_settings.items():
+            setattr(self, name, value)
     
     def cleanup(self):
         """Clean up resources with proper error handling."""
@@ -488,13 +512,6 @@ class AudioManager:
                 finally:
                     self.tts_engine = None
             
-            # Shutdown thread pool gracefully
-            try:
-                self._shutdown_requested = True
-                self.executor.shutdown(wait=False, cancel_futures=True)
-            except Exception as e:
-                print(f"AudioManager: Error shutting down thread pool: {e}")
-            
             # Clean up temp directory
             try:
                 import shutil
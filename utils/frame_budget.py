@@ -0,0 +1,78 @@
+import pygame
+
+# psutil is optional; without it pacing always sleeps between frames
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+class FrameBudget:
+    """
+    Single frame-pacing control point shared by the main loop and the levels.
+    
+    Frames are paced with Clock.tick, which sleeps out idle frame time.
+    Only when a battery reports mains power and the display is not vsynced
+    does it switch to Clock.tick_busy_loop, which spins instead of sleeping
+    and so lands closer to the target frame time. Machines without a
+    battery (desktops) keep sleeping rather than pinning a core.
+    """
+    
+    def __init__(self, busy_wait=None):
+        """
+        Initialize the frame budget.
+        
+        Args:
+            busy_wait (bool): Force busy-wait pacing on or off; None detects it
+                from the power state and vsync on the first tick
+        """
+        self.clock = pygame.time.Clock()
+        self.busy_wait = busy_wait
+        self.last_frame_ms = 0
+        
+    @staticmethod
+    def _on_mains_power() -> bool:
+        """Check whether a battery reports the machine as plugged in."""
+        if psutil is None:
+            return False
+        try:
+            battery = psutil.sensors_battery()
+        except Exception:
+            return False
+        return battery is not None and bool(battery.power_plugged)
+        
+    @staticmethod
+    def _display_vsynced() -> bool:
+        """Check whether the display presents frames with vsync."""
+        # Only pygame-ce exposes is_vsync; the game never requests vsync otherwise
+        is_vsync = getattr(pygame.display, "is_vsync", None)
+        if is_vsync is None or pygame.display.get_surface() is None:
+            return False
+        try:
+            return bool(is_vsync())
+        except pygame.error:
+            return False
+        
+    def tick(self, fps: int = 60) -> int:
+        """
+        Wait out the rest of the frame budget for the given frame rate.
+        
+        Returns:
+            int: Milliseconds since the previous tick
+        """
+        if self.busy_wait is None:
+            self.busy_wait = self._on_mains_power() and not self._display_vsynced()
+            
+        if self.busy_wait:
+            self.last_frame_ms = self.clock.tick_busy_loop(fps)
+        else:
+            self.last_frame_ms = self.clock.tick(fps)
+        return self.last_frame_ms
+        
+    def get_fps(self) -> float:
+        """Get the average frame rate over the last few ticks."""
+        return self.clock.get_fps()
+
+
+# Shared instance so every loop paces against the same clock
+frame_budget = FrameBudget()
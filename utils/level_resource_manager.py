@@ -46,6 +46,12 @@ class LevelResourceManager:
         self.audio_manager: Optional[AudioManager] = None
         self.particle_manager: Optional[ParticleManager] = None
         self.sound_effects_manager: Optional[SoundEffectsManager] = None
+        # Set by initialize(lazy=True): audio managers still to be built on first use
+        self._audio_pending = False
+        self._effects_pending = False
+        # Game-wide audio managers injected by reset(); reused, never cleaned up here
+        self._shared_audio_manager: Optional[AudioManager] = None
+        self._shared_sound_effects_manager: Optional[SoundEffectsManager] = None
         
         # Performance tracking
         self.creation_time = time.time()
@@ -56,23 +62,37 @@ class LevelResourceManager:
             "cleanup_calls": 0
         }
         
-    def initialize(self) -> bool:
+    def initialize(self, lazy: bool = False) -> bool:
         """
         Initialize all level resources.
         
+        Audio managers injected through reset() are reused as-is; only the
+        missing ones are built here.
+        
+        Args:
+            lazy (bool): Defer building the AudioManager (TTS engine) and the
+                SoundEffectsManager (sound synthesis) until a sound is first
+                played, for callers that may never play one
+        
         Returns:
             bool: True if initialization successful
         """
         try:
             # Initialize audio manager
-            self.audio_manager = AudioManager(cache_limit=self.max_effects["sounds"])
+            self.audio_manager = self._shared_audio_manager
+            self._audio_pending = lazy and self.audio_manager is None
+            if self.audio_manager is None and not lazy:
+                self.audio_manager = AudioManager(cache_limit=self.max_effects["sounds"])
             
             # Initialize particle manager with level-specific limits
             self.particle_manager = ParticleManager(max_particles=self.max_effects["particles"])
             self.particle_manager.set_culling_distance(self.width)
             
             # Initialize sound effects manager
-            self.sound_effects_manager = SoundEffectsManager()
+            self.sound_effects_manager = self._shared_sound_effects_manager
+            self._effects_pending = lazy and self.sound_effects_manager is None
+            if self.sound_effects_manager is None and not lazy:
+                self.sound_effects_manager = SoundEffectsManager()
             
             self.initialized = True
             print(f"LevelResourceManager: Initialized for level '{self.level_id}'")
@@ -82,6 +102,28 @@ class LevelResourceManager:
             print(f"LevelResourceManager: Failed to initialize level '{self.level_id}': {e}")
             return False
     
+    def _ensure_audio_manager(self) -> Optional[AudioManager]:
+        """Build the AudioManager deferred by initialize(lazy=True); None if it fails."""
+        if self._audio_pending:
+            self._audio_pending = False
+            try:
+                self.audio_manager = AudioManager(cache_limit=self.max_effects["sounds"])
+            except Exception as e:
+                print(f"LevelResourceManager: Audio unavailable - continuing silently: {e}")
+                self.audio_manager = None
+        return self.audio_manager
+    
+    def _ensure_sound_effects_manager(self) -> Optional[SoundEffectsManager]:
+        """Build the SoundEffectsManager deferred by initialize(lazy=True); None if it fails."""
+        if self._effects_pending:
+            self._effects_pending = False
+            try:
+                self.sound_effects_manager = SoundEffectsManager()
+            except Exception as e:
+                print(f"LevelResourceManager: Sound effects unavailable - continuing silently: {e}")
+                self.sound_effects_manager = None
+        return self.sound_effects_manager
+    
     def create_explosion(self, x: int, y: int, color=None, max_radius: int = 270, duration: int = 30) -> bool:
         """
         Create an explosion effect with level-specific management.
@@ -184,7 +226,7 @@ class LevelResourceManager:
             print(f"[DEBUG] LevelResourceManager not initialized")
             return False
             
-        if not self.audio_manager:
+        if not self._ensure_audio_manager():
             print(f"[DEBUG] AudioManager not available - continuing silently")
             return True  # Graceful degradation: continue without sound
             
@@ -212,7 +254,7 @@ class LevelResourceManager:
         if not self.initialized:
             return True  # Graceful degradation: continue without sound
             
-        if not self.sound_effects_manager:
+        if not self._ensure_sound_effects_manager():
             print("[DEBUG] SoundEffectsManager not available - continuing silently")
             return True  # Graceful degradation: don't break gameplay
         
@@ -237,7 +279,10 @@ class LevelResourceManager:
         Returns:
             int: Number of sounds successfully preloaded
         """
-        if not self.initialized or not self.audio_manager:
+        if not self.initialized:
+            return 0
+            
+        if not self._ensure_audio_manager():
             return 0
             
         return self.audio_manager.preload_sounds(targets, language)
@@ -255,13 +300,13 @@ class LevelResourceManager:
             duration (int): Particle lifetime in frames
             
         Returns:
-            Particle object or None
+            Particle slot index or None
         """
         if not self.initialized or not self.particle_manager:
             return None
             
         particle = self.particle_manager.create_particle(x, y, color, size, dx, dy, duration)
-        if particle:
+        if particle is not None:
             self.resource_stats["particles_created"] += 1
         return particle
     
@@ -270,28 +315,20 @@ class LevelResourceManager:
         if not self.initialized:
             return
             
-        # Update explosions
-        explosions_to_remove = []
+        # Update explosions, then drop expired ones in a single pass
         for explosion in self.explosions:
             explosion["duration"] -= 1
             explosion["radius"] += (explosion["max_radius"] - explosion["radius"]) * 0.1
-            
-            if explosion["duration"] <= 0:
-                explosions_to_remove.append(explosion)
         
-        for explosion in explosions_to_remove:
-            self.explosions.remove(explosion)
+        if self.explosions:
+            self.explosions = [exp for exp in self.explosions if exp["duration"] > 0]
         
-        # Update lasers
-        lasers_to_remove = []
+        # Update lasers, then drop expired ones in a single pass
         for laser in self.lasers:
             laser["duration"] -= 1
-            
-            if laser["duration"] <= 0:
-                lasers_to_remove.append(laser)
         
-        for laser in lasers_to_remove:
-            self.lasers.remove(laser)
+        if self.lasers:
+            self.lasers = [laser for laser in self.lasers if laser["duration"] > 0]
         
         # Update particles
         if self.particle_manager:
@@ -398,19 +435,23 @@ class LevelResourceManager:
         self.lasers.clear()
         self.active_sounds.clear()
         
-        # Clean up managers
+        # Clean up managers; shared ones belong to the game and are only dropped
         if self.audio_manager:
-            self.audio_manager.cleanup()
+            if self.audio_manager is not self._shared_audio_manager:
+                self.audio_manager.cleanup()
             self.audio_manager = None
             
         if self.particle_manager:
-            # Particle manager cleanup
-            self.particle_manager.particles.clear()
+            # Particle manager cleanup (returns particles to its pool)
+            self.particle_manager.cleanup()
             self.particle_manager = None
             
         if self.sound_effects_manager:
-            self.sound_effects_manager.cleanup()
+            if self.sound_effects_manager is not self._shared_sound_effects_manager:
+                self.sound_effects_manager.cleanup()
             self.sound_effects_manager = None
+        self._audio_pending = False
+        self._effects_pending = False
         
         self.initialized = False
         
@@ -419,6 +460,24 @@ class LevelResourceManager:
         print(f"LevelResourceManager: Cleaned up level '{self.level_id}' after {elapsed_time:.1f}s")
         print(f"  Stats: {self.resource_stats}")
     
+    def reset(self, audio_manager: Optional[AudioManager] = None,
+              sound_effects_manager: Optional[SoundEffectsManager] = None):
+        """
+        Release current resources and reset stats so a pooled instance can be reused.
+        
+        Args:
+            audio_manager (AudioManager): Shared manager for initialize() to reuse
+                instead of building its own (None builds one)
+            sound_effects_manager (SoundEffectsManager): Shared manager for
+                initialize() to reuse instead of building its own (None builds one)
+        """
+        self.cleanup()
+        self._shared_audio_manager = audio_manager
+        self._shared_sound_effects_manager = sound_effects_manager
+        self.creation_time = time.time()
+        for key in self.resource_stats:
+            self.resource_stats[key] = 0
+    
     def get_resource_stats(self) -> Dict[str, Any]:
         """Get current resource usage statistics."""
         return {
@@ -1,164 +1,161 @@
 import pygame
 import random
 import math
+import numpy as np
 
 class ParticleManager:
-    """Manages particle effects with object pooling for performance."""
-    
+    """
+    Manages particle effects with object pooling for performance.
+
+    Particle fields are stored as parallel NumPy arrays (one slot per pooled
+    particle) so the per-frame update runs as a handful of vector operations
+    instead of a Python loop over particle dicts.
+    """
+
     def __init__(self, max_particles=100):
         self.max_particles = max_particles
-        self.particles = []
-        self.particle_pool = []
         self.culling_distance = 1920  # Default culling distance
-        
-        # Pre-create particle pool for object reuse
-        for _ in range(max_particles):
-            self.particle_pool.append({
-                "x": 0, "y": 0, "color": (0, 0, 0), "size": 0,
-                "dx": 0, "dy": 0, "duration": 0, "start_duration": 0,
-                "active": False
-            })
-    
+
+        # Pre-allocate particle storage for slot reuse
+        self.x = np.zeros(max_particles, dtype=np.float32)
+        self.y = np.zeros(max_particles, dtype=np.float32)
+        self.dx = np.zeros(max_particles, dtype=np.float32)
+        self.dy = np.zeros(max_particles, dtype=np.float32)
+        self.size = np.zeros(max_particles, dtype=np.float32)
+        self.duration = np.zeros(max_particles, dtype=np.int32)
+        self.start_duration = np.zeros(max_particles, dtype=np.int32)
+        self.color = np.zeros((max_particles, 3), dtype=np.uint8)
+        self.active = np.zeros(max_particles, dtype=bool)
+
+        # Free-list of inactive slots so spawning doesn't scan the pool
+        self._free = list(range(max_particles - 1, -1, -1))
+
+    @property
+    def particles(self):
+        """Slot indices of the currently active particles."""
+        return np.flatnonzero(self.active).tolist()
+
     def set_culling_distance(self, distance):
         """Set the distance at which to cull offscreen particles."""
         self.culling_distance = distance
-    
+
     def get_particle(self):
-        """Get a particle from the pool."""
-        for particle in self.particle_pool:
-            if not particle["active"]:
-                particle["active"] = True
-                return particle
-        return None  # Pool exhausted
-    
+        """Get a free particle slot from the pool."""
+        if not self._free:
+            return None  # Pool exhausted
+        slot = self._free.pop()
+        self.active[slot] = True
+        return slot
+
     def release_particle(self, particle):
-        """Return a particle to the pool."""
-        if particle in self.particles:
-            self.particles.remove(particle)
-        particle["active"] = False
-    
+        """Return a particle slot to the pool."""
+        if self.active[particle]:
+            self.active[particle] = False
+            self._free.append(particle)
+
     def create_particle(self, x, y, color, size, dx, dy, duration):
-        """Create a new particle effect."""
-        if len(self.particles) >= self.max_particles:
+        """Create a new particle effect and return its slot (or None)."""
+        if not self._free and self.max_particles:
             # Remove oldest particle if at limit
-            oldest = min(self.particles, key=lambda p: p["duration"])
-            self.release_particle(oldest)
-        
-        particle = self.get_particle()
-        if particle:
-            particle.update({
-                "x": x, "y": y, "color": color, "size": size,
-                "dx": dx, "dy": dy, "duration": duration,
-                "start_duration": duration, "active": True
-            })
-            self.particles.append(particle)
-            return particle
-        return None
-    
+            self.release_particle(self._oldest_particle())
+
+        slot = self.get_particle()
+        if slot is not None:
+            self.x[slot] = x
+            self.y[slot] = y
+            self.color[slot] = color[:3]
+            self.size[slot] = size
+            self.dx[slot] = dx
+            self.dy[slot] = dy
+            self.duration[slot] = duration
+            self.start_duration[slot] = duration
+        return slot
+
+    def _oldest_particle(self):
+        """Slot of the active particle with the least duration remaining."""
+        remaining = np.where(self.active, self.duration, np.iinfo(np.int32).max)
+        return int(remaining.argmin())
+
     def update(self):
-        """Update all active particles with optimized batch processing."""
-        if not self.particles:
+        """Update all active particles with vectorized batch processing."""
+        if len(self._free) == self.max_particles:
             return
-            
-        # Use list comprehension for better performance
-        active_particles = []
-        
-        for particle in self.particles:
-            if not particle["active"]:
-                continue
-                
-            # Update position and duration in one pass
-            particle["x"] += particle["dx"]
-            particle["y"] += particle["dy"]
-            particle["duration"] -= 1
-            
-            # Early exit checks for performance
-            if particle["duration"] <= 0:
-                particle["active"] = False
-                continue
-            
-            # Optimized culling check with single bounds test
-            if not (-self.culling_distance <= particle["x"] <= self.culling_distance * 2 and
-                    -self.culling_distance <= particle["y"] <= self.culling_distance * 2):
-                particle["active"] = False
-                continue
-                
-            active_particles.append(particle)
-        
-        # Batch update particles list
-        self.particles = active_particles
-        
-        # Return deactivated particles to pool in batch
-        for particle in self.particle_pool:
-            if not particle["active"] and particle not in self.particles:
-                continue  # Already returned to pool
-    
+
+        # Inactive slots are advanced too; their values are overwritten on spawn
+        self.x += self.dx
+        self.y += self.dy
+        self.duration -= 1
+
+        # Cull expired and far-offscreen particles with one bounds test
+        cd = self.culling_distance
+        alive = (self.active & (self.duration > 0) &
+                 (self.x >= -cd) & (self.x <= cd * 2) &
+                 (self.y >= -cd) & (self.y <= cd * 2))
+
+        # Return deactivated slots to the free-list in batch
+        expired = np.flatnonzero(self.active & ~alive)
+        if expired.size:
+            self._free.extend(expired.tolist())
+        self.active = alive
+
     def draw(self, screen, offset_x=0, offset_y=0):
         """Draw all active particles with optimized rendering."""
-        if not self.particles:
+        slots = np.flatnonzero(self.active)
+        if not slots.size:
             return
-            
+
         # Pre-calculate common values
         screen_rect = screen.get_rect()
-        
-        for particle in self.particles:
-            if not particle["active"]:
-                continue
-            
-            # Early culling for screen bounds
-            draw_x = int(particle["x"] + offset_x)
-            draw_y = int(particle["y"] + offset_y)
-            size = int(particle["size"])
-            
-            # Skip particles outside screen bounds plus margin
-            if (draw_x + size < screen_rect.left - 50 or 
-                draw_x - size > screen_rect.right + 50 or
-                draw_y + size < screen_rect.top - 50 or 
-                draw_y - size > screen_rect.bottom + 50):
-                continue
-                
-            # Calculate alpha based on remaining duration (optimized)
-            alpha = 255
-            if particle["start_duration"] > 0:
-                alpha_ratio = particle["duration"] / particle["start_duration"]
-                alpha = max(50, min(255, int(255 * alpha_ratio)))  # Minimum alpha for visibility
-            
+        draw_xs = (self.x[slots] + offset_x).astype(np.int32)
+        draw_ys = (self.y[slots] + offset_y).astype(np.int32)
+        sizes = self.size[slots].astype(np.int32)
+
+        # Skip particles outside screen bounds plus margin
+        visible = ((draw_xs + sizes >= screen_rect.left - 50) &
+                   (draw_xs - sizes <= screen_rect.right + 50) &
+                   (draw_ys + sizes >= screen_rect.top - 50) &
+                   (draw_ys - sizes <= screen_rect.bottom + 50))
+        if not visible.any():
+            return
+        slots = slots[visible]
+
+        # Calculate alpha based on remaining duration (minimum alpha for visibility)
+        start = self.start_duration[slots]
+        ratio = self.duration[slots] / np.maximum(start, 1)
+        alphas = np.where(start > 0, np.clip((255 * ratio).astype(np.int32), 50, 255), 255)
+
+        draw_circle = pygame.draw.circle
+        for draw_x, draw_y, size, color, alpha in zip(
+                draw_xs[visible].tolist(), draw_ys[visible].tolist(), sizes[visible].tolist(),
+                self.color[slots].tolist(), alphas.tolist()):
             # Use direct drawing for better performance on small particles
             if size <= 2:
-                # Small particles - direct pixel drawing
-                color = particle["color"][:3]  # Remove alpha if present
-                pygame.draw.circle(screen, color, (draw_x, draw_y), size)
+                draw_circle(screen, color, (draw_x, draw_y), size)
             else:
                 # Larger particles - use surface with alpha
-                color_with_alpha = (*particle["color"][:3], alpha)
                 particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surface, color_with_alpha, (size, size), size)
+                draw_circle(particle_surface, (*color, alpha), (size, size), size)
                 screen.blit(particle_surface, (draw_x - size, draw_y - size))
-    
+
     def get_active_count(self) -> int:
         """Get the number of currently active particles."""
-        return len(self.particles)
-    
+        return self.max_particles - len(self._free)
+
     def set_adaptive_quality(self, target_fps: float = 60.0, current_fps: float = 60.0):
         """Adjust particle quality based on performance."""
         if current_fps < target_fps * 0.8:  # If FPS drops below 80% of target
             # Reduce particle count by removing oldest particles
-            particles_to_remove = min(10, len(self.particles) // 4)
+            particles_to_remove = min(10, self.get_active_count() // 4)
             for i in range(particles_to_remove):
-                if self.particles:
-                    oldest_particle = min(self.particles, key=lambda p: p["duration"])
-                    self.release_particle(oldest_particle)
-    
+                self.release_particle(self._oldest_particle())
+
     def cleanup(self):
         """Clean up all particles and reset the system."""
         try:
-            # Deactivate all particles
-            for particle in self.particles:
-                particle["active"] = False
-            
-            # Clear particle list
-            self.particles.clear()
-            
+            # Deactivate all particles and hand every slot back to the free-list
+            self.active[:] = False
+            self._free = list(range(self.max_particles - 1, -1, -1))
+
             print("ParticleManager: Cleanup completed")
         except Exception as e:
-            print(f"ParticleManager: Error during cleanup: {e}") 
\ No newline at end of file
+            print(f"ParticleManager: Error during cleanup: {e}")
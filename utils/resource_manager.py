@@ -19,38 +19,61 @@ class ResourceManager:
         self.center_font = None  # Font for center target (size 900)
         self.falling_font = None  # Font for falling objects (size 240)
         
+        # Result of initialize_game_resources, reused until the display mode changes
+        self._resources = None
+        
     def set_display_mode(self, mode):
         """Set the current display mode."""
+        if mode != self.display_mode:
+            self._resources = None  # Fonts depend on the display mode
         self.display_mode = mode
         
     def initialize_game_resources(self):
-        """Initialize fonts and other resources based on display mode."""
+        """
+        Initialize fonts and other resources based on display mode.
+        
+        Fonts and caches are only built once per display mode; later calls
+        return the same resources dict.
+        """
+        if self._resources is not None:
+            return self._resources
+            
         # Get font sizes for current display mode
         font_sizes = FONT_SIZES[self.display_mode]["regular"]
         large_font_size = FONT_SIZES[self.display_mode]["large"]
         
+        # Each Font(None, size) re-reads and parses the bundled font file, so
+        # load every distinct size once and share it between roles
+        loaded_fonts = {}
+        
+        def load_font(size):
+            font = loaded_fonts.get(size)
+            if font is None:
+                font = loaded_fonts[size] = pygame.font.Font(None, size)
+            return font
+        
         # Initialize fonts
         self.fonts = [
-            pygame.font.Font(None, font_sizes),
-            pygame.font.Font(None, int(font_sizes * 1.5)),
-            pygame.font.Font(None, int(font_sizes * 2)),
-            pygame.font.Font(None, int(font_sizes * 2.5)),
-            pygame.font.Font(None, int(font_sizes * 3))
+            load_font(font_sizes),
+            load_font(int(font_sizes * 1.5)),
+            load_font(int(font_sizes * 2)),
+            load_font(int(font_sizes * 2.5)),
+            load_font(int(font_sizes * 3))
         ]
         
-        self.large_font = pygame.font.Font(None, large_font_size)
-        self.small_font = pygame.font.Font(None, font_sizes)
-        self.target_font = pygame.font.Font(None, int(font_sizes * 8))  # Large font for targets (doubled from 4 to 8)
-        self.title_font = pygame.font.Font(None, int(font_sizes * 8))   # Very large for titles
+        self.large_font = load_font(large_font_size)
+        self.small_font = load_font(font_sizes)
+        self.target_font = load_font(int(font_sizes * 8))  # Large font for targets (doubled from 4 to 8)
+        self.title_font = load_font(int(font_sizes * 8))   # Very large for titles
         
         # Initialize performance-critical fonts
-        self.center_font = pygame.font.Font(None, 900)  # Center target font
-        self.falling_font = pygame.font.Font(None, 240)  # Falling objects font
+        self.center_font = load_font(900)  # Center target font
+        self.falling_font = load_font(240)  # Falling objects font
         
         # Pre-cache commonly used text surfaces
         self._initialize_font_caches()
         
-        return {
+        self._resources = {
             'fonts': self.fonts,
             'large_font': self.large_font,
             'small_font': self.small_font,
@@ -59,6 +82,7 @@ class ResourceManager:
             'center_font': self.center_font,
             'falling_font': self.falling_font
         }
+        return self._resources
         
     def _initialize_font_caches(self):
         """Pre-render commonly used text surfaces for performance."""
@@ -79,7 +103,7 @@ class ResourceManager:
     def _cache_center_targets(self):
         """Pre-render center target text surfaces."""
         # Colors for center targets (flame colors for text modes)
-        center_colors = FLAME_COLORS + [BLACK]  # Include black for shapes mode
+        center_colors = FLAME_COLORS + (BLACK,)  # Include black for shapes mode
         
         # Cache all sequences for center targets
         for mode, sequence in SEQUENCES.items():
@@ -141,11 +165,19 @@ class ResourceManager:
         return surface
         
     def get_falling_object_surface(self, mode, item_value, color):
-        """Get cached falling object surface or render if not cached."""
+        """
+        Get cached falling object surface or render if not cached.
+        
+        Returns None if the falling font has not been initialized yet.
+        """
         cache_key = (mode, item_value, color)
         
-        if cache_key in self.falling_object_cache:
-            return self.falling_object_cache[cache_key]
+        surface = self.falling_object_cache.get(cache_key)
+        if surface is not None:
+            return surface
+        
+        if self.falling_font is None:
+            return None
         
         # Fallback: render on demand and cache
         display_char = item_value
@@ -160,6 +192,7 @@ class ResourceManager:
         """Clear all font caches to free memory."""
         self.center_target_cache.clear()
         self.falling_object_cache.clear()
+        self._resources = None  # Force a rebuild on next initialize_game_resources
         
     def get_cache_stats(self):
         """Get statistics about cache usage."""
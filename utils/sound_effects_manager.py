@@ -232,6 +232,13 @@ class SoundEffectsManager:
         """
         return len(self.fart_sounds)
     
+    def reset(self) -> None:
+        """Restore rotation, volume and enabled state; the generated sounds are kept."""
+        with self._sound_lock:
+            self.sound_rotation = 0
+            self.volume = 0.7
+            self.enabled = bool(self.fart_sounds)
+    
     def cleanup(self) -> None:
         """Clean up resources used by the sound effects manager."""
         try:
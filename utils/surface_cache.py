@@ -0,0 +1,22 @@
+import functools
+import pygame
+
+
+@functools.lru_cache(maxsize=256)
+def make_circle_surf(color_rgb: tuple, radius: int) -> pygame.Surface:
+    """
+    Get a shared SRCALPHA surface holding a filled circle.
+    
+    Surfaces are cached by (color, radius), so repeat draws of the same circle
+    only cost a blit. The returned surface is shared: blit it, don't draw on it.
+    
+    Args:
+        color_rgb (tuple): RGB or RGBA color of the circle
+        radius (int): Circle radius in pixels
+        
+    Returns:
+        pygame.Surface: A (2 * radius) square surface with the circle centered
+    """
+    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, color_rgb, (radius, radius), radius)
+    return surf